@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Executa os benchmarks de desempenho e compara com uma baseline.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/executar_benchmarks.py                  # mede e compara
+    python benchmarks/executar_benchmarks.py --salvar-baseline
+    python benchmarks/executar_benchmarks.py --grupo micro --limite 0.2
+
+Os resultados vão para JSON (--saida). Se a baseline existir, cada
+benchmark é comparado pelo menor tempo entre as repetições; o script
+termina com código 1 quando algum fica mais lento que baseline * (1 + limite).
+"""
+import argparse
+import os
+import sys
+
+import medicao
+import micro
+import macro
+
+PASTA_BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+ARQUIVO_RESULTADOS = os.path.join(PASTA_BENCHMARKS, 'resultados', 'ultimo.json')
+ARQUIVO_BASELINE = os.path.join(PASTA_BENCHMARKS, 'resultados', 'baseline.json')
+# Aumento relativo de tempo tolerado antes de acusar regressão (0.10 = 10%)
+LIMITE_REGRESSAO = 0.10
+
+GRUPOS = {'micro': micro.BENCHMARKS, 'macro': macro.BENCHMARKS}
+
+
+def executar(grupos, repeticoes, filtro=None):
+    """Mede os benchmarks dos grupos e retorna {nome: estatísticas}"""
+    resultados = {}
+    for grupo in grupos:
+        for nome, (preparar, numero) in GRUPOS[grupo].items():
+            if filtro and filtro not in nome:
+                continue
+            resultados[nome] = medicao.medir(preparar, repeticoes, numero)
+            print(f"⏱️  {nome:<36} {medicao.formatar_tempo(resultados[nome]['segundos_min']):>12}")
+    return resultados
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de desempenho do Drone")
+    parser.add_argument('--grupo', choices=sorted(GRUPOS), action='append',
+                        help="grupo a executar (padrão: todos; pode repetir)")
+    parser.add_argument('--filtro', help="executa só benchmarks cujo nome contém o texto")
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--saida', default=ARQUIVO_RESULTADOS)
+    parser.add_argument('--baseline', default=ARQUIVO_BASELINE)
+    parser.add_argument('--limite', type=float, default=LIMITE_REGRESSAO,
+                        help="aumento relativo tolerado (0.10 = 10%%)")
+    parser.add_argument('--salvar-baseline', action='store_true',
+                        help="grava os resultados também como nova baseline")
+    args = parser.parse_args(argumentos)
+
+    print("📏 Benchmarks de desempenho")
+    print("=" * 50)
+    resultados = executar(args.grupo or sorted(GRUPOS), args.repeticoes, args.filtro)
+    dados = {'metadados': medicao.metadados(), 'resultados': resultados}
+    medicao.salvar_json(args.saida, dados)
+    print(f"✅ Resultados salvos em: {args.saida}")
+
+    if args.salvar_baseline:
+        medicao.salvar_json(args.baseline, dados)
+        print(f"✅ Baseline salva em: {args.baseline}")
+        return 0
+
+    baseline = medicao.carregar_json(args.baseline)
+    if baseline is None:
+        print(f"ℹ️  Sem baseline em {args.baseline} (use --salvar-baseline)")
+        return 0
+
+    print(f"\n📊 Comparação com a baseline ({baseline['metadados']['data']}), "
+          f"limite +{args.limite * 100:.0f}%")
+    comparacao = medicao.comparar(resultados, baseline['resultados'], args.limite)
+    for item in comparacao:
+        marca = '❌' if item['regressao'] else '✅'
+        print(f"   {marca} {item['nome']:<36} {medicao.formatar_tempo(item['atual']):>12} "
+              f"vs {medicao.formatar_tempo(item['baseline']):>12} ({item['razao']:.2f}x)")
+
+    regressoes = [item['nome'] for item in comparacao if item['regressao']]
+    if regressoes:
+        print(f"\n❌ {len(regressoes)} benchmark(s) acima do limite: {', '.join(regressoes)}")
+        return 1
+    print("\n✅ Nenhuma regressão acima do limite")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""Macro-benchmarks: simulação, avaliação e execução do algoritmo genético
+na instância de referência (data/coordenadas.csv)"""
+import random
+
+from medicao import coordenadas_benchmark
+
+from src.models.drone import Drone
+from src.models.vento import GerenciadorVento
+from src.models.geometria import MatrizGeometria
+from src.models.individuo import Individuo
+from src.models.populacao import Populacao
+from src.algorithms.genetico import AlgoritmoGenetico
+
+# Parâmetros fixos para que as medições sejam comparáveis entre commits
+SEMENTE = 42
+TAMANHO_POPULACAO = 30
+GERACOES_GA = 10
+
+
+def _rota_embaralhada(coordenadas):
+    """Rota completa (Unibrasil nas pontas, 375 pontos) em ordem aleatória fixa"""
+    unibrasil, resto = coordenadas[0], list(coordenadas[1:])
+    random.Random(SEMENTE).shuffle(resto)
+    return [unibrasil] + resto + [unibrasil]
+
+
+def simular_rota():
+    coordenadas = coordenadas_benchmark()
+    individuo = Individuo(_rota_embaralhada(coordenadas), Drone(), GerenciadorVento(),
+                          MatrizGeometria(coordenadas))
+    return individuo.simular_rota
+
+
+def avaliar_populacao():
+    coordenadas = coordenadas_benchmark()
+    random.seed(SEMENTE)
+    populacao = Populacao(list(coordenadas), Drone(), GerenciadorVento(), TAMANHO_POPULACAO,
+                          MatrizGeometria(coordenadas))
+    return populacao.avaliar_populacao
+
+
+def algoritmo_genetico():
+    coordenadas = coordenadas_benchmark()
+    geometria = MatrizGeometria(coordenadas)
+    drone, vento = Drone(), GerenciadorVento()
+
+    def executar():
+        # Semente antes da população: a execução inteira é reprodutível
+        random.seed(SEMENTE)
+        populacao = Populacao(list(coordenadas), drone, vento, TAMANHO_POPULACAO, geometria)
+        algoritmo = AlgoritmoGenetico(populacao)
+        for _ in range(GERACOES_GA):
+            algoritmo.executar_geracao()
+    return executar
+
+
+# nome -> (preparar, chamadas por repetição)
+BENCHMARKS = {
+    'macro.simular_rota': (simular_rota, 1),
+    'macro.avaliar_populacao': (avaliar_populacao, 1),
+    'macro.algoritmo_genetico': (algoritmo_genetico, 1),
+}
@@ -0,0 +1,125 @@
+"""Medição de tempo e comparação com baseline dos benchmarks"""
+import contextlib
+import functools
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+# Adicionar o diretório raiz do projeto ao Python path
+RAIZ_PROJETO = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(RAIZ_PROJETO)
+
+from src.utils.file_handlers import carregar_coordenadas
+
+# Instância de referência dos macro-benchmarks (Unibrasil + 373 pontos)
+ARQUIVO_COORDENADAS = os.path.join(RAIZ_PROJETO, 'data', 'coordenadas.csv')
+
+
+def medir(preparar, repeticoes=5, numero=1):
+    """
+    Mede o tempo de uma operação.
+
+    preparar: função sem argumentos que monta o estado (fora da medição) e
+    retorna a operação a medir (também sem argumentos). É chamada uma vez por
+    repetição, para que caches de uma repetição não favoreçam a seguinte.
+    numero: chamadas da operação por repetição (micro-benchmarks).
+
+    Retorna os tempos por chamada em segundos (mínimo, mediana e máximo das
+    repetições).
+    """
+    tempos = []
+    for _ in range(repeticoes):
+        operacao = preparar()
+        if numero > 1:
+            # Aquecimento fora da medição (caches e alocações da primeira chamada)
+            operacao()
+        inicio = time.perf_counter()
+        for _ in range(numero):
+            operacao()
+        tempos.append((time.perf_counter() - inicio) / numero)
+    return {
+        'segundos_min': min(tempos),
+        'segundos_mediana': statistics.median(tempos),
+        'segundos_max': max(tempos),
+        'repeticoes': repeticoes,
+        'numero': numero
+    }
+
+
+def metadados():
+    """Ambiente da execução (para saber se duas medições são comparáveis)"""
+    return {
+        'data': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'plataforma': platform.platform(),
+        'processador': platform.processor() or platform.machine(),
+        'cpus': os.cpu_count()
+    }
+
+
+def comparar(resultados, baseline, limite):
+    """
+    Compara os resultados com a baseline pelo tempo mínimo de cada benchmark.
+
+    limite: aumento relativo tolerado (0.10 = até 10% mais lento).
+    Retorna uma lista de dicts (nome, atual, baseline, razao, regressao)
+    apenas para os benchmarks presentes nos dois lados.
+    """
+    comparacao = []
+    for nome, atual in resultados.items():
+        anterior = baseline.get(nome)
+        if anterior is None:
+            continue
+        razao = atual['segundos_min'] / anterior['segundos_min']
+        comparacao.append({
+            'nome': nome,
+            'atual': atual['segundos_min'],
+            'baseline': anterior['segundos_min'],
+            'razao': razao,
+            'regressao': razao > 1.0 + limite
+        })
+    return comparacao
+
+
+def salvar_json(caminho, dados):
+    """Grava os resultados em JSON (cria a pasta se necessário)"""
+    pasta = os.path.dirname(caminho)
+    if pasta:
+        os.makedirs(pasta, exist_ok=True)
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(dados, f, indent=2, ensure_ascii=False)
+
+
+def carregar_json(caminho):
+    """Lê um arquivo de resultados (ou None se não existir)"""
+    if not os.path.exists(caminho):
+        return None
+    with open(caminho, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def formatar_tempo(segundos):
+    """Tempo com a unidade mais legível (s, ms ou µs)"""
+    if segundos >= 1:
+        return f"{segundos:.3f} s"
+    if segundos >= 1e-3:
+        return f"{segundos * 1e3:.3f} ms"
+    return f"{segundos * 1e6:.2f} µs"
+
+
+@functools.lru_cache(maxsize=None)
+def coordenadas_benchmark(caminho=ARQUIVO_COORDENADAS):
+    """Coordenadas da instância de referência (carregadas uma vez, sem prints)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        coordenadas = carregar_coordenadas(caminho)
+    if not coordenadas:
+        raise FileNotFoundError(f"Instância de benchmark não encontrada: {caminho}")
+    return tuple(coordenadas)
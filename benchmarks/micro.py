@@ -0,0 +1,55 @@
+"""Micro-benchmarks: funções chamadas a cada trecho da simulação"""
+from medicao import coordenadas_benchmark
+
+from src.models.drone import Drone
+from src.models.vento import GerenciadorVento
+from src.models.geometria import MatrizGeometria
+from src.models.individuo import Individuo
+from src.models.trecho import Trecho
+from src.utils.calculos import distancia_haversine
+from src.config.settings import Config
+
+
+def _par_de_pontos():
+    coordenadas = coordenadas_benchmark()
+    return coordenadas[0], coordenadas[1]
+
+
+def distancia_haversine_par():
+    origem, destino = _par_de_pontos()
+    return lambda: distancia_haversine(origem.latitude, origem.longitude,
+                                       destino.latitude, destino.longitude)
+
+
+def construcao_trecho():
+    origem, destino = _par_de_pontos()
+    return lambda: Trecho(origem, destino, 60, 1, Config.HORA_INICIO, 17, 'ENE')
+
+
+def construcao_trecho_geometria():
+    origem, destino = _par_de_pontos()
+    geometria = MatrizGeometria([origem, destino])
+    return lambda: Trecho(origem, destino, 60, 1, Config.HORA_INICIO, 17, 'ENE', geometria)
+
+
+def escolher_velocidade_otima():
+    origem, destino = _par_de_pontos()
+    individuo = Individuo([origem, destino, origem], Drone(), GerenciadorVento())
+    bateria = individuo.drone.calcular_autonomia(36)
+    return lambda: individuo._escolher_velocidade_otima(origem, destino, bateria, 1,
+                                                        Config.HORA_INICIO)
+
+
+def get_vento():
+    vento = GerenciadorVento()
+    return lambda: vento.get_vento(3, 13 * 60 + 30)
+
+
+# nome -> (preparar, chamadas por repetição)
+BENCHMARKS = {
+    'micro.distancia_haversine': (distancia_haversine_par, 20000),
+    'micro.trecho': (construcao_trecho, 5000),
+    'micro.trecho_geometria': (construcao_trecho_geometria, 5000),
+    'micro.escolher_velocidade_otima': (escolher_velocidade_otima, 5000),
+    'micro.get_vento': (get_vento, 20000),
+}
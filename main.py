@@ -1,12 +1,110 @@
 import os
+import time
 from src.utils.file_handlers import carregar_coordenadas
 from src.models.drone import Drone
 from src.models.vento import GerenciadorVento
+from src.models.geometria import MatrizGeometria
 from src.models.populacao import Populacao
-from src.algorithms.genetico import AlgoritmoGenetico
+from src.models.tempos_voo import TabelaTemposVoo
+from src.algorithms.genetico import AlgoritmoGenetico, DESCRICOES_PARADA, PARADA_GERACOES
+from src.algorithms.busca_local import BuscaLocal
+from src.algorithms.plano_voo import OtimizadorPlanoVoo
+from src.algorithms.ilhas import ModeloIlhas
 from src.simulation.simulador import Simulador
 from src.simulation.csv_exporter import CSVExporter
 
+def executar_populacao_unica(coordenadas, drone, vento, tamanho_populacao, numero_geracoes,
+                             num_workers, motor, operador_crossover, modo_busca_local,
+                             tempo_busca_local, precomputar_tempos=False, arquivo_perfil=None,
+                             rastrear_memoria=False, arquivo_checkpoint=None,
+                             intervalo_checkpoint=0, retomar_checkpoint=False,
+                             criterios_parada=None, elite_plano_voo=0, tempo_plano_voo=2.0):
+    """Executa o algoritmo genético com uma única população neste processo
+
+    criterios_parada: dict opcional com os critérios de AlgoritmoGenetico.otimizar
+    (geracoes_sem_melhoria, fitness_alvo, tempo_maximo, max_avaliacoes).
+    elite_plano_voo: quantos dos melhores recebem o plano de voo por
+    programação dinâmica a cada geração (0 = desligado).
+    """
+    # Distâncias/direções entre todos os pares calculadas uma única vez
+    geometria = MatrizGeometria(coordenadas)
+    tabela_tempos = None
+    if precomputar_tempos:
+        tabela_tempos = TabelaTemposVoo(geometria, drone, vento)
+        stats_tabela = tabela_tempos.get_estatisticas()
+        print(f"⏱️  Tabela de tempos de voo ({stats_tabela['modo']}): "
+              f"{stats_tabela['pontos']} pontos x {stats_tabela['bandas']} bandas x "
+              f"{stats_tabela['velocidades']} velocidades | "
+              f"{stats_tabela['bytes_usados'] / 1024 ** 2:.1f} MB | "
+              f"{stats_tabela['tempo_construcao']:.2f}s")
+    populacao = Populacao(coordenadas, drone, vento, tamanho_populacao, geometria,
+                          workers=num_workers, motor=motor, tabela_tempos=tabela_tempos)
+    busca_local = None
+    if modo_busca_local:
+        busca_local = BuscaLocal(populacao, modo_busca_local,
+                                 tempo_maximo_geracao=tempo_busca_local)
+    plano_voo = None
+    if elite_plano_voo:
+        plano_voo = OtimizadorPlanoVoo(populacao, elite_plano_voo,
+                                       tempo_maximo_geracao=tempo_plano_voo)
+    algoritmo = AlgoritmoGenetico(populacao, operador_crossover=operador_crossover,
+                                  busca_local=busca_local, arquivo_perfil=arquivo_perfil,
+                                  rastrear_memoria=rastrear_memoria, plano_voo=plano_voo)
+    
+    if retomar_checkpoint and arquivo_checkpoint and os.path.exists(arquivo_checkpoint):
+        algoritmo.restaurar_checkpoint(arquivo_checkpoint)
+        print(f"♻️  Retomando do checkpoint {arquivo_checkpoint} "
+              f"(geração {algoritmo.geracao}/{numero_geracoes})")
+    
+    if num_workers > 1:
+        print(f"⚙️  Avaliação paralela com {num_workers} processos")
+    if busca_local:
+        print(f"🔧 Busca local ({modo_busca_local}) até {tempo_busca_local:.1f}s por geração")
+    if plano_voo:
+        print(f"🗺️  Plano de voo (programação dinâmica) para os {elite_plano_voo} melhores, "
+              f"até {tempo_plano_voo:.1f}s por geração")
+    
+    print("=" * 50)
+    
+    def ao_final_geracao(stats):
+        # Mostrar progresso a cada geração
+        print(f"📍 Geração {algoritmo.geracao:02d}/{numero_geracoes} - "
+              f"Melhor: {stats['melhor_fitness']:.2f} | "
+              f"Médio: {stats['fitness_medio']:.2f} | "
+              f"Viáveis: {stats['taxa_viabilidade']:.1f}% | "
+              f"Memo: {stats['memo_taxa_acerto']:.0f}% | "
+              f"{stats['tempo_geracao']:.2f}s ({stats['avaliacoes_por_segundo']:.0f} aval/s)")
+        
+        # Checkpoint periódico para retomar execuções interrompidas
+        if arquivo_checkpoint and intervalo_checkpoint and algoritmo.geracao % intervalo_checkpoint == 0:
+            algoritmo.salvar_checkpoint(arquivo_checkpoint)
+    
+    # Executar algoritmo genético até o primeiro critério de parada
+    try:
+        melhor = algoritmo.otimizar(numero_geracoes, ao_final_geracao=ao_final_geracao,
+                                    **(criterios_parada or {}))
+        if arquivo_checkpoint and intervalo_checkpoint:
+            algoritmo.salvar_checkpoint(arquivo_checkpoint)
+    finally:
+        populacao.encerrar()
+        algoritmo.encerrar_diagnostico()
+    
+    print(f"🛑 Parada: {DESCRICOES_PARADA[algoritmo.motivo_parada]} "
+          f"(geração {algoritmo.geracao})")
+    
+    if algoritmo.geracao_perfilada is not None:
+        print(f"🔬 Perfil da geração mais lenta ({algoritmo.geracao_perfilada}) "
+              f"salvo em: {arquivo_perfil}")
+    
+    # Na avaliação paralela os trechos não voltam dos processos; a simulação
+    # é determinística, então basta refazê-la para o melhor indivíduo
+    if not melhor.num_trechos:
+        melhor.simular_rota()
+        melhor.calcular_fitness()
+    
+    return (melhor, algoritmo.get_historico(), populacao.cache_trechos.get_estatisticas(),
+            algoritmo.motivo_parada)
+
 def main():
     print("🚀 UNIBRASIL SURVEYOR - Etapa 2")
     print("=" * 50)
@@ -15,6 +113,59 @@ def main():
     ARQUIVO_COORDENADAS = "data/coordenadas.csv"
     TAMANHO_POPULACAO = 30
     NUMERO_GERACOES = 50
+    # Processos para avaliar a população (1 = serial; >1 ativa o pool de processos)
+    NUM_WORKERS = 1
+    # Motor de simulação: 'individuo' (uma rota por vez) ou 'lote' (população em conjunto)
+    MOTOR_SIMULACAO = 'individuo'
+    # Operador de crossover: 'ox', 'pmx' ou 'cx' (no modelo de ilhas, None
+    # alterna os operadores entre as ilhas)
+    OPERADOR_CROSSOVER = 'ox'
+    # Busca local memética (2-opt/Or-opt): None (desligada), 'elite' ou 'todos'
+    MODO_BUSCA_LOCAL = None
+    # Tempo máximo (s) de busca local por geração
+    TEMPO_BUSCA_LOCAL = 2.0
+    # Plano de voo ótimo (velocidades e recargas por programação dinâmica)
+    # para os N melhores de cada geração (0 = desligado) e seu tempo máximo (s)
+    ELITE_PLANO_VOO = 0
+    TEMPO_PLANO_VOO = 2.0
+    # Pré-calcular todos os tempos de voo [par, banda de vento, velocidade]
+    # antes da otimização (população única; limite em TABELA_TEMPOS_MAX_BYTES)
+    PRECOMPUTAR_TEMPOS_VOO = False
+    # Detalhe do log da trajetória final (Simulador.NIVEL_RESUMO, NIVEL_DIAS ou
+    # NIVEL_TRECHOS) e se cada linha também vai para o console
+    NIVEL_LOG_SIMULACAO = Simulador.NIVEL_TRECHOS
+    LOG_SIMULACAO_CONSOLE = True
+    # Diagnóstico opcional: dump do cProfile da geração mais lenta (None =
+    # desligado) e pico/maiores alocações de memória por geração (tracemalloc)
+    ARQUIVO_PERFIL = None  # ex.: "data/output/perfil_geracao.prof"
+    RASTREAR_MEMORIA = False
+    # Checkpoint da população única a cada INTERVALO_CHECKPOINT gerações (0 =
+    # desligado); RETOMAR_CHECKPOINT continua a partir do arquivo, se existir
+    ARQUIVO_CHECKPOINT = "data/output/checkpoint_ga.npz"
+    INTERVALO_CHECKPOINT = 5
+    RETOMAR_CHECKPOINT = False
+    # Critérios de parada antecipada da população única (None = desligado):
+    # gerações sem melhoria, fitness alvo, tempo (s) e simulações de rota.
+    # O modelo de ilhas não os suporta (as ilhas migram sincronizadas)
+    GERACOES_SEM_MELHORIA = None
+    FITNESS_ALVO = None
+    TEMPO_MAXIMO = None
+    MAX_AVALIACOES = None
+    # Modelo de ilhas: populações em processos separados (1 = população única);
+    # cada ilha usa as mesmas opções de avaliação, busca local e plano de voo
+    NUM_ILHAS = 1
+    # A cada quantas gerações as ilhas trocam suas melhores rotas, e quantas
+    INTERVALO_MIGRACAO = 5
+    NUM_MIGRANTES = 2
+    
+    criterios_parada = {'geracoes_sem_melhoria': GERACOES_SEM_MELHORIA,
+                        'fitness_alvo': FITNESS_ALVO, 'tempo_maximo': TEMPO_MAXIMO,
+                        'max_avaliacoes': MAX_AVALIACOES}
+    if NUM_ILHAS > 1:
+        ativos = [nome for nome, valor in criterios_parada.items() if valor is not None]
+        if ativos:
+            raise ValueError(f"Critérios de parada {', '.join(ativos)} não são suportados "
+                             f"no modelo de ilhas (NUM_ILHAS = {NUM_ILHAS})")
     
     # Carregar dados
     coordenadas = carregar_coordenadas(ARQUIVO_COORDENADAS)
@@ -24,30 +175,40 @@ def main():
     # Inicializar componentes
     drone = Drone()
     vento = GerenciadorVento()
-    populacao = Populacao(coordenadas, drone, vento, TAMANHO_POPULACAO)
-    algoritmo = AlgoritmoGenetico(populacao)
-    simulador = Simulador(drone, vento)
+    # O log é gravado em log_simulacao.txt durante a própria simulação
+    simulador = Simulador(drone, vento, NIVEL_LOG_SIMULACAO, LOG_SIMULACAO_CONSOLE,
+                          arquivo_log="log_simulacao.txt")
     exporter = CSVExporter()
     
     print(f"🧬 Executando algoritmo genético...")
     print(f"📊 {NUMERO_GERACOES} gerações | {TAMANHO_POPULACAO} indivíduos por geração")
     print(f"🌬️  Sistema de vento carregado")
     
-    print("=" * 50)
-    
-    # Executar algoritmo genético
-    for geracao in range(NUMERO_GERACOES):
-        stats = algoritmo.executar_geracao()
+    if NUM_ILHAS > 1:
+        # Cada ilha roda em um processo com semente própria
+        parametros = {'modo_busca_local': MODO_BUSCA_LOCAL, 'tempo_busca_local': TEMPO_BUSCA_LOCAL,
+                      'workers': NUM_WORKERS, 'motor': MOTOR_SIMULACAO,
+                      'precomputar_tempos': PRECOMPUTAR_TEMPOS_VOO,
+                      'elite_plano_voo': ELITE_PLANO_VOO, 'tempo_plano_voo': TEMPO_PLANO_VOO}
+        if OPERADOR_CROSSOVER is not None:
+            parametros['operador_crossover'] = OPERADOR_CROSSOVER
+        modelo = ModeloIlhas(coordenadas, NUM_ILHAS, TAMANHO_POPULACAO, INTERVALO_MIGRACAO,
+                             NUM_MIGRANTES, [dict(parametros) for _ in range(NUM_ILHAS)])
+        print(f"🏝️  {NUM_ILHAS} ilhas | migração de {NUM_MIGRANTES} rotas a cada "
+              f"{INTERVALO_MIGRACAO} gerações")
+        print("=" * 50)
         
-        # Mostrar progresso a cada geração
-        print(f"📍 Geração {geracao + 1:02d}/{NUMERO_GERACOES} - "
-              f"Melhor: {stats['melhor_fitness']:.2f} | "
-              f"Médio: {stats['fitness_medio']:.2f} | "
-              f"Viáveis: {stats['taxa_viabilidade']:.1f}%")
-    
-    # Resultados
-    melhor = algoritmo.get_melhor_individuo()
-    historico = algoritmo.get_historico()
+        melhor, historico = modelo.executar(NUMERO_GERACOES)
+        stats_cache = modelo.estatisticas_cache
+        # Sem critérios antecipados, as ilhas sempre executam todas as gerações
+        motivo_parada = PARADA_GERACOES
+    else:
+        melhor, historico, stats_cache, motivo_parada = executar_populacao_unica(
+            coordenadas, drone, vento, TAMANHO_POPULACAO, NUMERO_GERACOES, NUM_WORKERS,
+            MOTOR_SIMULACAO, OPERADOR_CROSSOVER, MODO_BUSCA_LOCAL, TEMPO_BUSCA_LOCAL,
+            PRECOMPUTAR_TEMPOS_VOO, ARQUIVO_PERFIL, RASTREAR_MEMORIA,
+            ARQUIVO_CHECKPOINT, INTERVALO_CHECKPOINT, RETOMAR_CHECKPOINT, criterios_parada,
+            ELITE_PLANO_VOO, TEMPO_PLANO_VOO)
     
     print("\n" + "=" * 50)
     print("🎯 RESULTADOS FINAIS:")
@@ -60,6 +221,11 @@ def main():
     print(f"   • Pousos: {melhor.numero_pousos}")
     print(f"   • Viável: {'SIM' if melhor.viabilidade else 'NÃO'}")
     
+    # Efeito do cache de trechos compartilhado
+    print(f"   • Cache de trechos: {stats_cache['acertos']} acertos | "
+          f"{stats_cache['faltas']} faltas | "
+          f"{stats_cache['taxa_acerto']:.1f}% de acerto")
+    
     # Simular trajetória
     print(f"\n🔄 Simulando trajetória...")
     simulador.simular_trajetoria(melhor)
@@ -67,13 +233,24 @@ def main():
     
     # Exportar resultados
     print(f"\n💾 Exportando resultados...")
+    inicio_exportacao = time.perf_counter()
     exporter.exportar_rota_completa(melhor)
-    exporter.exportar_resumo(melhor, historico)
     # Exportar detalhamento de recargas (cada recarga: dia, hora, cep, taxa_bool, pouso_atrasado)
     try:
         exporter.exportar_recargas_detalhadas(melhor)
     except Exception:
         print("⚠️ Falha ao exportar recargas detalhadas")
+    # Estatísticas por geração, com tempos por fase
+    exporter.exportar_metricas_evolucao(historico)
+    exporter.exportar_resumo(melhor, historico, {
+        'Cache trechos - acertos': stats_cache['acertos'],
+        'Cache trechos - faltas': stats_cache['faltas'],
+        'Cache trechos - taxa de acerto (%)': f"{stats_cache['taxa_acerto']:.1f}",
+        'Cache trechos - entradas': stats_cache['entradas'],
+        'Cache trechos - descartes': stats_cache['descartes'],
+        'Critério de parada': DESCRICOES_PARADA[motivo_parada],
+        'Tempo exportação (s)': f"{time.perf_counter() - inicio_exportacao:.3f}"
+    })
     
     print(f"\n✅ Execução concluída com sucesso!")
 
@@ -2,6 +2,7 @@ from src.utils.file_handlers import carregar_coordenadas
 from src.models.drone import Drone
 from src.models.vento import GerenciadorVento
 from src.models.individuo import Individuo
+from src.models.eventos import SinkConsole
 from src.simulation.simulador import Simulador
 from src.config.settings import Config
 
@@ -24,7 +25,7 @@ def main():
     else:
         rota_coordenadas = coords
 
-    ind = Individuo(rota_coordenadas, drone, vento)
+    ind = Individuo(rota_coordenadas, drone, vento, sink_eventos=SinkConsole())
     ind.simular_rota()
 
     print('\n=== Resumo da Rota (ordem do CSV) ===')
@@ -0,0 +1,52 @@
+import os
+import time
+from src.utils.file_handlers import carregar_coordenadas
+from src.models.geometria import MatrizGeometria
+from src.algorithms.experimentos import ExecutorExperimentos, gerar_grade
+from src.algorithms.genetico import DESCRICOES_PARADA
+from src.simulation.csv_exporter import CSVExporter
+
+
+def main():
+    print("🧪 UNIBRASIL SURVEYOR - Experimentos")
+    print("=" * 50)
+
+    # Grade de configurações: todas as combinações são executadas
+    ALPHAS = [1.0, 3.0]
+    BETAS = [0.0, 1.0, 100.0]
+    TAMANHOS_POPULACAO = [30]
+    SEMENTES = [1, 2, 3]
+    NUMERO_GERACOES = 50
+    # Critérios de parada antecipada (ver AlgoritmoGenetico.otimizar)
+    CRITERIOS_PARADA = {'geracoes_sem_melhoria': None, 'tempo_maximo': None}
+    # Processos em paralelo (uma configuração por vez em cada processo)
+    NUM_WORKERS = os.cpu_count() or 1
+
+    coordenadas = carregar_coordenadas("data/coordenadas.csv")
+    if not coordenadas:
+        return
+
+    # Geometria calculada uma única vez e compartilhada com os processos
+    geometria = MatrizGeometria(coordenadas)
+    configuracoes = gerar_grade(ALPHAS, BETAS, TAMANHOS_POPULACAO, SEMENTES)
+    executor = ExecutorExperimentos(coordenadas, geometria, NUMERO_GERACOES, NUM_WORKERS,
+                                    CRITERIOS_PARADA)
+    print(f"📊 {len(configuracoes)} configurações | {NUMERO_GERACOES} gerações | "
+          f"{NUM_WORKERS} processos")
+    print("=" * 50)
+
+    inicio = time.perf_counter()
+    resultados = executor.executar(configuracoes)
+    for r in resultados:
+        print(f"   • alpha={r['alpha']:<6} beta={r['beta']:<6} pop={r['tamanho_populacao']:<4} "
+              f"semente={r['semente']:<4} Fitness: {r['fitness']:.2f} | Dias: {r['dias']} | "
+              f"Pousos: {r['pousos']} | Taxas: {r['pousos_taxa_tarde']} | "
+              f"{r['tempo_execucao']:.1f}s ({DESCRICOES_PARADA[r['motivo_parada']]})")
+    print(f"\n⏱️  Tempo total: {time.perf_counter() - inicio:.1f}s")
+
+    print(f"\n💾 Exportando comparação...")
+    CSVExporter().exportar_comparacao_experimentos(resultados)
+
+
+if __name__ == "__main__":
+    main()
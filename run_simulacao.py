@@ -2,6 +2,7 @@ from src.models.drone import Drone
 from src.models.vento import GerenciadorVento
 from src.models.coordenada import Coordenada
 from src.models.individuo import Individuo
+from src.models.eventos import SinkConsole
 from src.simulation.simulador import Simulador
 from src.config.settings import Config
 
@@ -15,7 +16,7 @@ coordenadas = [unibrasil, ponto, unibrasil]
 crane = Drone()
 gerenciador = GerenciadorVento()
 
-ind = Individuo(coordenadas, crane, gerenciador)
+ind = Individuo(coordenadas, crane, gerenciador, sink_eventos=SinkConsole())
 
 # Simular rota (gera trechos)
 ind.simular_rota()
@@ -34,7 +35,7 @@ from src.config.settings import Config as Cfg
 Cfg.HEURISTICA_ALPHA = 1.0
 Cfg.HEURISTICA_BETA = 1000.0
 
-ind2 = Individuo(coordenadas, crane, gerenciador)
+ind2 = Individuo(coordenadas, crane, gerenciador, sink_eventos=SinkConsole())
 ind2.simular_rota()
 for t in ind2.trechos:
     print(f"Trecho: {t.origem.cep}->{t.destino.cep} Vel={t.velocidade} Vel_efetiva={t.velocidade_efetiva:.2f}km/h Tempo={t.tempo_voo_segundos}s")
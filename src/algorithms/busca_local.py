@@ -0,0 +1,175 @@
+import time
+import numpy as np
+
+
+class BuscaLocal:
+    """
+    Etapa de melhoria local (memética) com movimentos 2-opt e Or-opt.
+
+    Os candidatos são gerados a partir de listas de vizinhos mais próximos de
+    cada ponto e filtrados pela variação de distância, calculada em O(1) com a
+    MatrizGeometria. Só os movimentos que encurtam a rota são confirmados com
+    a simulação completa (vento, horários, recargas); o movimento é aceito se
+    o fitness não piorar e a distância diminuir. Cada geração tem um limite de
+    tempo para a busca não atrasar o laço principal do algoritmo genético.
+    """
+
+    # Tamanhos de segmento testados no Or-opt
+    TAMANHOS_OR_OPT = (1, 2, 3)
+    # Variação mínima de distância (km) para considerar um candidato
+    EPS_DISTANCIA = 1e-9
+
+    def __init__(self, populacao, modo='elite', num_vizinhos=8, tempo_maximo_geracao=2.0):
+        """
+        modo: 'elite' (só o melhor indivíduo) ou 'todos' (cada indivíduo da
+        geração, do melhor para o pior, enquanto houver tempo)
+        """
+        if modo not in ('elite', 'todos'):
+            raise ValueError(f"Modo de busca local {modo} inválido")
+
+        self.populacao = populacao
+        self.modo = modo
+        self.tempo_maximo_geracao = tempo_maximo_geracao
+
+        geometria = populacao.geometria
+        self.unibrasil = geometria.indice_unibrasil
+        # Listas Python para acesso O(1) barato dentro dos laços
+        self._dist = geometria.distancias.tolist()
+        vizinhos = np.argsort(geometria.distancias, axis=1)[:, 1:num_vizinhos + 1]
+        self._vizinhos = vizinhos.tolist()
+
+        self.ultima_execucao = self._estatisticas_vazias()
+
+    def _estatisticas_vazias(self):
+        return {'busca_local_tentativas': 0, 'busca_local_melhorias': 0,
+                'busca_local_tempo': 0.0}
+
+    def aplicar(self, populacao=None):
+        """Aplica a busca local à população já avaliada (respeitando o prazo)"""
+        populacao = populacao or self.populacao
+        inicio = time.perf_counter()
+        prazo = inicio + self.tempo_maximo_geracao
+        self.ultima_execucao = self._estatisticas_vazias()
+
+        if self.modo == 'elite':
+            alvos = [populacao.melhor_individuo] if populacao.melhor_individuo else []
+        else:
+            alvos = sorted(populacao.individuos, key=lambda ind: ind.fitness)
+
+        for individuo in alvos:
+            if time.perf_counter() >= prazo:
+                break
+            if not individuo.viabilidade:
+                continue
+            melhorado = self.melhorar(individuo, prazo)
+            if melhorado is not individuo:
+                posicao = next(k for k, ind in enumerate(populacao.individuos) if ind is individuo)
+                populacao.individuos[posicao] = melhorado
+
+        populacao.atualizar_melhores()
+        self.ultima_execucao['busca_local_tempo'] = time.perf_counter() - inicio
+        return self.ultima_execucao
+
+    def melhorar(self, individuo, prazo):
+        """Aplica 2-opt e Or-opt (primeira melhoria) até não haver ganho ou o prazo acabar"""
+        atual = individuo
+        melhorou = True
+        while melhorou and time.perf_counter() < prazo:
+            melhorou = False
+            for gerar in (self._candidatos_2opt, self._candidatos_or_opt):
+                for genoma in gerar(atual.genoma.tolist()):
+                    if time.perf_counter() >= prazo:
+                        return atual
+                    candidato = self._confirmar(atual, genoma)
+                    if candidato is not None:
+                        atual = candidato
+                        melhorou = True
+                        break
+                if melhorou:
+                    break
+        return atual
+
+    def _confirmar(self, atual, genoma):
+        """Simula a rota candidata; retorna o novo indivíduo se for aceito"""
+        self.ultima_execucao['busca_local_tentativas'] += 1
+
+        genoma = np.array(genoma, dtype=atual.genoma.dtype)
+        # 2-opt/Or-opt preservam a permutação de uma rota já válida
+        candidato = self.populacao.individuo_de_genoma(genoma, validar=False)
+        # Retomar a simulação a partir da primeira posição alterada
+        diferentes = np.flatnonzero(genoma != atual.genoma)
+        if len(diferentes):
+            candidato.definir_origem_delta(atual, int(diferentes[0]))
+        candidato.simular_rota()
+        candidato.calcular_fitness()
+
+        if (candidato.viabilidade and candidato.fitness <= atual.fitness and
+                candidato.distancia_total < atual.distancia_total):
+            self.ultima_execucao['busca_local_melhorias'] += 1
+            return candidato
+        return None
+
+    def _candidatos_2opt(self, rota):
+        """Gera rotas 2-opt com ganho de distância (inverte rota[lo+1..hi])"""
+        dist = self._dist
+        posicao = {gene: k for k, gene in enumerate(rota[:-1])}
+        ultimo = len(rota) - 1
+
+        for i in range(ultimo):
+            a = rota[i]
+            for c in self._vizinhos[a]:
+                if c == self.unibrasil:
+                    continue
+                j = posicao[c]
+                lo, hi = (i, j) if i < j else (j, i)
+                if hi - lo < 2 or hi >= ultimo:
+                    continue
+                # Novas arestas (rota[lo], rota[hi]) e (rota[lo+1], rota[hi+1])
+                delta = (dist[rota[lo]][rota[hi]] + dist[rota[lo + 1]][rota[hi + 1]] -
+                         dist[rota[lo]][rota[lo + 1]] - dist[rota[hi]][rota[hi + 1]])
+                if delta < -self.EPS_DISTANCIA:
+                    yield rota[:lo + 1] + rota[hi:lo:-1] + rota[hi + 1:]
+
+    def _candidatos_or_opt(self, rota):
+        """Gera rotas Or-opt com ganho de distância (move segmentos de 1 a 3 pontos)"""
+        dist = self._dist
+        posicao = {gene: k for k, gene in enumerate(rota[:-1])}
+        ultimo = len(rota) - 1
+
+        for tamanho in self.TAMANHOS_OR_OPT:
+            for i in range(1, ultimo - tamanho + 1):
+                s, e = rota[i], rota[i + tamanho - 1]
+                anterior, proximo = rota[i - 1], rota[i + tamanho]
+                ganho_remocao = dist[anterior][s] + dist[e][proximo] - dist[anterior][proximo]
+
+                for c in self._vizinhos[s]:
+                    if c == self.unibrasil:
+                        continue
+                    j = posicao[c]
+                    if i - 1 <= j <= i + tamanho - 1:
+                        continue
+                    # Inserir depois de c (c, s..e, sucessor de c)
+                    sucessor = rota[j + 1]
+                    if not (i <= j + 1 <= i + tamanho - 1):
+                        custo = dist[c][s] + dist[e][sucessor] - dist[c][sucessor]
+                        if custo - ganho_remocao < -self.EPS_DISTANCIA:
+                            yield self._mover_segmento(rota, i, tamanho, c, depois=True)
+                    # Inserir antes de c, invertido (predecessor de c, e..s, c)
+                    predecessor = rota[j - 1]
+                    if not (i <= j - 1 <= i + tamanho - 1):
+                        custo = dist[predecessor][e] + dist[s][c] - dist[predecessor][c]
+                        if custo - ganho_remocao < -self.EPS_DISTANCIA:
+                            yield self._mover_segmento(rota, i, tamanho, c, depois=False)
+
+    def _mover_segmento(self, rota, i, tamanho, c, depois):
+        """Remove rota[i:i+tamanho] e reinsere junto ao ponto c"""
+        segmento = rota[i:i + tamanho]
+        nova = rota[:i] + rota[i + tamanho:]
+        k = nova.index(c)
+        if depois:
+            return nova[:k + 1] + segmento + nova[k + 1:]
+        return nova[:k] + segmento[::-1] + nova[k:]
+
+    def __repr__(self):
+        return (f"BuscaLocal(modo={self.modo}, "
+                f"tempo_maximo_geracao={self.tempo_maximo_geracao}s)")
@@ -0,0 +1,122 @@
+"""Operadores de crossover para rotas representadas como permutações de índices.
+
+Todos recebem os genomas dos pais (arrays de índices com o Unibrasil fixo na
+primeira e na última posição) e devolvem o genoma do filho, sempre uma
+permutação válida do interior com as pontas preservadas. A pertinência de
+genes é controlada por máscaras booleanas/tabelas de posição, então cada
+operador é O(n).
+"""
+import random
+import numpy as np
+
+
+def _sortear_segmento(tamanho, rng):
+    """Sorteia [a, b) dentro do interior da rota (posições 1..tamanho-2)"""
+    return sorted(rng.sample(range(1, tamanho - 1), 2))
+
+
+def crossover_ox(genoma1, genoma2, rng=random):
+    """Order Crossover (OX).
+
+    O filho herda genoma1[a:b]; as demais posições (a partir de b, dando a
+    volta no interior) recebem os genes de genoma2 na ordem em que aparecem a
+    partir de b, pulando os que já vieram do segmento.
+    """
+    tamanho = len(genoma1)
+    if tamanho - 2 < 2:
+        return genoma1.copy()
+
+    a, b = _sortear_segmento(tamanho, rng)
+
+    filho = genoma1.copy()
+
+    # Máscara de genes já presentes no filho (segmento herdado de genoma1)
+    presente = np.zeros(max(genoma1.max(), genoma2.max()) + 1, dtype=bool)
+    presente[genoma1[a:b]] = True
+
+    # Genes do interior de genoma2 a partir da posição b (com volta)
+    ordem = np.roll(genoma2[1:-1], -(b - 1))
+    restantes = ordem[~presente[ordem]]
+
+    # Posições livres do filho a partir de b (com volta), sem tocar nas pontas
+    posicoes = np.r_[b:tamanho - 1, 1:a]
+    filho[posicoes] = restantes
+    return filho
+
+
+def crossover_pmx(genoma1, genoma2, rng=random):
+    """Partially Mapped Crossover (PMX).
+
+    O filho parte de genoma2 com o segmento [a, b) de genoma1; genes de
+    genoma2 deslocados pelo segmento são recolocados seguindo o mapeamento
+    entre os pais.
+    """
+    tamanho = len(genoma1)
+    if tamanho - 2 < 2:
+        return genoma1.copy()
+
+    a, b = _sortear_segmento(tamanho, rng)
+
+    filho = genoma2.copy()
+    filho[a:b] = genoma1[a:b]
+
+    no_segmento = np.zeros(max(genoma1.max(), genoma2.max()) + 1, dtype=bool)
+    no_segmento[genoma1[a:b]] = True
+
+    # Posição de cada gene em genoma2
+    posicao2 = np.empty(len(no_segmento), dtype=np.int64)
+    posicao2[genoma2] = np.arange(tamanho)
+
+    g1 = genoma1.tolist()
+    g2 = genoma2.tolist()
+    pos2 = posicao2.tolist()
+    for i in range(a, b):
+        gene = g2[i]
+        if no_segmento[gene]:
+            continue
+        # Seguir o mapeamento até cair fora do segmento
+        j = i
+        while a <= j < b:
+            j = pos2[g1[j]]
+        filho[j] = gene
+
+    return filho
+
+
+def crossover_cx(genoma1, genoma2, rng=random):
+    """Cycle Crossover (CX).
+
+    As posições do interior são particionadas em ciclos entre os pais; o
+    filho herda os ciclos alternadamente de genoma1 e genoma2, de modo que
+    cada gene mantém a posição que tinha em um dos pais.
+    """
+    tamanho = len(genoma1)
+    filho = genoma1.copy()
+
+    posicao1 = np.empty(max(genoma1.max(), genoma2.max()) + 1, dtype=np.int64)
+    posicao1[genoma1] = np.arange(tamanho)
+
+    g2 = genoma2.tolist()
+    pos1 = posicao1.tolist()
+    visitado = [False] * tamanho
+    do_pai2 = False
+    for inicio in range(1, tamanho - 1):
+        if visitado[inicio]:
+            continue
+        i = inicio
+        while not visitado[i]:
+            visitado[i] = True
+            if do_pai2:
+                filho[i] = g2[i]
+            i = pos1[g2[i]]
+        do_pai2 = not do_pai2
+
+    return filho
+
+
+# Operadores disponíveis por nome (ver AlgoritmoGenetico.operador_crossover)
+OPERADORES_CROSSOVER = {
+    'ox': crossover_ox,
+    'pmx': crossover_pmx,
+    'cx': crossover_cx,
+}
@@ -0,0 +1,105 @@
+import itertools
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from ..models.drone import Drone
+from ..models.vento import GerenciadorVento
+from ..models.populacao import Populacao
+from .genetico import AlgoritmoGenetico
+from ..config.settings import Config, snapshot_config
+
+# Estado de cada processo (montado uma única vez em _inicializar_experimentos)
+_contexto_experimentos = {}
+
+
+def gerar_grade(alphas, betas, tamanhos_populacao, sementes):
+    """Produto cartesiano dos valores: lista de configurações (dicts)"""
+    return [{'alpha': alpha, 'beta': beta, 'tamanho_populacao': tamanho, 'semente': semente}
+            for alpha, beta, tamanho, semente
+            in itertools.product(alphas, betas, tamanhos_populacao, sementes)]
+
+
+def _inicializar_experimentos(coordenadas, geometria, config, numero_geracoes, criterios_parada):
+    """Recebe coordenadas e geometria já calculadas e monta drone e vento do processo"""
+    for nome, valor in config.items():
+        setattr(Config, nome, valor)
+
+    _contexto_experimentos.update({
+        'coordenadas': coordenadas,
+        'geometria': geometria,
+        'drone': Drone(),
+        'vento': GerenciadorVento(),
+        'numero_geracoes': numero_geracoes,
+        'criterios_parada': criterios_parada
+    })
+
+
+def _executar_configuracao(configuracao):
+    """Roda o algoritmo genético para uma configuração e devolve a linha da comparação"""
+    inicio = time.perf_counter()
+    Config.HEURISTICA_ALPHA = configuracao['alpha']
+    Config.HEURISTICA_BETA = configuracao['beta']
+    random.seed(configuracao['semente'])
+
+    contexto = _contexto_experimentos
+    populacao = Populacao(contexto['coordenadas'], contexto['drone'], contexto['vento'],
+                          configuracao['tamanho_populacao'], contexto['geometria'])
+    algoritmo = AlgoritmoGenetico(populacao)
+    melhor = algoritmo.otimizar(contexto['numero_geracoes'], **contexto['criterios_parada'])
+
+    return dict(configuracao,
+                fitness=melhor.fitness,
+                viavel=melhor.viabilidade,
+                dias=melhor.dias_utilizados,
+                pousos=melhor.numero_pousos,
+                pousos_taxa_tarde=melhor.pousos_taxa_tarde,
+                custo=melhor.custo_total,
+                tempo_total=melhor.tempo_total,
+                distancia=melhor.distancia_total,
+                geracoes=algoritmo.geracao,
+                motivo_parada=algoritmo.motivo_parada,
+                tempo_execucao=time.perf_counter() - inicio)
+
+
+class ExecutorExperimentos:
+    """
+    Executa uma grade de configurações (alpha/beta da heurística de
+    velocidade, tamanho da população, semente) em um pool de processos.
+
+    As coordenadas e a MatrizGeometria são preparadas uma única vez no
+    processo principal e enviadas a cada trabalhador na inicialização; cada
+    configuração roda um AlgoritmoGenetico completo com sua própria semente,
+    então os resultados não dependem do número de processos.
+    """
+
+    def __init__(self, coordenadas, geometria, numero_geracoes, workers=1,
+                 criterios_parada=None):
+        """criterios_parada: dict opcional repassado a AlgoritmoGenetico.otimizar"""
+        self.coordenadas = coordenadas
+        self.geometria = geometria
+        self.numero_geracoes = numero_geracoes
+        self.workers = workers
+        self.criterios_parada = criterios_parada or {}
+
+    def executar(self, configuracoes):
+        """Roda as configurações e retorna uma linha (dict) por configuração, na mesma ordem"""
+        initargs = (self.coordenadas, self.geometria, snapshot_config(),
+                    self.numero_geracoes, self.criterios_parada)
+
+        if self.workers <= 1:
+            # Serial neste processo: Config é restaurado ao final
+            config_original = snapshot_config()
+            try:
+                _inicializar_experimentos(*initargs)
+                return [_executar_configuracao(c) for c in configuracoes]
+            finally:
+                for nome, valor in config_original.items():
+                    setattr(Config, nome, valor)
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_inicializar_experimentos,
+                                 initargs=initargs) as executor:
+            return list(executor.map(_executar_configuracao, configuracoes))
+
+    def __repr__(self):
+        return (f"ExecutorExperimentos({len(self.geometria)} pontos, "
+                f"{self.numero_geracoes} gerações, {self.workers} processos)")
@@ -17,7 +17,7 @@ class FitnessFunction:
             return float('inf')
         
         # Simular rota se ainda não foi simulada
-        if not individuo.trechos:
+        if not individuo.num_trechos:
             individuo.simular_rota()
         
         # Componentes do fitness
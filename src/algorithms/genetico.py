@@ -1,31 +1,387 @@
 import random
-import copy
+import time
+import cProfile
+import hashlib
+import tracemalloc
+import numpy as np
 from ..models.populacao import Populacao
 from ..models.individuo import Individuo
+from ..models.memoria_fitness import assinatura_config
+from ..utils.checkpoint import (gravar_checkpoint, ler_checkpoint,
+                                estado_rng_para_array, array_para_estado_rng)
+from .crossover import OPERADORES_CROSSOVER
+from ..config.settings import FASES_GERACAO
+
+# Quantas linhas de maior alocação (tracemalloc) guardar por geração
+TOP_ALOCACOES = 3
+# Motivos de parada de otimizar() -> descrição (resumo da execução)
+PARADA_GERACOES = 'geracoes'
+PARADA_SEM_MELHORIA = 'sem_melhoria'
+PARADA_FITNESS_ALVO = 'fitness_alvo'
+PARADA_TEMPO = 'tempo'
+PARADA_AVALIACOES = 'avaliacoes'
+DESCRICOES_PARADA = {
+    PARADA_GERACOES: 'número máximo de gerações',
+    PARADA_SEM_MELHORIA: 'gerações sem melhoria',
+    PARADA_FITNESS_ALVO: 'fitness alvo atingido',
+    PARADA_TEMPO: 'limite de tempo',
+    PARADA_AVALIACOES: 'limite de avaliações'
+}
 
 class AlgoritmoGenetico:
     """Implementa o algoritmo genético para otimização de rotas"""
     
-    def __init__(self, populacao, taxa_mutacao=0.05, taxa_crossover=0.8, elitismo=True):
+    def __init__(self, populacao, taxa_mutacao=0.05, taxa_crossover=0.8, elitismo=True,
+                 operador_crossover='ox', busca_local=None, arquivo_perfil=None,
+                 rastrear_memoria=False, plano_voo=None):
         self.populacao = populacao
         self.taxa_mutacao = taxa_mutacao
         self.taxa_crossover = taxa_crossover
         self.elitismo = elitismo
+        # Operador de crossover: nome em OPERADORES_CROSSOVER ('ox', 'pmx', 'cx')
+        # ou função (genoma1, genoma2) -> genoma do filho
+        if callable(operador_crossover):
+            self.operador_crossover = operador_crossover
+            # Operador externo: os filhos passam pela validação da rota
+            self._crossover_preserva_permutacao = False
+        elif operador_crossover in OPERADORES_CROSSOVER:
+            self.operador_crossover = OPERADORES_CROSSOVER[operador_crossover]
+            # OX/PMX/CX sempre geram permutações válidas: validação dispensada
+            self._crossover_preserva_permutacao = True
+        else:
+            raise ValueError(f"Operador de crossover {operador_crossover} inválido")
+        # Etapa memética opcional (BuscaLocal), aplicada após a avaliação
+        self.busca_local = busca_local
+        # Plano de voo por programação dinâmica para a elite (OtimizadorPlanoVoo),
+        # aplicado depois da busca local
+        self.plano_voo = plano_voo
         self.historico = []
+        # Gerações já executadas (continua a contagem ao restaurar um checkpoint)
+        self.geracao = 0
+        # Genomas da última geração avaliada, do melhor para o pior fitness
+        # (ex.: emigrantes do modelo de ilhas, sem avaliar a nova geração)
+        self.genomas_ultima_geracao = []
+        # Motivo (PARADA_*) pelo qual a última chamada de otimizar() parou
+        self.motivo_parada = None
+        # Diagnóstico opcional: arquivo_perfil recebe o dump do cProfile da
+        # geração mais lenta; rastrear_memoria liga o tracemalloc (pico e
+        # maiores alocações por geração)
+        self.arquivo_perfil = arquivo_perfil
+        self.geracao_perfilada = None
+        self._tempo_geracao_perfilada = 0.0
+        self.rastrear_memoria = rastrear_memoria
+        self._tracemalloc_iniciado = False
+        # Tempo (s) acumulado por fase na geração em andamento
+        self._tempos_fases = dict.fromkeys(FASES_GERACAO, 0.0)
     
     def executar_geracao(self):
         """Executa uma geração completa do algoritmo genético"""
+        perfil = self._iniciar_diagnostico()
+        inicio_geracao = time.perf_counter()
+        self._tempos_fases = dict.fromkeys(FASES_GERACAO, 0.0)
+        
         # Avaliar população atual
+        inicio = time.perf_counter()
         self.populacao.avaliar_populacao()
+        self._tempos_fases['avaliacao'] = time.perf_counter() - inicio
+        
+        # Melhoria local (2-opt/Or-opt) com limite de tempo por geração
+        if self.busca_local is not None:
+            inicio = time.perf_counter()
+            self.busca_local.aplicar(self.populacao)
+            self._tempos_fases['busca_local'] = time.perf_counter() - inicio
+        
+        # Velocidades e recargas ótimas para a rota dos melhores indivíduos
+        if self.plano_voo is not None:
+            inicio = time.perf_counter()
+            self.plano_voo.aplicar(self.populacao)
+            self._tempos_fases['plano_voo'] = time.perf_counter() - inicio
         
         # Registrar métricas
         self._registrar_metricas()
+        self.genomas_ultima_geracao = [ind.genoma for ind in
+                                       sorted(self.populacao.individuos, key=lambda x: x.fitness)]
         
         # Criar nova população
         nova_populacao = self._criar_nova_populacao()
         self.populacao.individuos = nova_populacao
         
-        return self.populacao.get_estatisticas()
+        # Tempos da geração completados depois da reprodução
+        desempenho = self._metricas_desempenho(time.perf_counter() - inicio_geracao)
+        desempenho.update(self._finalizar_diagnostico(perfil, desempenho['tempo_geracao']))
+        self.historico[-1].update(desempenho)
+        
+        self.geracao += 1
+        stats = self.populacao.get_estatisticas()
+        stats.update(desempenho)
+        return stats
+    
+    def otimizar(self, numero_geracoes, geracoes_sem_melhoria=None, fitness_alvo=None,
+                 tempo_maximo=None, max_avaliacoes=None, ao_final_geracao=None):
+        """
+        Executa gerações até o primeiro critério de parada e retorna o melhor
+        indivíduo encontrado (com elitismo, o melhor até o momento).
+
+        numero_geracoes: total de gerações (contando as já executadas, p.ex.
+        restauradas de um checkpoint). Critérios opcionais (None = desligado):
+        geracoes_sem_melhoria sem queda do melhor fitness, melhor fitness <=
+        fitness_alvo, tempo_maximo em segundos desde a chamada e
+        max_avaliacoes simulações no total (ver total_avaliacoes). Os critérios
+        são verificados entre gerações, então tempo e avaliações podem passar do
+        limite em até uma geração, e nunca impedem a primeira. ao_final_geracao(stats) é chamada
+        após cada geração.
+        O motivo da parada fica em self.motivo_parada.
+        """
+        prazo = None if tempo_maximo is None else time.perf_counter() + tempo_maximo
+        while True:
+            self.motivo_parada = self._verificar_parada(
+                numero_geracoes, geracoes_sem_melhoria, fitness_alvo, prazo, max_avaliacoes)
+            if self.motivo_parada is not None:
+                return self.get_melhor_individuo()
+            stats = self.executar_geracao()
+            if ao_final_geracao is not None:
+                ao_final_geracao(stats)
+    
+    def _verificar_parada(self, numero_geracoes, geracoes_sem_melhoria, fitness_alvo,
+                          prazo, max_avaliacoes):
+        """Primeiro critério de parada satisfeito (PARADA_*) ou None"""
+        if self.geracao >= numero_geracoes:
+            return PARADA_GERACOES
+        # Os demais critérios só valem depois da primeira geração, para que
+        # sempre haja um melhor indivíduo avaliado a retornar
+        if not self.historico:
+            return None
+        if fitness_alvo is not None and self.historico[-1]['melhor_fitness'] <= fitness_alvo:
+            return PARADA_FITNESS_ALVO
+        if geracoes_sem_melhoria is not None and self.geracoes_sem_melhoria() >= geracoes_sem_melhoria:
+            return PARADA_SEM_MELHORIA
+        if prazo is not None and time.perf_counter() >= prazo:
+            return PARADA_TEMPO
+        if max_avaliacoes is not None and self.total_avaliacoes() >= max_avaliacoes:
+            return PARADA_AVALIACOES
+        return None
+    
+    def geracoes_sem_melhoria(self):
+        """Gerações desde a última queda do melhor fitness no histórico"""
+        melhor = float('inf')
+        ultima_melhoria = 0
+        for geracao, metricas in enumerate(self.historico, 1):
+            if metricas['melhor_fitness'] < melhor:
+                melhor = metricas['melhor_fitness']
+                ultima_melhoria = geracao
+        return len(self.historico) - ultima_melhoria
+    
+    def total_avaliacoes(self):
+        """Simulações de rota feitas em todas as gerações do histórico: avaliação
+        da população, candidatos da busca local e rotas com plano de voo"""
+        return sum(metricas['simulacoes'] + metricas.get('busca_local_tentativas', 0) +
+                   metricas.get('plano_voo_simulacoes', 0) for metricas in self.historico)
+    
+    def _metricas_desempenho(self, tempo_geracao):
+        """Tempo por fase, tempo total e avaliações por segundo da geração"""
+        desempenho = {f'tempo_{fase}': tempo for fase, tempo in self._tempos_fases.items()}
+        desempenho['tempo_geracao'] = tempo_geracao
+        simulacoes = self.historico[-1]['simulacoes']
+        tempo_avaliacao = self._tempos_fases['avaliacao']
+        desempenho['avaliacoes_por_segundo'] = simulacoes / tempo_avaliacao if tempo_avaliacao > 0 else 0.0
+        return desempenho
+    
+    def _iniciar_diagnostico(self):
+        """Liga cProfile/tracemalloc (se pedidos) para a geração; retorna o perfil"""
+        if self.rastrear_memoria:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracemalloc_iniciado = True
+            tracemalloc.reset_peak()
+        
+        if self.arquivo_perfil is None:
+            return None
+        perfil = cProfile.Profile()
+        perfil.enable()
+        return perfil
+    
+    def _finalizar_diagnostico(self, perfil, tempo_geracao):
+        """Desliga o perfil (guardando o da geração mais lenta) e lê a memória"""
+        diagnostico = {}
+        if perfil is not None:
+            perfil.disable()
+            if tempo_geracao > self._tempo_geracao_perfilada:
+                perfil.dump_stats(self.arquivo_perfil)
+                self._tempo_geracao_perfilada = tempo_geracao
+                self.geracao_perfilada = len(self.historico)
+        
+        if self.rastrear_memoria:
+            _, pico = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                (tracemalloc.Filter(False, tracemalloc.__file__),))
+            maiores = snapshot.statistics('lineno')[:TOP_ALOCACOES]
+            diagnostico['memoria_pico_kb'] = pico / 1024
+            diagnostico['memoria_top'] = '; '.join(
+                f"{estat.traceback[0].filename}:{estat.traceback[0].lineno} "
+                f"({estat.size / 1024:.1f} KB)" for estat in maiores)
+        return diagnostico
+    
+    def encerrar_diagnostico(self):
+        """Desliga o tracemalloc, se foi ligado por este algoritmo"""
+        if self._tracemalloc_iniciado:
+            tracemalloc.stop()
+            self._tracemalloc_iniciado = False
+    
+    def _identificacao_instancia(self):
+        """Dados que precisam coincidir para um checkpoint valer nesta execução"""
+        ceps = '\n'.join(c.cep for c in self.populacao.geometria.coordenadas)
+        return {
+            'pontos': len(self.populacao.geometria),
+            'ceps': hashlib.blake2b(ceps.encode('utf-8'), digest_size=16).hexdigest(),
+            'tamanho_populacao': self.populacao.tamanho,
+            'config': repr(assinatura_config())
+        }
+    
+    def salvar_checkpoint(self, caminho):
+        """
+        Grava o estado da execução entre gerações: genomas da população (índices
+        compactos), melhor indivíduo, estado do gerador random, histórico e
+        contador de gerações, além do estado de avaliação (memória de fitness,
+        indivíduos já avaliados, pais de onde as mutações retomam a simulação e
+        planos de voo em cache). Com restaurar_checkpoint a execução continua
+        exatamente como continuaria sem a interrupção, inclusive nos contadores
+        de simulações e acertos da memória do histórico.
+        """
+        palavras_rng, gauss_rng = estado_rng_para_array(random.getstate())
+        individuos = self.populacao.individuos
+        arrays = {
+            'genomas': np.stack([ind.genoma for ind in individuos]),
+            'rng_palavras': palavras_rng,
+            'rng_gauss': gauss_rng
+        }
+        arrays.update(self._planos_para_arrays('planos', individuos))
+        arrays.update(self._estado_avaliacao_para_arrays(individuos))
+        melhor = self.populacao.melhor_individuo
+        if melhor is not None:
+            arrays['melhor_genoma'] = melhor.genoma
+            arrays.update(self._planos_para_arrays('melhor_plano', [melhor]))
+        if self.plano_voo is not None:
+            arrays.update(self.plano_voo.exportar_planos())
+        metadados = dict(self._identificacao_instancia(), geracao=self.geracao,
+                         historico=self.historico,
+                         memoria_fitness=self.populacao.memoria_fitness.exportar_entradas())
+        gravar_checkpoint(caminho, arrays, metadados)
+    
+    def restaurar_checkpoint(self, caminho):
+        """
+        Carrega um checkpoint de salvar_checkpoint nesta instância (população,
+        melhor indivíduo, gerador random, histórico, contador de gerações e
+        estado de avaliação). Indivíduos já avaliados e pais de mutações são
+        simulados de novo (a simulação é determinística). Apenas os contadores
+        de uso dos caches (acertos/faltas) recomeçam do zero.
+        ValueError se o checkpoint for de outra instância ou configuração.
+        """
+        arrays, metadados = ler_checkpoint(caminho)
+        for campo, valor in self._identificacao_instancia().items():
+            if metadados.get(campo) != valor:
+                raise ValueError(f"Checkpoint {caminho} incompatível com esta execução "
+                                 f"({campo}: {metadados.get(campo)!r} != {valor!r})")
+        
+        dtype = self.populacao.geometria.dtype_indices
+        self.populacao.individuos = [self.populacao.individuo_de_genoma(genoma.astype(dtype))
+                                     for genoma in arrays['genomas']]
+        self._aplicar_planos(arrays, 'planos', self.populacao.individuos)
+        self._aplicar_estado_avaliacao(arrays, self.populacao.individuos)
+        self.populacao.memoria_fitness.limpar()
+        self.populacao.memoria_fitness.importar_entradas(metadados['memoria_fitness'])
+        if self.plano_voo is not None:
+            self.plano_voo.importar_planos(arrays)
+        self.populacao.melhor_individuo = None
+        if 'melhor_genoma' in arrays:
+            # Simulação determinística: o melhor volta com as mesmas métricas
+            melhor = self.populacao.individuo_de_genoma(arrays['melhor_genoma'].astype(dtype))
+            self._aplicar_planos(arrays, 'melhor_plano', [melhor])
+            melhor.simular_rota()
+            melhor.calcular_fitness()
+            self.populacao.melhor_individuo = melhor
+        
+        random.setstate(array_para_estado_rng(arrays['rng_palavras'], arrays['rng_gauss']))
+        self.historico = metadados['historico']
+        self.geracao = metadados['geracao']
+    
+    @staticmethod
+    def _planos_para_arrays(prefixo, individuos):
+        """Planos de voo dos indivíduos como matrizes (velocidade -1 = sem plano)"""
+        planejados = [ind for ind in individuos if ind.plano_voo is not None]
+        if not planejados:
+            return {}
+        trechos = len(planejados[0].plano_voo[0])
+        velocidades = np.full((len(individuos), trechos), -1, dtype=np.int8)
+        recargas = np.zeros((len(individuos), trechos), dtype=bool)
+        for k, individuo in enumerate(individuos):
+            if individuo.plano_voo is not None:
+                velocidades[k], recargas[k] = individuo.plano_voo
+        return {f'{prefixo}_velocidades': velocidades, f'{prefixo}_recargas': recargas}
+    
+    @staticmethod
+    def _aplicar_planos(arrays, prefixo, individuos):
+        """Inverso de _planos_para_arrays"""
+        if f'{prefixo}_velocidades' not in arrays:
+            return
+        for individuo, velocidades, recargas in zip(individuos, arrays[f'{prefixo}_velocidades'],
+                                                     arrays[f'{prefixo}_recargas']):
+            if velocidades[0] >= 0:
+                individuo.plano_voo = (velocidades, recargas)
+    
+    @staticmethod
+    def _estado_avaliacao_para_arrays(individuos):
+        """
+        Quais indivíduos já foram avaliados (cópias do elitismo) e se guardam
+        os checkpoints de simulação (simulados neste processo, não vindos da
+        memória ou de outro motor), e de qual pai cada mutação pode retomar a
+        simulação (índice em origens_genomas, -1 = nenhum, e posição)
+        """
+        assinatura = assinatura_config()
+        origens = {}  # id do pai -> (índice, pai)
+        indices_origem = np.full(len(individuos), -1, dtype=np.int32)
+        posicoes_origem = np.zeros(len(individuos), dtype=np.int32)
+        for k, individuo in enumerate(individuos):
+            if individuo._origem_delta is None:
+                continue
+            pai, posicao = individuo._origem_delta
+            # Só pais que deixariam a simulação retomar (ver _checkpoint_de_retomada)
+            if pai._checkpoints and pai.plano_voo is None and pai.assinatura_avaliacao == assinatura:
+                indices_origem[k] = origens.setdefault(id(pai), (len(origens), pai))[0]
+                posicoes_origem[k] = posicao
+        
+        arrays = {
+            'avaliados': np.array([ind.assinatura_avaliacao == assinatura for ind in individuos]),
+            'simulados': np.array([bool(ind._checkpoints) for ind in individuos]),
+            'origem_indices': indices_origem,
+            'origem_posicoes': posicoes_origem
+        }
+        if origens:
+            arrays['origens_genomas'] = np.stack([pai.genoma for _, pai in origens.values()])
+        return arrays
+    
+    def _aplicar_estado_avaliacao(self, arrays, individuos):
+        """Inverso de _estado_avaliacao_para_arrays (re-simula o que for preciso)"""
+        for individuo, avaliado, simulado in zip(individuos, arrays['avaliados'],
+                                                  arrays['simulados']):
+            if avaliado:
+                individuo.simular_rota()
+                individuo.calcular_fitness()
+                if not simulado:
+                    # Mesmo estado de métricas vindas da memória: sem trechos/checkpoints
+                    individuo.aplicar_metricas(individuo.exportar_metricas())
+        
+        if 'origens_genomas' not in arrays:
+            return
+        dtype = self.populacao.geometria.dtype_indices
+        pais = [self.populacao.individuo_de_genoma(genoma.astype(dtype))
+                for genoma in arrays['origens_genomas']]
+        for pai in pais:
+            pai.simular_rota()
+            pai.calcular_fitness()
+        for individuo, indice, posicao in zip(individuos, arrays['origem_indices'],
+                                              arrays['origem_posicoes']):
+            if indice >= 0:
+                individuo.definir_origem_delta(pais[indice], int(posicao))
     
     def _criar_nova_populacao(self):
         """Cria nova população através de seleção, crossover e mutação"""
@@ -33,23 +389,29 @@ class AlgoritmoGenetico:
         
         # Elitismo: mantém o melhor indivíduo
         if self.elitismo and self.populacao.melhor_individuo:
-            nova_populacao.append(copy.deepcopy(self.populacao.melhor_individuo))
+            nova_populacao.append(self.populacao.melhor_individuo.clonar())
         
         # Preenche o resto da população
         while len(nova_populacao) < self.populacao.tamanho:
             # Seleção
+            inicio = time.perf_counter()
             pai1 = self._selecao_torneio()
             pai2 = self._selecao_torneio()
+            fim_selecao = time.perf_counter()
+            self._tempos_fases['selecao'] += fim_selecao - inicio
             
             # Crossover
             if random.random() < self.taxa_crossover:
-                filho = self._crossover_ox(pai1, pai2)
+                filho = self._crossover(pai1, pai2)
             else:
-                filho = copy.deepcopy(pai1)
+                filho = pai1.clonar()
+            fim_crossover = time.perf_counter()
+            self._tempos_fases['crossover'] += fim_crossover - fim_selecao
             
             # Mutação
             if random.random() < self.taxa_mutacao:
                 filho = self._mutacao_troca(filho)
+                self._tempos_fases['mutacao'] += time.perf_counter() - fim_crossover
             
             nova_populacao.append(filho)
         
@@ -63,64 +425,43 @@ class AlgoritmoGenetico:
         )
         return min(participantes, key=lambda x: x.fitness)
     
-    def _crossover_ox(self, pai1, pai2):
-        """Order Crossover (OX) para rotas"""
-        size = len(pai1.coordenadas)
-        
-        # Garantir que não mexe no Unibrasil do início e fim
-        start = 1  # Começa após o Unibrasil inicial
-        end = size - 2  # Termina antes do Unibrasil final
-        
-        if end <= start:
-            return copy.deepcopy(pai1)
-        
-        start, end = sorted(random.sample(range(start, end + 1), 2))
-        
-        # Cria filho com segmento do pai1
-        filho_coords = [None] * size
-        filho_coords[0] = pai1.coordenadas[0]  # Unibrasil inicial
-        filho_coords[-1] = pai1.coordenadas[-1]  # Unibrasil final
-        filho_coords[start:end] = pai1.coordenadas[start:end]
-        
-        # Preenche com genes do pai2
-        pos = end
-        for gene in pai2.coordenadas:
-            if gene.eh_unibrasil():
-                continue  # Pula Unibrasil (já está fixo)
-            
-            if gene not in filho_coords:
-                if pos >= size - 1:
-                    pos = 1  # Começa após Unibrasil inicial
-                
-                # Encontra próxima posição vazia
-                while filho_coords[pos] is not None and pos < size - 1:
-                    pos += 1
-                    if pos == end:  # Volta ao início se necessário
-                        pos = 1
-                
-                if pos < size - 1:  # Não mexe no Unibrasil final
-                    filho_coords[pos] = gene
-                    pos += 1
-        
-        return Individuo(filho_coords, self.populacao.drone, self.populacao.gerenciador_vento)
+    def _crossover(self, pai1, pai2):
+        """Aplica o operador de crossover configurado aos genomas dos pais"""
+        genoma_filho = self.operador_crossover(pai1.genoma, pai2.genoma)
+        pais_validos = pai1._viabilidade_rota and pai2._viabilidade_rota
+        return self.populacao.individuo_de_genoma(
+            genoma_filho, validar=not (self._crossover_preserva_permutacao and pais_validos))
     
     def _mutacao_troca(self, individuo):
         """Mutação por troca de dois pontos (exceto Unibrasil)"""
-        coords = individuo.coordenadas.copy()
+        genoma = individuo.genoma.copy()
+        unibrasil = self.populacao.geometria.indice_unibrasil
         
         # Encontrar índices que não são Unibrasil
-        indices_validos = [i for i, coord in enumerate(coords) 
-                          if not coord.eh_unibrasil() and i != 0 and i != len(coords)-1]
+        indices_validos = [i for i, gene in enumerate(genoma.tolist())
+                          if gene != unibrasil and i != 0 and i != len(genoma)-1]
+        
+        if len(indices_validos) < 2:
+            return self.populacao.individuo_de_genoma(genoma, validar=not individuo._viabilidade_rota)
         
-        if len(indices_validos) >= 2:
-            i, j = random.sample(indices_validos, 2)
-            coords[i], coords[j] = coords[j], coords[i]
+        i, j = random.sample(indices_validos, 2)
+        genoma[i], genoma[j] = genoma[j], genoma[i]
         
-        return Individuo(coords, self.populacao.drone, self.populacao.gerenciador_vento)
+        # A troca preserva a permutação: o filho só precisa de validação se o
+        # indivíduo original já era estruturalmente inválido
+        filho = self.populacao.individuo_de_genoma(genoma, validar=not individuo._viabilidade_rota)
+        # Antes da primeira posição trocada a rota é igual à original, então a
+        # simulação do filho pode retomar dos checkpoints do indivíduo original
+        filho.definir_origem_delta(individuo, min(i, j))
+        return filho
     
     def _registrar_metricas(self):
         """Registra métricas da geração atual"""
         stats = self.populacao.get_estatisticas()
+        if self.busca_local is not None:
+            stats.update(self.busca_local.ultima_execucao)
+        if self.plano_voo is not None:
+            stats.update(self.plano_voo.ultima_execucao)
         self.historico.append(stats)
     
     def get_historico(self):
@@ -0,0 +1,241 @@
+import queue
+import random
+import multiprocessing
+from ..models.drone import Drone
+from ..models.vento import GerenciadorVento
+from ..models.geometria import MatrizGeometria
+from ..models.populacao import Populacao
+from ..models.individuo import Individuo
+from ..models.tempos_voo import TabelaTemposVoo
+from .genetico import AlgoritmoGenetico
+from .busca_local import BuscaLocal
+from .plano_voo import OtimizadorPlanoVoo
+from .crossover import OPERADORES_CROSSOVER
+from ..config.settings import Config, FASES_GERACAO, snapshot_config
+
+# Tempo máximo (s) de espera pelos migrantes da ilha vizinha; se estourar, a
+# ilha segue sem receber migrantes naquela rodada
+TIMEOUT_MIGRACAO = 600
+
+
+def _executar_ilha(indice, coordenadas, config, parametros, numero_geracoes,
+                   intervalo_migracao, num_migrantes, entrada, saida, resultados):
+    """Laço do algoritmo genético de uma ilha (executado em processo próprio)"""
+    for nome, valor in config.items():
+        setattr(Config, nome, valor)
+    random.seed(parametros['semente'])
+
+    geometria = MatrizGeometria(coordenadas)
+    drone, vento = Drone(), GerenciadorVento()
+    tabela_tempos = None
+    if parametros.get('precomputar_tempos'):
+        tabela_tempos = TabelaTemposVoo(geometria, drone, vento)
+    populacao = Populacao(coordenadas, drone, vento, parametros['tamanho_populacao'], geometria,
+                          workers=parametros.get('workers', 1),
+                          motor=parametros.get('motor', 'individuo'), tabela_tempos=tabela_tempos)
+    busca_local = None
+    if parametros.get('modo_busca_local'):
+        busca_local = BuscaLocal(populacao, parametros['modo_busca_local'],
+                                 tempo_maximo_geracao=parametros.get('tempo_busca_local', 2.0))
+    plano_voo = None
+    if parametros.get('elite_plano_voo'):
+        plano_voo = OtimizadorPlanoVoo(populacao, parametros['elite_plano_voo'],
+                                       tempo_maximo_geracao=parametros.get('tempo_plano_voo', 2.0))
+    algoritmo = AlgoritmoGenetico(populacao,
+                                  taxa_mutacao=parametros.get('taxa_mutacao', 0.05),
+                                  taxa_crossover=parametros.get('taxa_crossover', 0.8),
+                                  operador_crossover=parametros.get('operador_crossover', 'ox'),
+                                  busca_local=busca_local, plano_voo=plano_voo)
+
+    try:
+        for geracao in range(numero_geracoes):
+            stats = algoritmo.executar_geracao()
+            print(f"🏝️  Ilha {indice} - Geração {geracao + 1:02d}/{numero_geracoes} - "
+                  f"Melhor: {stats['melhor_fitness']:.2f}")
+
+            if (geracao + 1) % intervalo_migracao == 0 and geracao + 1 < numero_geracoes:
+                _migrar(algoritmo, num_migrantes, entrada, saida)
+    finally:
+        populacao.encerrar()
+
+    resultados.put({
+        'indice': indice,
+        'historico': algoritmo.get_historico(),
+        'melhor_genoma': populacao.melhor_individuo.genoma,
+        'melhor_metricas': populacao.melhor_individuo.exportar_metricas(),
+        'cache': populacao.cache_trechos.get_estatisticas()
+    })
+
+
+def _migrar(algoritmo, num_migrantes, entrada, saida):
+    """Envia as melhores rotas à próxima ilha e troca filhos da nova geração pelas recebidas"""
+    # Emigrantes vêm da última geração avaliada: a nova geração só é avaliada
+    # na próxima executar_geracao (com simulações e tempos registrados)
+    emigrantes = []
+    vistas = set()
+    for genoma in algoritmo.genomas_ultima_geracao:
+        chave = genoma.tobytes()
+        if chave not in vistas:
+            vistas.add(chave)
+            emigrantes.append(genoma)
+        if len(emigrantes) == num_migrantes:
+            break
+    saida.put(emigrantes)
+
+    try:
+        imigrantes = entrada.get(timeout=TIMEOUT_MIGRACAO)
+    except queue.Empty:
+        return
+
+    # Os migrantes substituem os últimos filhos gerados; a posição 0 (cópia
+    # do melhor pelo elitismo) é preservada
+    populacao = algoritmo.populacao
+    for k, genoma in enumerate(imigrantes[:len(populacao.individuos) - 1]):
+        populacao.individuos[-1 - k] = populacao.individuo_de_genoma(genoma)
+
+
+class ModeloIlhas:
+    """
+    Algoritmo genético em modelo de ilhas.
+
+    Cada ilha roda um AlgoritmoGenetico completo em um processo próprio, com
+    semente e operadores próprios. A cada `intervalo_migracao` gerações as
+    ilhas enviam suas melhores rotas (permutações de índices) à ilha seguinte
+    em anel, por filas, e substituem seus piores indivíduos pelas recebidas.
+    Ao final os históricos são unidos por geração e o melhor indivíduo é
+    reconstruído (e simulado) no processo principal.
+    """
+
+    def __init__(self, coordenadas, num_ilhas=4, tamanho_populacao=30, intervalo_migracao=5,
+                 num_migrantes=2, parametros_ilhas=None, semente=None):
+        """
+        parametros_ilhas: lista opcional de dicts por ilha com as chaves
+        'semente', 'operador_crossover', 'taxa_mutacao', 'taxa_crossover',
+        'modo_busca_local', 'tempo_busca_local', 'workers', 'motor',
+        'precomputar_tempos', 'elite_plano_voo' e 'tempo_plano_voo' (mesmo
+        significado que na população única). As ausentes usam o padrão:
+        sementes consecutivas e operadores de crossover alternados. Todas as
+        ilhas executam o mesmo número de gerações (a migração é sincronizada),
+        então não há critérios de parada antecipada.
+        """
+        self.coordenadas = coordenadas
+        self.num_ilhas = num_ilhas
+        self.tamanho_populacao = tamanho_populacao
+        self.intervalo_migracao = intervalo_migracao
+        self.num_migrantes = num_migrantes
+
+        semente_base = random.randrange(2 ** 32) if semente is None else semente
+        operadores = list(OPERADORES_CROSSOVER)
+        parametros_ilhas = parametros_ilhas or [{} for _ in range(num_ilhas)]
+        if len(parametros_ilhas) != num_ilhas:
+            raise ValueError("parametros_ilhas deve ter um dict por ilha")
+
+        self.parametros_ilhas = []
+        for i, parametros in enumerate(parametros_ilhas):
+            completos = {'semente': semente_base + i,
+                         'operador_crossover': operadores[i % len(operadores)],
+                         'tamanho_populacao': tamanho_populacao}
+            completos.update(parametros)
+            self.parametros_ilhas.append(completos)
+
+        self.historico = []
+        self.melhor_individuo = None
+        self.estatisticas_cache = None
+
+    def executar(self, numero_geracoes):
+        """Roda todas as ilhas e retorna (melhor indivíduo, histórico unido)"""
+        contexto = multiprocessing.get_context()
+        filas = [contexto.Queue() for _ in range(self.num_ilhas)]
+        resultados = contexto.Queue()
+        config = snapshot_config()
+
+        processos = []
+        for i in range(self.num_ilhas):
+            # Anel: a ilha i recebe da fila i e envia para a fila i + 1
+            processo = contexto.Process(
+                target=_executar_ilha,
+                args=(i, self.coordenadas, config, self.parametros_ilhas[i], numero_geracoes,
+                      self.intervalo_migracao, self.num_migrantes,
+                      filas[i], filas[(i + 1) % self.num_ilhas], resultados)
+            )
+            processo.start()
+            processos.append(processo)
+
+        # Coletar antes do join (evita bloqueio com filas cheias)
+        coletados = []
+        try:
+            while len(coletados) < self.num_ilhas:
+                try:
+                    coletados.append(resultados.get(timeout=1))
+                except queue.Empty:
+                    if not any(p.is_alive() for p in processos) and resultados.empty():
+                        raise RuntimeError("Ilha encerrada sem enviar resultados")
+        finally:
+            for processo in processos:
+                processo.join(timeout=5)
+                if processo.is_alive():
+                    processo.terminate()
+
+        coletados.sort(key=lambda r: r['indice'])
+        self.historico = self._unir_historicos([r['historico'] for r in coletados])
+        self.estatisticas_cache = self._unir_estatisticas_cache([r['cache'] for r in coletados])
+        self.melhor_individuo = self._reconstruir_melhor(coletados)
+        return self.melhor_individuo, self.historico
+
+    def _reconstruir_melhor(self, coletados):
+        """Escolhe o melhor entre as ilhas (viáveis primeiro) e refaz sua simulação"""
+        viaveis = [r for r in coletados if r['melhor_metricas']['viabilidade']]
+        melhor = min(viaveis or coletados, key=lambda r: r['melhor_metricas']['fitness'])
+
+        geometria = MatrizGeometria(self.coordenadas)
+        individuo = Individuo.de_genoma(melhor['melhor_genoma'], Drone(), GerenciadorVento(),
+                                        geometria)
+        # A simulação é determinística: reproduz as métricas da ilha com os trechos
+        individuo.simular_rota()
+        individuo.calcular_fitness()
+        return individuo
+
+    def _unir_historicos(self, historicos):
+        """Une as estatísticas das ilhas geração a geração"""
+        unido = []
+        for stats_geracao in zip(*historicos):
+            tamanho = sum(s['tamanho'] for s in stats_geracao)
+            viaveis = sum(s['individuos_viaveis'] for s in stats_geracao)
+            memo_acertos = sum(s['memo_acertos'] for s in stats_geracao)
+            stats = {
+                'tamanho': tamanho,
+                'melhor_fitness': min(s['melhor_fitness'] for s in stats_geracao),
+                'pior_fitness': max(s['pior_fitness'] for s in stats_geracao),
+                'fitness_medio': sum(s['fitness_medio'] * s['tamanho']
+                                     for s in stats_geracao) / tamanho,
+                'individuos_viaveis': viaveis,
+                'taxa_viabilidade': (viaveis / tamanho) * 100,
+                'memo_acertos': memo_acertos,
+                'simulacoes': sum(s['simulacoes'] for s in stats_geracao),
+                'trechos_retomados': sum(s['trechos_retomados'] for s in stats_geracao),
+                'memo_taxa_acerto': (memo_acertos / tamanho) * 100,
+                'melhor_fitness_ilhas': [s['melhor_fitness'] for s in stats_geracao]
+            }
+            # As ilhas rodam ao mesmo tempo: tempo de relógio é o da ilha mais
+            # lenta; a soma (processamento de todas as ilhas) vai em tempo_somado_*
+            for campo in [f'tempo_{fase}' for fase in FASES_GERACAO] + ['tempo_geracao']:
+                stats[campo] = max(s[campo] for s in stats_geracao)
+                stats[campo.replace('tempo_', 'tempo_somado_', 1)] = sum(
+                    s[campo] for s in stats_geracao)
+            # Vazão total das ilhas em paralelo
+            stats['avaliacoes_por_segundo'] = sum(s['avaliacoes_por_segundo']
+                                                  for s in stats_geracao)
+            unido.append(stats)
+        return unido
+
+    def _unir_estatisticas_cache(self, estatisticas):
+        """Soma os contadores dos caches de trechos de todas as ilhas"""
+        unidas = {campo: sum(e[campo] for e in estatisticas)
+                  for campo in ('acertos', 'faltas', 'entradas', 'bytes_usados', 'descartes')}
+        consultas = unidas['acertos'] + unidas['faltas']
+        unidas['taxa_acerto'] = (unidas['acertos'] / consultas * 100) if consultas else 0.0
+        return unidas
+
+    def __repr__(self):
+        return (f"ModeloIlhas({self.num_ilhas} ilhas x {self.tamanho_populacao} indivíduos, "
+                f"migração a cada {self.intervalo_migracao} gerações)")
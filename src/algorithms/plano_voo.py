@@ -0,0 +1,314 @@
+import time
+from bisect import bisect_right
+import numpy as np
+from ..models.memoria_fitness import assinatura_config
+from ..utils.cache import CacheLRU
+from ..config.settings import Config
+
+_MINUTOS_DIA = 24 * 60
+# Penalidade por chegada após HORA_FIM (ver Individuo._aplicar_penalidades)
+_PENALIDADE_CHEGADA_TARDE = 1000
+
+
+class OtimizadorPlanoVoo:
+    """
+    Plano de voo (velocidade de cada trecho e pontos de recarga) para uma
+    ordem de visita fixa, por programação dinâmica.
+
+    A simulação gulosa escolhe a velocidade trecho a trecho e só recarrega
+    quando o próximo trecho não cabe na bateria. Aqui os estados de cada
+    ponto da rota são (relógio, dia, bateria) com o custo acumulado do
+    fitness (custo por minuto, recargas, taxa após HORA_TAXA_EXTRA, chegadas
+    após HORA_FIM e dias excedidos). Cada estado se expande em todas as
+    velocidades, com e sem recarga antes do trecho; os tempos de voo vêm do
+    vento da faixa horária do momento da partida, como em simular_rota.
+
+    Para limitar o número de estados, a bateria é discretizada em
+    passo_bateria segundos (fica o estado de menor custo por relógio e faixa
+    de bateria), estados do mesmo dia com custo, relógio e bateria piores que
+    outro são descartados e no máximo max_estados seguem para o próximo
+    ponto. O plano é aproximado: ele só é aceito se a simulação completa com
+    o plano der um resultado melhor que o da escolha gulosa.
+    """
+
+    # Bytes estimados de uma entrada do cache de planos além dos arrays
+    _BYTES_FIXOS_ENTRADA = 200
+    # Limite de memória (bytes) do cache de planos por rota
+    CACHE_MAX_BYTES = 4 * 1024 * 1024
+
+    def __init__(self, populacao, num_elite=1, tempo_maximo_geracao=2.0, passo_bateria=None,
+                 max_estados=None):
+        """
+        num_elite: quantos dos melhores indivíduos (rotas distintas) recebem
+        um plano por geração, enquanto houver tempo
+        """
+        self.populacao = populacao
+        self.num_elite = num_elite
+        self.tempo_maximo_geracao = tempo_maximo_geracao
+        self.passo_bateria = (Config.PLANO_VOO_PASSO_BATERIA if passo_bateria is None
+                              else passo_bateria)
+        self.max_estados = Config.PLANO_VOO_MAX_ESTADOS if max_estados is None else max_estados
+
+        self.drone = populacao.drone
+        self.gerenciador_vento = populacao.gerenciador_vento
+        self.geometria = populacao.geometria
+        self.tabela_tempos = populacao.tabela_tempos
+        # Planos já resolvidos por (rota, configuração)
+        self._planos = CacheLRU(self.CACHE_MAX_BYTES)
+
+        self.ultima_execucao = self._estatisticas_vazias()
+
+    def _estatisticas_vazias(self):
+        return {'plano_voo_tentativas': 0, 'plano_voo_melhorias': 0, 'plano_voo_simulacoes': 0,
+                'plano_voo_tempo': 0.0}
+
+    def aplicar(self, populacao=None):
+        """Aplica o plano de voo aos melhores indivíduos já avaliados (respeitando o prazo)"""
+        populacao = populacao or self.populacao
+        inicio = time.perf_counter()
+        prazo = inicio + self.tempo_maximo_geracao
+        self.ultima_execucao = self._estatisticas_vazias()
+
+        alvos = []
+        vistos = set()
+        for individuo in sorted(populacao.individuos, key=lambda ind: ind.fitness):
+            if len(alvos) == self.num_elite:
+                break
+            chave = individuo.genoma.tobytes()
+            if individuo.viabilidade and chave not in vistos:
+                vistos.add(chave)
+                alvos.append(individuo)
+
+        for individuo in alvos:
+            if time.perf_counter() >= prazo:
+                break
+            # Cópias de elite já trazem o plano da geração anterior
+            if individuo.plano_voo is not None:
+                continue
+            melhorado = self.melhorar(individuo, prazo)
+            if melhorado is not individuo:
+                posicao = next(k for k, ind in enumerate(populacao.individuos) if ind is individuo)
+                populacao.individuos[posicao] = melhorado
+
+        populacao.atualizar_melhores()
+        self.ultima_execucao['plano_voo_tempo'] = time.perf_counter() - inicio
+        return self.ultima_execucao
+
+    def melhorar(self, individuo, prazo=None):
+        """
+        Retorna um novo indivíduo com o plano de voo da rota, se a simulação
+        com o plano for melhor (fitness, depois dias e tempo); senão o próprio
+        """
+        chave = (individuo.genoma.tobytes(), assinatura_config())
+        plano = self._planos.obter(chave)
+        if plano is None:
+            self.ultima_execucao['plano_voo_tentativas'] += 1
+            plano = self.resolver(individuo.genoma, prazo)
+            if plano is None:
+                return individuo
+            self._planos.guardar(chave, plano,
+                                 sum(a.nbytes for a in plano) + self._BYTES_FIXOS_ENTRADA)
+
+        candidato = self.populacao.individuo_de_genoma(individuo.genoma.copy(), validar=False)
+        candidato.plano_voo = plano
+        self.ultima_execucao['plano_voo_simulacoes'] += 1
+        candidato.simular_rota()
+        candidato.calcular_fitness()
+        if ((candidato.fitness, candidato.dias_utilizados, candidato.tempo_total) <
+                (individuo.fitness, individuo.dias_utilizados, individuo.tempo_total)):
+            self.ultima_execucao['plano_voo_melhorias'] += 1
+            return candidato
+        return individuo
+
+    def exportar_planos(self):
+        """Planos em cache da configuração atual, do menos para o mais recente,
+        como matrizes (rotas, velocidades, recargas) para checkpoints"""
+        assinatura = assinatura_config()
+        itens = [(genoma, plano) for (genoma, assinatura_entrada), plano in self._planos.itens()
+                 if assinatura_entrada == assinatura]
+        if not itens:
+            return {}
+        dtype = self.geometria.dtype_indices
+        return {'cache_planos_genomas': np.stack([np.frombuffer(g, dtype=dtype) for g, _ in itens]),
+                'cache_planos_velocidades': np.stack([plano[0] for _, plano in itens]),
+                'cache_planos_recargas': np.stack([plano[1] for _, plano in itens])}
+
+    def importar_planos(self, arrays):
+        """Inverso de exportar_planos"""
+        if 'cache_planos_genomas' not in arrays:
+            return
+        assinatura = assinatura_config()
+        dtype = self.geometria.dtype_indices
+        for genoma, velocidades, recargas in zip(arrays['cache_planos_genomas'],
+                                                 arrays['cache_planos_velocidades'],
+                                                 arrays['cache_planos_recargas']):
+            plano = (velocidades, recargas)
+            self._planos.guardar((genoma.astype(dtype).tobytes(), assinatura), plano,
+                                 sum(a.nbytes for a in plano) + self._BYTES_FIXOS_ENTRADA)
+
+    def resolver(self, genoma, prazo=None):
+        """
+        Resolve o plano de voo da rota (genoma). Retorna (índices de
+        velocidade em drone.velocidades, recargas antes de cada trecho) como
+        arrays com um elemento por trecho, ou None se o prazo acabar ou
+        nenhum estado sobreviver (ex.: HARD_DIAS_MAX).
+        """
+        rota = np.asarray(genoma).tolist()
+        hora_inicio = Config.HORA_INICIO
+        hora_fim = Config.HORA_FIM
+        dias_maximos = Config.DIAS_MAXIMOS
+        tempo_recarga = Config.TEMPO_RECARGA
+        hard_dias = getattr(Config, 'HARD_DIAS_MAX', False)
+        custo_recarga = Config.CUSTO_RECARGA
+        custo_taxa = Config.CUSTO_TAXA_TARDE
+        custo_minuto = Config.CUSTO_POR_MINUTO
+        bateria_cheia = self.drone.calcular_autonomia(36)
+
+        # Estados antes do trecho i: relógio absoluto, dia, bateria, custo
+        minutos_abs = np.zeros(1, dtype=np.int64)
+        dia = np.ones(1, dtype=np.int64)
+        bateria = np.full(1, bateria_cheia)
+        custo = np.zeros(1)
+        # Por trecho: estado anterior, índice de velocidade e recarga de cada estado
+        pais, escolhas, recargas = [], [], []
+
+        for i in range(len(rota) - 1):
+            if prazo is not None and time.perf_counter() >= prazo:
+                return None
+            num_estados = len(minutos_abs)
+
+            # Dormir se passou de HORA_FIM (antes de escolher a velocidade)
+            hora = (hora_inicio + minutos_abs) % _MINUTOS_DIA
+            dormir = (hora >= hora_fim) & (dia < dias_maximos)
+            minutos_abs = np.where(dormir, minutos_abs + (_MINUTOS_DIA - hora) + hora_inicio,
+                                   minutos_abs)
+            dia = np.where(dormir, dia + 1, dia)
+            hora = (hora_inicio + minutos_abs) % _MINUTOS_DIA
+            # O tempo de voo é o do momento da partida prevista, mesmo com recarga
+            tempos = self._tempos(rota[i], rota[i + 1], dia, hora)
+
+            # Recarga antes do trecho: taxa pelo horário e, se passar de
+            # HORA_FIM, dormir até o próximo dia
+            hora_avaliacao = ((hora + tempo_recarga) % _MINUTOS_DIA
+                              if Config.TAXA_BASEADA_EM == 'end' else hora)
+            custo_com_recarga = (custo + custo_recarga +
+                                 custo_taxa * (hora_avaliacao >= Config.HORA_TAXA_EXTRA))
+            minutos_recarga = minutos_abs + tempo_recarga
+            hora_recarga = (hora_inicio + minutos_recarga) % _MINUTOS_DIA
+            dormir = (hora_recarga >= hora_fim) & (dia < dias_maximos)
+            minutos_recarga = np.where(
+                dormir, minutos_recarga + (_MINUTOS_DIA - hora_recarga) + hora_inicio,
+                minutos_recarga)
+            dia_recarga = np.where(dormir, dia + 1, dia)
+
+            # Opções: linhas [0, n) sem recarga (só velocidades que cabem na
+            # bateria) e [n, 2n) com recarga (quando a bateria não está cheia
+            # ou nenhuma velocidade cabe, como na recarga forçada da simulação)
+            cabe = tempos <= bateria[:, np.newaxis]
+            pode_recarregar = (bateria < bateria_cheia) | ~cabe.any(axis=1)
+            validas = np.concatenate([cabe, np.broadcast_to(pode_recarregar[:, np.newaxis],
+                                                            tempos.shape)])
+            linha, velocidade = np.nonzero(validas)
+            anterior = linha % num_estados
+            recarga = linha >= num_estados
+            tempo_voo = tempos[anterior, velocidade].astype(np.int64)
+
+            novo_minutos = np.where(recarga, minutos_recarga[anterior],
+                                    minutos_abs[anterior]) + tempo_voo // 60 + 1
+            novo_dia = np.where(recarga, dia_recarga[anterior], dia[anterior])
+            nova_bateria = np.where(recarga, bateria_cheia, bateria[anterior]) - tempo_voo
+            excesso = np.maximum((hora_inicio + novo_minutos) // _MINUTOS_DIA + 1 - dias_maximos, 0)
+            novo_custo = (np.where(recarga, custo_com_recarga[anterior], custo[anterior]) +
+                          custo_minuto * tempo_voo / 60 +
+                          Config.PENALIDADE_POR_DIA_EXCEDIDO * excesso +
+                          _PENALIDADE_CHEGADA_TARDE *
+                          ((hora_inicio + novo_minutos) % _MINUTOS_DIA > hora_fim))
+
+            selecionados = self._podar(novo_minutos, novo_dia, nova_bateria, novo_custo,
+                                       excesso == 0 if hard_dias else None)
+            if len(selecionados) == 0:
+                return None
+            minutos_abs = novo_minutos[selecionados]
+            dia = novo_dia[selecionados]
+            bateria = nova_bateria[selecionados]
+            custo = novo_custo[selecionados]
+            pais.append(anterior[selecionados])
+            escolhas.append(velocidade[selecionados])
+            recargas.append(recarga[selecionados])
+
+        # Melhor estado final (menor custo; empate: termina mais cedo) e
+        # reconstrução das decisões de trás para frente
+        estado = np.lexsort((minutos_abs, custo))[0]
+        indices_velocidade = np.empty(len(pais), dtype=np.int8)
+        recargas_planejadas = np.empty(len(pais), dtype=bool)
+        for i in range(len(pais) - 1, -1, -1):
+            indices_velocidade[i] = escolhas[i][estado]
+            recargas_planejadas[i] = recargas[i][estado]
+            estado = pais[i][estado]
+        return indices_velocidade, recargas_planejadas
+
+    def _tempos(self, origem, destino, dias, minutos):
+        """Tempos de voo (s) origem→destino em todas as velocidades: matriz [estados, velocidades]"""
+        if self.tabela_tempos is not None:
+            quantidade = len(dias)
+            return self.tabela_tempos.tempos_array(np.full(quantidade, origem),
+                                                   np.full(quantidade, destino), dias, minutos)
+        # Mesma aritmética de calcular_trechos_velocidades, uma linha por estado
+        vento_x, vento_y = self.gerenciador_vento.get_vento_array(dias, minutos)
+        v_vento_proj = (vento_x * self.geometria.unitario_x.item(origem, destino) +
+                        vento_y * self.geometria.unitario_y.item(origem, destino))
+        velocidades_efetivas = self.drone.velocidades[np.newaxis, :] + v_vento_proj[:, np.newaxis]
+        velocidades_efetivas = np.where(velocidades_efetivas <= 0, 0.1, velocidades_efetivas)
+        distancia = self.geometria.distancias.item(origem, destino)
+        return (distancia / velocidades_efetivas * 3600).astype(np.int64) + 1
+
+    def _podar(self, minutos_abs, dia, bateria, custo, permitidos=None):
+        """Índices dos estados que seguem para o próximo ponto da rota"""
+        candidatos = np.arange(len(minutos_abs))
+        if permitidos is not None:
+            candidatos = candidatos[permitidos]
+
+        # Um estado por (dia, relógio, faixa de bateria): o de menor custo e,
+        # no empate, o de mais bateria
+        faixa = (bateria[candidatos] // self.passo_bateria).astype(np.int64)
+        ordem = np.lexsort((-bateria[candidatos], custo[candidatos], faixa,
+                            minutos_abs[candidatos], dia[candidatos]))
+        candidatos, faixa = candidatos[ordem], faixa[ordem]
+        primeiro = np.ones(len(candidatos), dtype=bool)
+        primeiro[1:] = ((dia[candidatos[1:]] != dia[candidatos[:-1]]) |
+                        (minutos_abs[candidatos[1:]] != minutos_abs[candidatos[:-1]]) |
+                        (faixa[1:] != faixa[:-1]))
+        candidatos = candidatos[primeiro]
+
+        # Dominância no mesmo dia: descarta o estado se outro de custo menor ou
+        # igual (visto antes na ordem) chega mais cedo com pelo menos a mesma
+        # bateria. Por dia, a "escada" guarda relógios crescentes com bateria
+        # crescente, então basta comparar com o degrau anterior ao relógio
+        ordem = np.lexsort((-bateria[candidatos], minutos_abs[candidatos],
+                            custo[candidatos], dia[candidatos]))
+        candidatos = candidatos[ordem]
+        escadas = {}
+        mantidos = []
+        for estado, d, m, b in zip(candidatos.tolist(), dia[candidatos].tolist(),
+                                   minutos_abs[candidatos].tolist(), bateria[candidatos].tolist()):
+            relogios, baterias = escadas.setdefault(d, ([], []))
+            posicao = bisect_right(relogios, m)
+            if posicao and baterias[posicao - 1] >= b:
+                continue
+            mantidos.append(estado)
+            # Degraus seguintes com bateria <= b deixam de ser necessários
+            fim = posicao
+            while fim < len(relogios) and baterias[fim] <= b:
+                fim += 1
+            relogios[posicao:fim] = [m]
+            baterias[posicao:fim] = [b]
+
+        mantidos = np.array(mantidos, dtype=np.int64)
+        if len(mantidos) > self.max_estados:
+            ordem = np.lexsort((-bateria[mantidos], minutos_abs[mantidos], custo[mantidos]))
+            mantidos = mantidos[ordem[:self.max_estados]]
+        return mantidos
+
+    def __repr__(self):
+        return (f"OtimizadorPlanoVoo(elite={self.num_elite}, "
+                f"tempo_maximo_geracao={self.tempo_maximo_geracao}s)")
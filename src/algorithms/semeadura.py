@@ -0,0 +1,124 @@
+"""Heurísticas construtivas para semear a população inicial.
+
+Todas trabalham sobre a tabela de distâncias da MatrizGeometria (índices de
+pontos) e devolvem a rota completa como lista de índices, com o depósito
+(Unibrasil) na primeira e na última posição.
+"""
+import random
+import numpy as np
+
+
+def rota_vizinho_mais_proximo(distancias, deposito, pontos):
+    """Vizinho mais próximo a partir do depósito"""
+    return rota_gulosa_aleatoria(distancias, deposito, pontos, candidatos=1)
+
+
+def rota_gulosa_aleatoria(distancias, deposito, pontos, candidatos=3, rng=random):
+    """Guloso aleatorizado: a cada passo sorteia um dos `candidatos` pontos
+    não visitados mais próximos do ponto atual"""
+    pontos = np.asarray(pontos)
+    livres = np.ones(len(pontos), dtype=bool)
+    rota = [deposito]
+    atual = deposito
+
+    for restantes in range(len(pontos), 0, -1):
+        # Distâncias do ponto atual aos pontos livres (visitados = infinito)
+        linha = np.where(livres, distancias[atual, pontos], np.inf)
+        k = min(candidatos, restantes)
+        if k == 1:
+            escolhido = int(np.argmin(linha))
+        else:
+            mais_proximos = np.argpartition(linha, k - 1)[:k]
+            escolhido = int(mais_proximos[rng.randrange(k)])
+        livres[escolhido] = False
+        atual = int(pontos[escolhido])
+        rota.append(atual)
+
+    rota.append(deposito)
+    return rota
+
+
+def rota_economias(distancias, deposito, pontos):
+    """Economias de Clarke-Wright para um único veículo.
+
+    Parte de rotas depósito-i-depósito e une extremidades de caminhos pela
+    ordem decrescente de economia s(i, j) = d(0, i) + d(0, j) - d(i, j), até
+    restar um único caminho, que é fechado no depósito.
+    """
+    pontos = np.asarray(pontos)
+    n = len(pontos)
+    if n < 3:
+        return [deposito] + pontos.tolist() + [deposito]
+
+    d0 = distancias[deposito, pontos]
+    economias = d0[:, np.newaxis] + d0[np.newaxis, :] - distancias[np.ix_(pontos, pontos)]
+    linhas, colunas = np.triu_indices(n, k=1)
+    ordem = np.argsort(-economias[linhas, colunas], kind='stable')
+
+    grau = [0] * n
+    vizinhos = [[] for _ in range(n)]
+    # Union-find para não fechar ciclos entre caminhos
+    representante = list(range(n))
+
+    def raiz(i):
+        while representante[i] != i:
+            representante[i] = representante[representante[i]]
+            i = representante[i]
+        return i
+
+    unioes = 0
+    for a, b in zip(linhas[ordem].tolist(), colunas[ordem].tolist()):
+        if grau[a] == 2 or grau[b] == 2:
+            continue
+        ra, rb = raiz(a), raiz(b)
+        if ra == rb:
+            continue
+        representante[ra] = rb
+        grau[a] += 1
+        grau[b] += 1
+        vizinhos[a].append(b)
+        vizinhos[b].append(a)
+        unioes += 1
+        if unioes == n - 1:
+            break
+
+    # Percorrer o caminho a partir de uma das pontas
+    atual = grau.index(1)
+    anterior = -1
+    caminho = []
+    while atual != -1:
+        caminho.append(int(pontos[atual]))
+        proximo = next((v for v in vizinhos[atual] if v != anterior), -1)
+        anterior, atual = atual, proximo
+
+    # Orientar o caminho para começar pela ponta mais próxima do depósito
+    if distancias[deposito, caminho[-1]] < distancias[deposito, caminho[0]]:
+        caminho.reverse()
+    return [deposito] + caminho + [deposito]
+
+
+def gerar_sementes(distancias, deposito, pontos, quantidade, candidatos=3, rng=random):
+    """Gera `quantidade` rotas distintas: vizinho mais próximo, economias e,
+    para as demais, guloso aleatorizado (uma tentativa extra por repetição)"""
+    sementes = []
+    vistas = set()
+
+    def adicionar(rota):
+        chave = tuple(rota)
+        if chave not in vistas:
+            vistas.add(chave)
+            sementes.append(rota)
+
+    construtores = [
+        lambda: rota_vizinho_mais_proximo(distancias, deposito, pontos),
+        lambda: rota_economias(distancias, deposito, pontos),
+    ]
+    for construir in construtores[:quantidade]:
+        adicionar(construir())
+
+    tentativas = 2 * quantidade
+    while len(sementes) < quantidade and tentativas > 0:
+        adicionar(rota_gulosa_aleatoria(distancias, deposito, pontos, candidatos, rng))
+        tentativas -= 1
+
+    return sementes
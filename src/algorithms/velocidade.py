@@ -0,0 +1,91 @@
+import numpy as np
+
+# Pequena tolerância para desempate: se dois custos forem muito próximos,
+# preferimos a velocidade maior (mais rápida) para cumprir a rota antes.
+EPS_DESEMPATE = 0.01  # unidades de custo (aprox 0.01 minuto)
+
+
+def calcular_trechos_velocidades(distancia, v_vento_proj, velocidades, autonomias):
+    """
+    Calcula o resultado de um trecho em todas as velocidades válidas.
+
+    distancia: km do trecho
+    v_vento_proj: componente do vento (km/h) na direção do voo
+    velocidades / autonomias: arrays alinhados (ver Drone.velocidades e
+    Drone.autonomias)
+
+    Retorna (velocidades_efetivas, tempos_segundos, consumos_percentuais).
+    Depende apenas do par, do vento e do drone, por isso pode ser guardado
+    em cache. A aritmética é a mesma de Trecho/calcular_velocidade_efetiva,
+    elemento a elemento.
+    """
+    # Velocidade efetiva com proteção contra valores não-positivos
+    velocidades_efetivas = velocidades + v_vento_proj
+    velocidades_efetivas = np.where(velocidades_efetivas <= 0, 0.1, velocidades_efetivas)
+
+    # Tempo de voo em segundos (arredondado para cima, como em Trecho)
+    tempos = (distancia / velocidades_efetivas * 3600).astype(np.int64) + 1
+
+    # Consumo (= tempo de voo) em porcentagem da autonomia em cada velocidade
+    consumos_percentuais = (tempos / autonomias) * 100.0
+
+    return velocidades_efetivas, tempos, consumos_percentuais
+
+
+def custos_velocidades(tempos, consumos_percentuais, bateria_atual, alpha, beta):
+    """
+    Retorna (custos, viaveis) da heurística alpha/beta para cada velocidade.
+    Viáveis são as velocidades que não exigem recarga antes do trecho.
+    """
+    # Custo linear com termos normalizados (tempo em minutos)
+    custos = alpha * (tempos / 60.0) + beta * consumos_percentuais
+    viaveis = tempos <= bateria_atual
+    return custos, viaveis
+
+
+def pontuar_velocidades(distancia, v_vento_proj, velocidades, autonomias,
+                        bateria_atual, alpha, beta):
+    """
+    Avalia todas as velocidades válidas de um trecho numa única operação.
+
+    Retorna (velocidades_efetivas, tempos_segundos, consumos_percentuais,
+    custos, viaveis), todos arrays alinhados com velocidades.
+    """
+    velocidades_efetivas, tempos, consumos_percentuais = calcular_trechos_velocidades(
+        distancia, v_vento_proj, velocidades, autonomias
+    )
+    custos, viaveis = custos_velocidades(tempos, consumos_percentuais, bateria_atual, alpha, beta)
+    return velocidades_efetivas, tempos, consumos_percentuais, custos, viaveis
+
+
+def escolher_indice_velocidade(custos, viaveis):
+    """
+    Índice da velocidade de menor custo entre as viáveis (ou None).
+
+    Percorre as velocidades em ordem decrescente e só troca de escolha quando
+    o custo é menor por mais de EPS_DESEMPATE, o que favorece a velocidade
+    maior em caso de empate.
+    """
+    melhor_indice = None
+    menor_custo = float('inf')
+
+    ultimo = len(custos) - 1
+    for k, (custo, viavel) in enumerate(zip(custos[::-1].tolist(), viaveis[::-1].tolist())):
+        if viavel and custo < menor_custo - EPS_DESEMPATE:
+            menor_custo = custo
+            melhor_indice = ultimo - k
+
+    return melhor_indice
+
+
+def escolher_velocidade(velocidades, custos, viaveis, velocidade_minima):
+    """
+    Escolhe a velocidade de menor custo entre as viáveis (ver
+    escolher_indice_velocidade). Se nenhuma for viável, retorna
+    velocidade_minima (forçando a recarga).
+    """
+    indice = escolher_indice_velocidade(custos, viaveis)
+    if indice is None:
+        return velocidade_minima
+
+    return velocidades.item(indice)
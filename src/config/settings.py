@@ -47,4 +47,42 @@ class Config:
     # Penalidade aplicada por cada dia que ultrapassar DIAS_MAXIMOS (valor em
     # unidades de custo, somado a self.penalidades). Ajuste para controlar o
     # trade-off entre viabilidade e economia. Ex: 10000 é severo; 1000 é leve.
-    PENALIDADE_POR_DIA_EXCEDIDO = 10000
\ No newline at end of file
+    PENALIDADE_POR_DIA_EXCEDIDO = 10000
+    
+    # Desempenho
+    # Limite de memória (bytes) do cache LRU de resultados de trechos
+    # compartilhado pelos indivíduos de uma execução (ver CacheLRU).
+    CACHE_TRECHOS_MAX_BYTES = 32 * 1024 * 1024
+    # Limite de memória (bytes) da memória de fitness por rota (ver MemoriaFitness)
+    MEMO_FITNESS_MAX_BYTES = 16 * 1024 * 1024
+    # A cada quantos trechos simular_rota guarda um checkpoint do estado
+    # (relógio, bateria, métricas) para re-simulação incremental de mutações
+    INTERVALO_CHECKPOINT_SIMULACAO = 10
+    # Limite de memória (bytes) da tabela pré-calculada de tempos de voo
+    # [origem, destino, banda de vento, velocidade] (ver TabelaTemposVoo).
+    # Acima dele a tabela é montada sob demanda, por origem.
+    TABELA_TEMPOS_MAX_BYTES = 256 * 1024 * 1024
+    # Plano de voo por programação dinâmica (ver OtimizadorPlanoVoo):
+    # discretização da bateria (segundos) e estados mantidos por ponto da rota
+    PLANO_VOO_PASSO_BATERIA = 60
+    PLANO_VOO_MAX_ESTADOS = 300
+    
+    # População inicial
+    # Fração da população inicial construída por heurísticas (vizinho mais
+    # próximo, economias e guloso aleatorizado); o restante é aleatório.
+    FRACAO_SEMEADURA = 0.2
+    # Tamanho da lista de candidatos (vizinhos mais próximos ainda não
+    # visitados) sorteada a cada passo do guloso aleatorizado
+    CANDIDATOS_GULOSO_ALEATORIO = 3
+
+
+
+# Fases cronometradas em cada geração do algoritmo genético (chaves
+# 'tempo_<fase>' no histórico, exportadas pelo CSVExporter)
+FASES_GERACAO = ('avaliacao', 'busca_local', 'plano_voo', 'selecao', 'crossover', 'mutacao')
+
+
+def snapshot_config():
+    """Copia os valores atuais de Config (podem ter sido alterados em tempo de
+    execução), p.ex. para repassá-los a outros processos"""
+    return {nome: valor for nome, valor in vars(Config).items() if nome.isupper()}
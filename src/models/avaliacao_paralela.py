@@ -0,0 +1,86 @@
+from concurrent.futures import ProcessPoolExecutor
+from .geometria import MatrizGeometria
+from .individuo import Individuo
+from .memoria_fitness import assinatura_config
+from ..utils.cache import CacheLRU
+from ..config.settings import Config, snapshot_config
+
+# Estado de cada processo trabalhador (montado uma única vez em _inicializar_worker)
+_contexto_worker = {}
+
+
+def _inicializar_worker(coordenadas, drone, gerenciador_vento, config):
+    """Recebe drone e vento da população e monta geometria e cache do processo trabalhador"""
+    for nome, valor in config.items():
+        setattr(Config, nome, valor)
+
+    _contexto_worker['drone'] = drone
+    _contexto_worker['vento'] = gerenciador_vento
+    _contexto_worker['geometria'] = MatrizGeometria(coordenadas)
+    _contexto_worker['cache'] = CacheLRU(Config.CACHE_TRECHOS_MAX_BYTES)
+
+
+def _avaliar_rota(genoma):
+    """Simula a rota (índices na geometria) e devolve apenas as métricas"""
+    individuo = Individuo.de_genoma(genoma, _contexto_worker['drone'], _contexto_worker['vento'],
+                                    _contexto_worker['geometria'], _contexto_worker['cache'])
+    individuo.simular_rota()
+    individuo.calcular_fitness()
+    return individuo.exportar_metricas()
+
+
+class AvaliadorParalelo:
+    """
+    Avalia rotas em um pool de processos.
+
+    Os trabalhadores recebem apenas a permutação da rota (índices na
+    MatrizGeometria) e devolvem as métricas da simulação. Drone e vento são
+    os da população (copiados para cada processo uma única vez) e, como a
+    simulação é determinística, os resultados são idênticos aos da avaliação
+    serial.
+    """
+
+    def __init__(self, geometria, workers, drone, gerenciador_vento):
+        self.geometria = geometria
+        self.workers = workers
+        self.drone = drone
+        self.gerenciador_vento = gerenciador_vento
+        self._executor = None
+        # Assinatura de Config com que o pool atual foi criado
+        self._assinatura = None
+
+    def _get_executor(self):
+        """Cria o pool na primeira avaliação (evita custo se nunca for usado) e
+        o recria se Config mudou desde então (os processos copiam Config ao iniciar)"""
+        assinatura = assinatura_config()
+        if self._executor is not None and assinatura != self._assinatura:
+            self.encerrar()
+        if self._executor is None:
+            self._assinatura = assinatura
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_inicializar_worker,
+                initargs=(self.geometria.coordenadas, self.drone, self.gerenciador_vento,
+                          snapshot_config())
+            )
+        return self._executor
+
+    def avaliar(self, individuos):
+        """Avalia os indivíduos em paralelo, aplicando as métricas em cada um"""
+        rotas = [ind.genoma for ind in individuos]
+        # Blocos de tamanho parecido por trabalhador reduzem o custo de IPC
+        chunksize = max(1, len(rotas) // (self.workers * 4))
+
+        resultados = self._get_executor().map(_avaliar_rota, rotas, chunksize=chunksize)
+        for individuo, metricas in zip(individuos, resultados):
+            individuo.aplicar_metricas(metricas)
+            individuo.trechos_retomados = 0
+
+    def encerrar(self):
+        """Finaliza os processos trabalhadores"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __repr__(self):
+        return f"AvaliadorParalelo({self.workers} processos)"
@@ -1,20 +1,85 @@
+from ..config.settings import Config
+
+
 class Coordenada:
+    # Sem __dict__ por instância: rotas grandes referenciam milhares delas
+    __slots__ = ('cep', 'latitude', 'longitude', 'id', '_eh_unibrasil')
+
     def __init__(self, cep, latitude, longitude):
         self.cep = str(cep)
         self.latitude = float(latitude)
         self.longitude = float(longitude)
-    
+        # Id inteiro estável atribuído pelo RegistroCoordenadas (None = não registrada)
+        self.id = None
+        # Calculado uma única vez (eh_unibrasil é consultado a cada validação)
+        self._eh_unibrasil = self.cep == Config.CEP_INICIAL
+
     def eh_unibrasil(self):
         """Verifica se é o CEP do Unibrasil (início/fim da rota)"""
-        return self.cep == "82821020"
-    
+        return self._eh_unibrasil
+
     def __repr__(self):
         return f"Coordenada({self.cep})"
-    
+
     def __eq__(self, other):
         if not isinstance(other, Coordenada):
             return False
         return self.cep == other.cep
-    
+
     def __hash__(self):
-        return hash(self.cep)
\ No newline at end of file
+        return hash(self.cep)
+
+
+class RegistroCoordenadas:
+    """
+    Registro (interning) de coordenadas por CEP.
+
+    Cada CEP distinto recebe um id inteiro estável (ordem de registro) e uma
+    única instância canônica de Coordenada; rotas passam a ser sequências
+    desses ids. O índice do Unibrasil fica conhecido já no registro.
+    """
+
+    def __init__(self, coordenadas=()):
+        self.coordenadas = []
+        self._ids = {}
+        self.indice_unibrasil = None
+        for coordenada in coordenadas:
+            self.registrar(coordenada)
+
+    def registrar(self, coordenada):
+        """Registra a coordenada (se o CEP for novo) e retorna a instância canônica"""
+        existente = self._ids.get(coordenada.cep)
+        if existente is not None:
+            return self.coordenadas[existente]
+
+        novo_id = len(self.coordenadas)
+        if coordenada.id is not None and coordenada.id != novo_id:
+            # Já pertence a outro registro com outra numeração: usar uma cópia
+            coordenada = Coordenada(coordenada.cep, coordenada.latitude, coordenada.longitude)
+        coordenada.id = novo_id
+
+        self._ids[coordenada.cep] = novo_id
+        self.coordenadas.append(coordenada)
+        if self.indice_unibrasil is None and coordenada.eh_unibrasil():
+            self.indice_unibrasil = novo_id
+        return coordenada
+
+    def id_de(self, coordenada):
+        """Id da coordenada neste registro (atalho sem dict para as canônicas)"""
+        identificador = coordenada.id
+        if (identificador is not None and identificador < len(self.coordenadas) and
+                self.coordenadas[identificador] is coordenada):
+            return identificador
+        return self._ids[coordenada.cep]
+
+    def __contains__(self, coordenada):
+        return coordenada.cep in self._ids
+
+    def __getitem__(self, identificador):
+        return self.coordenadas[identificador]
+
+    def __len__(self):
+        return len(self.coordenadas)
+
+    def __repr__(self):
+        return f"RegistroCoordenadas({len(self.coordenadas)} CEPs)"
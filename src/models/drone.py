@@ -1,10 +1,15 @@
 import math
+import numpy as np
 from ..config.settings import Config
 
 class Drone:
     def __init__(self):
         self.config = Config
         self.bateria_atual = self.calcular_autonomia(36)  # Começa com bateria cheia na velocidade mínima
+        # Velocidades válidas e autonomia (s) em cada uma, pré-calculadas uma
+        # única vez para o kernel vetorizado de escolha de velocidade
+        self.velocidades = np.array(self.get_velocidades_validas())
+        self.autonomias = np.array([self.calcular_autonomia(v) for v in self.get_velocidades_validas()])
     
     def calcular_autonomia(self, velocidade):
         """
@@ -0,0 +1,84 @@
+from typing import NamedTuple
+
+# Códigos dos eventos da simulação
+NOITE = 'noite'                            # virada de dia antes de um trecho
+NOITE_APOS_RECARGA = 'noite_apos_recarga'  # virada de dia causada por uma recarga
+POUSO_ATRASADO = 'pouso_atrasado'          # recarga após HORA_FIM
+POUSO_TAXA_TARDE = 'pouso_taxa_tarde'      # recarga com taxa extra
+DIAS_EXCEDIDOS = 'dias_excedidos'          # rota passou de DIAS_MAXIMOS
+
+# Eventos que viram alertas do indivíduo (os demais só vão para o sink)
+CODIGOS_ALERTA = (POUSO_ATRASADO, POUSO_TAXA_TARDE, DIAS_EXCEDIDOS)
+
+
+class Evento(NamedTuple):
+    """Evento da simulação: código e campos numéricos (texto só ao formatar).
+
+    dia/hora: dia e minuto do dia do evento (em DIAS_EXCEDIDOS, dia é o
+    número de dias utilizados até o momento); limite: DIAS_MAXIMOS vigente.
+    """
+    codigo: str
+    dia: int
+    hora: int = 0
+    cep: str = ''
+    limite: int = 0
+
+
+def formatar_alerta(evento):
+    """Texto do alerta (formato de Individuo.alertas e do resumo exportado)"""
+    if evento.codigo == POUSO_ATRASADO:
+        return f"Pouso atrasado: dia {evento.dia}, hora {evento.hora} min, CEP {evento.cep}"
+    if evento.codigo == POUSO_TAXA_TARDE:
+        return f"Pouso com taxa tarde: dia {evento.dia}, hora {evento.hora} min, CEP {evento.cep}"
+    if evento.codigo == DIAS_EXCEDIDOS:
+        return (f"dias_excedidos: Dias utilizados excederam o máximo: {evento.dia} dias "
+                f"(limite {evento.limite})")
+    raise ValueError(f"Evento {evento.codigo} não é um alerta")
+
+
+def formatar_mensagem(evento):
+    """Linha de console do evento (mesmas mensagens que a simulação imprimia)"""
+    if evento.codigo == NOITE:
+        return f"   ⏰ Dia {evento.dia} - Recarregando durante a noite"
+    if evento.codigo == NOITE_APOS_RECARGA:
+        return f"   ⏰ Dia {evento.dia} - Recarregando durante a noite (após recarga)"
+    if evento.codigo == DIAS_EXCEDIDOS:
+        return f"   🚨 {formatar_alerta(evento).split(': ', 1)[1]}"
+    return f"   ⚠️ {formatar_alerta(evento)}"
+
+
+class SinkNulo:
+    """Descarta os eventos (avaliação do algoritmo genético)"""
+
+    def emitir(self, evento):
+        pass
+
+    def __repr__(self):
+        return "SinkNulo()"
+
+
+class SinkConsole:
+    """Imprime cada evento no console, como a simulação fazia originalmente"""
+
+    def emitir(self, evento):
+        print(formatar_mensagem(evento))
+
+    def __repr__(self):
+        return "SinkConsole()"
+
+
+class SinkLista:
+    """Acumula os eventos recebidos (testes e análises)"""
+
+    def __init__(self):
+        self.eventos = []
+
+    def emitir(self, evento):
+        self.eventos.append(evento)
+
+    def __repr__(self):
+        return f"SinkLista({len(self.eventos)} eventos)"
+
+
+# Instância compartilhada usada por padrão
+SINK_NULO = SinkNulo()
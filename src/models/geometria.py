@@ -0,0 +1,80 @@
+import numpy as np
+from .coordenada import RegistroCoordenadas
+
+
+class MatrizGeometria:
+    """Geometria pré-calculada entre todos os pares ordenados de coordenadas.
+
+    Guarda, para cada par (i, j), a distância Haversine em km, a direção do
+    voo em graus (0 = Norte, 90 = Leste) e o vetor unitário da direção do voo
+    (componentes x = leste, y = norte). É construída uma única vez a partir da
+    saída de carregar_coordenadas; trechos passam a ser consultados por índice
+    em vez de recalcular a trigonometria a cada voo.
+    """
+
+    RAIO_TERRA = 6371  # km
+
+    def __init__(self, coordenadas):
+        # Uma linha por CEP distinto (o Unibrasil aparece no início e no fim
+        # da rota, mas ocupa um único índice na matriz): o índice na matriz é
+        # o id da coordenada no registro
+        self.registro = RegistroCoordenadas(coordenadas)
+        self.coordenadas = self.registro.coordenadas
+
+        # Índice do Unibrasil (início/fim obrigatório da rota), se presente
+        self.indice_unibrasil = self.registro.indice_unibrasil
+
+        # Tipo compacto dos genomas (rotas como índices nesta matriz)
+        self.dtype_indices = np.uint16 if len(self.coordenadas) <= np.iinfo(np.uint16).max else np.int32
+
+        latitudes = np.radians([c.latitude for c in self.coordenadas])
+        longitudes = np.radians([c.longitude for c in self.coordenadas])
+
+        self.distancias = self._calcular_distancias(latitudes, longitudes)
+        self.direcoes = self._calcular_direcoes(latitudes, longitudes)
+
+        # Vetor unitário da direção do voo: (sin(direcao), cos(direcao))
+        direcoes_rad = np.radians(self.direcoes)
+        self.unitario_x = np.sin(direcoes_rad)
+        self.unitario_y = np.cos(direcoes_rad)
+
+    def _calcular_distancias(self, lat, lon):
+        """Versão vetorizada de distancia_haversine para todos os pares"""
+        dlat = lat[np.newaxis, :] - lat[:, np.newaxis]
+        dlon = lon[np.newaxis, :] - lon[:, np.newaxis]
+
+        a = (np.sin(dlat / 2) ** 2 +
+             np.cos(lat)[:, np.newaxis] * np.cos(lat)[np.newaxis, :] * np.sin(dlon / 2) ** 2)
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+        return self.RAIO_TERRA * c
+
+    def _calcular_direcoes(self, lat, lon):
+        """Versão vetorizada de calcular_direcao para todos os pares"""
+        dlon = lon[np.newaxis, :] - lon[:, np.newaxis]
+
+        x = np.sin(dlon) * np.cos(lat)[np.newaxis, :]
+        y = (np.cos(lat)[:, np.newaxis] * np.sin(lat)[np.newaxis, :] -
+             np.sin(lat)[:, np.newaxis] * np.cos(lat)[np.newaxis, :] * np.cos(dlon))
+
+        direcoes = np.degrees(np.arctan2(x, y))
+        return (direcoes + 360) % 360
+
+    def indice(self, coordenada):
+        """Retorna o índice (linha/coluna da matriz) de uma coordenada"""
+        return self.registro.id_de(coordenada)
+
+    def indices(self, coordenadas):
+        """Converte uma rota de coordenadas em lista de índices"""
+        id_de = self.registro.id_de
+        return [id_de(c) for c in coordenadas]
+
+    def contem(self, coordenada):
+        """Verifica se a coordenada faz parte da matriz"""
+        return coordenada in self.registro
+
+    def __len__(self):
+        return len(self.coordenadas)
+
+    def __repr__(self):
+        return f"MatrizGeometria({len(self.coordenadas)} pontos)"
@@ -1,15 +1,73 @@
 import random
-from ..models.trecho import Trecho
+import numpy as np
+from ..models.trecho import TrechosCompactos
+from ..models.geometria import MatrizGeometria
+from ..models.memoria_fitness import assinatura_config
+from ..models.eventos import (
+    Evento, SINK_NULO, NOITE, NOITE_APOS_RECARGA, POUSO_ATRASADO, POUSO_TAXA_TARDE,
+    DIAS_EXCEDIDOS, formatar_alerta
+)
+from ..algorithms.velocidade import (
+    calcular_trechos_velocidades, custos_velocidades, escolher_indice_velocidade
+)
 from ..config.settings import Config
 
 class Individuo:
     """Representa uma solução (rota completa) para o problema"""
     
-    def __init__(self, coordenadas, drone, gerenciador_vento):
-        self.coordenadas = coordenadas
+    # Bytes estimados de uma entrada do cache de trechos além dos arrays
+    # (tupla, cabeçalhos dos arrays e chave)
+    _BYTES_FIXOS_ENTRADA_CACHE = 400
+
+    def __init__(self, coordenadas, drone, gerenciador_vento, geometria=None, cache_trechos=None,
+                 tabela_tempos=None, sink_eventos=None):
+        # Geometria compartilhada pela população; se não for informada (ex.:
+        # rotas avulsas em testes/scripts), monta uma só para esta rota.
+        if geometria is None:
+            geometria = MatrizGeometria(coordenadas)
+        genoma = np.array(geometria.indices(coordenadas), dtype=geometria.dtype_indices)
+        self._inicializar(genoma, drone, gerenciador_vento, geometria, cache_trechos,
+                          tabela_tempos=tabela_tempos)
+        self._coordenadas = coordenadas
+        if sink_eventos is not None:
+            self.sink_eventos = sink_eventos
+
+    @classmethod
+    def de_genoma(cls, genoma, drone, gerenciador_vento, geometria, cache_trechos=None,
+                  validar=True, tabela_tempos=None):
+        """Cria indivíduo diretamente a partir da permutação de índices (genoma).
+
+        validar=False pula _validar_rota: use apenas para genomas válidos por
+        construção (embaralhamentos e operadores que preservam a permutação).
+        """
+        individuo = cls.__new__(cls)
+        individuo._inicializar(np.asarray(genoma, dtype=geometria.dtype_indices), drone,
+                               gerenciador_vento, geometria, cache_trechos, validar,
+                               tabela_tempos)
+        return individuo
+
+    def _inicializar(self, genoma, drone, gerenciador_vento, geometria, cache_trechos,
+                     validar=True, tabela_tempos=None):
+        # Genoma: rota como índices na MatrizGeometria (inclui o Unibrasil nas
+        # pontas). É a única parte própria do indivíduo; drone, vento,
+        # geometria e cache são apenas referenciados.
+        self.genoma = genoma
+        self._coordenadas = None
         self.drone = drone
         self.gerenciador_vento = gerenciador_vento
-        self.trechos = []
+        self.geometria = geometria
+        # Cache LRU de resultados de trechos compartilhado pela execução (opcional)
+        self.cache_trechos = cache_trechos
+        # Tabela pré-calculada de tempos de voo (opcional, ver TabelaTemposVoo)
+        self.tabela_tempos = tabela_tempos
+        # Destino dos eventos da simulação (viradas de dia, pousos fora do
+        # horário...); o padrão descarta, como na avaliação do algoritmo
+        # genético. Use SinkConsole para acompanhar a simulação no console.
+        self.sink_eventos = SINK_NULO
+        # Trechos da última simulação em formato compacto; objetos Trecho só
+        # são montados sob demanda (ver propriedade trechos)
+        self._registro_trechos = TrechosCompactos()
+        self._trechos_materializados = None
         self.fitness = float('inf')
         self.viabilidade = True
         self.penalidades = 0
@@ -21,60 +79,162 @@ class Individuo:
         self.numero_pousos = 0
         self.pousos_taxa_tarde = 0
         self.dias_utilizados = 0
-        # Alertas e detalhes de pousos atrasados
-        self.alertas = []  # Lista de strings com avisos gerados durante a simulação
+        # Alertas (eventos tipados; o texto é montado só em alertas) e
+        # detalhes de pousos atrasados
+        self.eventos = []  # Eventos de CODIGOS_ALERTA gerados durante a simulação
+        self._dias_alertados = False  # alerta de dias excedidos já emitido
         self.pousos_atrasados = []  # Lista detalhada de pousos que ocorreram fora do horário
+        self.lista_recargas = []  # (dia, hora_minutos, cep, taxa_bool) de cada recarga
+        # Simulação incremental: checkpoints do estado a cada
+        # Config.INTERVALO_CHECKPOINT_SIMULACAO trechos e, para filhos de
+        # mutação, o pai/posição de onde retomar
+        self._checkpoints = []
+        self._origem_delta = None
+        self._prefixo_pai = None
+        self.trechos_retomados = 0
+        # Assinatura de Config da última avaliação (None = não avaliado)
+        self.assinatura_avaliacao = None
+        # Plano de voo fixo (ver OtimizadorPlanoVoo): (índices de velocidade,
+        # recargas antes de cada trecho). None = escolha gulosa trecho a trecho
+        self.plano_voo = None
+
+        if validar:
+            self._validar_rota()
+        # Estado após a validação estrutural; cada simulação parte dele
+        self._viabilidade_rota = self.viabilidade
+        self._penalidades_rota = self.penalidades
 
-        self._validar_rota()
+    @property
+    def coordenadas(self):
+        """Rota como lista de Coordenada (montada a partir do genoma sob demanda)"""
+        if self._coordenadas is None:
+            pontos = self.geometria.coordenadas
+            self._coordenadas = [pontos[i] for i in self.genoma.tolist()]
+        return self._coordenadas
+
+    @property
+    def alertas(self):
+        """Alertas da última simulação como texto (formatados sob demanda)"""
+        return [formatar_alerta(evento) for evento in self.eventos]
+
+    @property
+    def trechos(self):
+        """Trechos da última simulação como objetos Trecho (montados sob demanda,
+        ex.: exportação e Simulador; a avaliação usa só o registro compacto)"""
+        if self._trechos_materializados is None:
+            self._trechos_materializados = self._registro_trechos.materializar(
+                self.coordenadas, self.gerenciador_vento, self.geometria)
+        return self._trechos_materializados
+
+    @property
+    def num_trechos(self):
+        """Número de trechos simulados (sem materializar objetos Trecho)"""
+        return len(self._registro_trechos)
+
+    def clonar(self):
+        """Cópia barata: copia o genoma e os resultados, referenciando os objetos
+        compartilhados (drone, vento, geometria, cache) e os trechos já avaliados"""
+        copia = self.__class__.__new__(self.__class__)
+        copia.__dict__.update(self.__dict__)
+        copia.genoma = self.genoma.copy()
+        # O registro compacto não muda depois da simulação: pode ser compartilhado
+        copia._trechos_materializados = None
+        copia.eventos = list(self.eventos)
+        copia.pousos_atrasados = list(self.pousos_atrasados)
+        copia.lista_recargas = list(self.lista_recargas)
+        copia._checkpoints = list(self._checkpoints)
+        copia._origem_delta = None
+        return copia
     
     def _validar_rota(self):
         """Valida restrições básicas da rota"""
+        indice_unibrasil = self.geometria.indice_unibrasil
+        
         # Deve começar e terminar no Unibrasil
-        if not self.coordenadas[0].eh_unibrasil():
+        if self.genoma[0] != indice_unibrasil:
             self.viabilidade = False
             self.penalidades += 10000
         
-        if not self.coordenadas[-1].eh_unibrasil():
+        if self.genoma[-1] != indice_unibrasil:
             self.viabilidade = False
             self.penalidades += 10000
         
-        # Não pode ter CEPs repetidos (exceto Unibrasil no início/fim)
-        ceps_vistos = set()
-        for coord in self.coordenadas[1:-1]:  # Excluir início e fim
-            if coord.cep in ceps_vistos:
-                self.viabilidade = False
-                self.penalidades += 5000
-            ceps_vistos.add(coord.cep)
+        # Não pode ter CEPs repetidos (exceto Unibrasil no início/fim): cada
+        # repetição de um ponto já visto custa 5000. Contagem por índice em
+        # O(n): repetidos = posições - índices distintos
+        interior = self.genoma[1:-1]
+        distintos = np.count_nonzero(np.bincount(interior, minlength=len(self.geometria)))
+        repetidos = len(interior) - distintos
+        if repetidos:
+            self.viabilidade = False
+            self.penalidades += 5000 * repetidos
     
     def simular_rota(self):
-        """Simula a execução completa da rota"""
+        """Simula a execução da rota.
+
+        Se o indivíduo foi criado por uma mutação (ver definir_origem_delta) e
+        o pai guardou checkpoints compatíveis, a simulação retoma do último
+        checkpoint anterior à primeira posição alterada; caso contrário,
+        simula a rota inteira a partir do trecho 0.
+        """
+        # Penalidades/viabilidade voltam ao resultado da validação da rota, para
+        # que simular de novo (ex.: cópia do elitismo) não acumule penalidades
+        self.viabilidade = self._viabilidade_rota
+        self.penalidades = self._penalidades_rota
+        self.assinatura_avaliacao = assinatura_config()
+        self.trechos_retomados = 0
+        self._trechos_materializados = None
+        checkpoint = self._checkpoint_de_retomada()
         if not self.viabilidade:
             return
         
-        # Relógio absoluto (minutos desde o início da simulação)
-        dia_atual = 1
-        minutos_abs = 0  # minutos decorridos desde o início (0 = início em HORA_INICIO do dia 1)
-        hora_atual = (Config.HORA_INICIO + minutos_abs) % (24 * 60)
-        bateria_atual = self.drone.calcular_autonomia(36)
-        # Reset acumuladores/métricas antes de simular para evitar acumular
-        # resultados de simulações anteriores (bug: antes não zerávamos
-        # distancia_total/tempo_total/pousos_taxa_tarde etc.)
-        self.trechos = []
-        self.distancia_total = 0
-        self.tempo_total = 0
-        self.numero_pousos = 0
+        if checkpoint is not None:
+            # Retomar: restaura relógio, bateria e métricas acumuladas do pai
+            inicio = checkpoint[0]
+            (dia_atual, minutos_abs, hora_atual, bateria_atual) = checkpoint[1:5]
+            self._restaurar_checkpoint(checkpoint)
+            self.trechos_retomados = inicio
+        else:
+            inicio = 0
+            # Relógio absoluto (minutos desde o início da simulação)
+            dia_atual = 1
+            minutos_abs = 0  # minutos decorridos desde o início (0 = início em HORA_INICIO do dia 1)
+            hora_atual = (Config.HORA_INICIO + minutos_abs) % (24 * 60)
+            bateria_atual = self.drone.calcular_autonomia(36)
+            # Reset acumuladores/métricas antes de simular para evitar acumular
+            # resultados de simulações anteriores (bug: antes não zerávamos
+            # distancia_total/tempo_total/pousos_taxa_tarde etc.)
+            self._registro_trechos = TrechosCompactos()
+            self.distancia_total = 0
+            self.tempo_total = 0
+            self.numero_pousos = 0
+            self.pousos_taxa_tarde = 0
+            # Reset de alertas/detalhes
+            self.eventos = []
+            self._dias_alertados = False
+            self.pousos_atrasados = []
+            # Lista detalhada de recargas: tuplas (dia, hora_minutos, cep, taxa_tarde_bool)
+            self.lista_recargas = []
+            self._checkpoints = []
         self.custo_total = 0
-        self.pousos_taxa_tarde = 0
         self.dias_utilizados = 0
-        # Reset de alertas/detalhes
-        self.alertas = []
-        self.pousos_atrasados = []
-        # Lista detalhada de recargas: tuplas (dia, hora_minutos, cep, taxa_tarde_bool)
-        self.lista_recargas = []
         
-        for i in range(len(self.coordenadas) - 1):
-            origem = self.coordenadas[i]
-            destino = self.coordenadas[i + 1]
+        intervalo_checkpoint = Config.INTERVALO_CHECKPOINT_SIMULACAO
+        coordenadas = self.coordenadas
+        genoma = self.genoma.tolist()
+        distancias = self.geometria.distancias
+        for i in range(inicio, len(coordenadas) - 1):
+            origem = coordenadas[i]
+            
+            # Checkpoint compacto do estado antes do trecho i (usado pelos filhos)
+            if i % intervalo_checkpoint == 0:
+                self._checkpoints.append((
+                    i, dia_atual, minutos_abs, hora_atual, bateria_atual,
+                    self.distancia_total, self.tempo_total, self.numero_pousos,
+                    self.pousos_taxa_tarde, self.penalidades,
+                    len(self.eventos), len(self.pousos_atrasados), len(self.lista_recargas),
+                    self._dias_alertados
+                ))
             
             # Verificar se precisa dormir (após HORA_FIM)
             if hora_atual >= Config.HORA_FIM and dia_atual < Config.DIAS_MAXIMOS:
@@ -84,20 +244,24 @@ class Individuo:
                 minutos_abs += minutos_ate_reinicio
                 dia_atual += 1
                 hora_atual = (Config.HORA_INICIO + minutos_abs) % (24 * 60)
-                print(f"   ⏰ Dia {dia_atual} - Recarregando durante a noite")
-            
-            # Escolher velocidade para este trecho (considera vento e bateria)
-            velocidade = self._escolher_velocidade_otima(origem, destino, bateria_atual, dia_atual, hora_atual)
+                self.sink_eventos.emitir(Evento(NOITE, dia_atual))
             
-            # Obter vento atual
-            vento = self.gerenciador_vento.get_vento(dia_atual, hora_atual)
-            
-            # Criar trecho
-            trecho = Trecho(origem, destino, velocidade, dia_atual, hora_atual, 
-                           vento['velocidade'], vento['direcao'])
+            # Escolher velocidade para este trecho (considera vento e bateria);
+            # o tempo de voo vem do mesmo kernel, sem montar um objeto Trecho
+            if self.plano_voo is None:
+                velocidade, tempo_voo = self._escolher_velocidade_trecho(
+                    genoma[i], genoma[i + 1], bateria_atual, dia_atual, hora_atual)
+                recarga_planejada = False
+            else:
+                indice = self.plano_voo[0].item(i)
+                tempos, _ = self._tempos_trecho(genoma[i], genoma[i + 1], dia_atual, hora_atual)
+                velocidade, tempo_voo = self.drone.velocidades.item(indice), tempos.item(indice)
+                recarga_planejada = self.plano_voo[1].item(i)
+            dia_partida, hora_partida = dia_atual, hora_atual
 
-            # Verificar se precisa recarregar
-            if trecho.precisa_recarregar(bateria_atual):
+            # Verificar se precisa recarregar (consumo de bateria = tempo de voo)
+            recarregou = tempo_voo > bateria_atual or recarga_planejada
+            if recarregou:
                 # Processar recarga (registra se há taxa tarde) - usamos minutos_abs
                 taxa = self._processar_recarga(origem, minutos_abs)
                 # Recarregar via Drone (fonte de verdade)
@@ -116,15 +280,15 @@ class Individuo:
                 self.lista_recargas.append((rec_dia, rec_hora, origem.cep, taxa))
                 # Registrar pouso atrasado se fora do horário de operação
                 if rec_hora >= Config.HORA_FIM:
-                    aviso = f"Pouso atrasado: dia {rec_dia}, hora {rec_hora} min, CEP {origem.cep}"
-                    self.alertas.append(aviso)
+                    evento = Evento(POUSO_ATRASADO, rec_dia, rec_hora, origem.cep)
+                    self.eventos.append(evento)
                     self.pousos_atrasados.append((rec_dia, rec_hora, origem.cep, 'fora_horario'))
-                    print(f"   ⚠️ {aviso}")
+                    self.sink_eventos.emitir(evento)
                 # Registrar pouso que teve taxa extra (após HORA_TAXA_EXTRA)
                 if taxa:
-                    aviso_taxa = f"Pouso com taxa tarde: dia {rec_dia}, hora {rec_hora} min, CEP {origem.cep}"
-                    self.alertas.append(aviso_taxa)
-                    print(f"   ⚠️ {aviso_taxa}")
+                    evento = Evento(POUSO_TAXA_TARDE, rec_dia, rec_hora, origem.cep)
+                    self.eventos.append(evento)
+                    self.sink_eventos.emitir(evento)
                 # Avançar o tempo pela duração da recarga (em minutos)
                 minutos_abs += Config.TEMPO_RECARGA
                 # Atualizar hora_atual com base no relógio absoluto
@@ -136,11 +300,11 @@ class Individuo:
                     minutos_abs += minutos_ate_fim_dia + Config.HORA_INICIO
                     dia_atual += 1
                     hora_atual = (Config.HORA_INICIO + minutos_abs) % (24 * 60)
-                    print(f"   ⏰ Dia {dia_atual} - Recarregando durante a noite (após recarga)")
+                    self.sink_eventos.emitir(Evento(NOITE_APOS_RECARGA, dia_atual))
             
             # Executar trecho: avançar tempo absoluto e reduzir bateria
-            bateria_atual -= trecho.consumo_bateria
-            minutos_voo = trecho.tempo_voo_segundos // 60
+            bateria_atual -= tempo_voo
+            minutos_voo = tempo_voo // 60
             minutos_abs += minutos_voo
             # Atualizar hora_atual com base no relógio absoluto
             hora_atual = (Config.HORA_INICIO + minutos_abs) % (24 * 60)
@@ -156,10 +320,11 @@ class Individuo:
             # configurável: hard-invalidade ou penalidade suave por dia excedido.
             if dias_ate_agora > Config.DIAS_MAXIMOS:
                 # Registrar alerta apenas uma vez
-                if 'dias_excedidos' not in [a.split(':')[0] for a in self.alertas]:
-                    aviso_dias = f"Dias utilizados excederam o máximo: {dias_ate_agora} dias (limite {Config.DIAS_MAXIMOS})"
-                    self.alertas.append('dias_excedidos: ' + aviso_dias)
-                    print(f"   🚨 {aviso_dias}")
+                if not self._dias_alertados:
+                    self._dias_alertados = True
+                    evento = Evento(DIAS_EXCEDIDOS, dias_ate_agora, limite=Config.DIAS_MAXIMOS)
+                    self.eventos.append(evento)
+                    self.sink_eventos.emitir(evento)
 
                 # Se modo hard estiver ativado, manter comportamento antigo
                 if getattr(Config, 'HARD_DIAS_MAX', False):
@@ -178,12 +343,12 @@ class Individuo:
                     self.penalidades += 10000 * excess_days
 
             # Aplicar penalidades normais (sem checagem rígida de dias aqui)
-            self._aplicar_penalidades(trecho, hora_atual, dias_ate_agora)
+            self._aplicar_penalidades(None, hora_atual, dias_ate_agora)
             
             # Atualizar métricas
-            self.trechos.append(trecho)
-            self.distancia_total += trecho.distancia
-            self.tempo_total += trecho.tempo_voo_segundos / 60  # Converter para minutos
+            self._registro_trechos.adicionar(velocidade, dia_partida, hora_partida, recarregou)
+            self.distancia_total += distancias.item(genoma[i], genoma[i + 1])
+            self.tempo_total += tempo_voo / 60  # Converter para minutos
         
         # Ao final da simulação, calcular custo total com base em tempo e recargas
         # Ao final da simulação, calcular custo total com base em tempo e recargas
@@ -203,73 +368,115 @@ class Individuo:
         self.dias_utilizados = int(dias_passados) + 1
 
     
+    def definir_origem_delta(self, pai, primeira_posicao_alterada):
+        """Marca este indivíduo como variação de pai a partir de uma posição.
+
+        Tudo antes de primeira_posicao_alterada é idêntico ao pai, então
+        simular_rota() pode retomar do checkpoint do pai em vez do trecho 0.
+        """
+        self._origem_delta = (pai, primeira_posicao_alterada)
+    
+    def _checkpoint_de_retomada(self):
+        """Retorna o checkpoint do pai de onde retomar (ou None)"""
+        origem, self._origem_delta = self._origem_delta, None
+        if origem is None:
+            return None
+        
+        pai, posicao = origem
+        # O trecho posicao-1 (posicao-1 → posicao) é o primeiro que muda
+        indice = (posicao - 1) // Config.INTERVALO_CHECKPOINT_SIMULACAO
+        # O prefixo de um pai com plano de voo não é o da escolha gulosa
+        if (indice < 0 or indice >= len(pai._checkpoints) or pai.plano_voo is not None or
+                pai.assinatura_avaliacao != self.assinatura_avaliacao or
+                not np.array_equal(pai.genoma[:posicao], self.genoma[:posicao])):
+            return None
+        
+        # Guardar o prefixo do pai (listas e checkpoints) antes de retomar
+        self._prefixo_pai = pai
+        return pai._checkpoints[indice]
+    
+    def _restaurar_checkpoint(self, checkpoint):
+        """Restaura métricas e listas do pai até o checkpoint"""
+        pai, self._prefixo_pai = self._prefixo_pai, None
+        (inicio, _, _, _, _, self.distancia_total, self.tempo_total, self.numero_pousos,
+         self.pousos_taxa_tarde, self.penalidades, n_eventos, n_atrasados, n_recargas,
+         self._dias_alertados) = checkpoint
+        
+        self._registro_trechos = pai._registro_trechos.prefixo(inicio)
+        self.eventos = pai.eventos[:n_eventos]
+        self.pousos_atrasados = pai.pousos_atrasados[:n_atrasados]
+        self.lista_recargas = pai.lista_recargas[:n_recargas]
+        # O checkpoint de retomada é gravado de novo no primeiro trecho do laço
+        self._checkpoints = pai._checkpoints[:inicio // Config.INTERVALO_CHECKPOINT_SIMULACAO]
     
     def _escolher_velocidade_otima(self, origem, destino, bateria_atual, dia, hora):
         """Escolhe velocidade que minimize tempo dentro das restrições de bateria.
 
-        A estratégia atual é testar todas as velocidades válidas e escolher a
-        que produz o menor tempo de voo (considerando vento) sem exigir
-        recarga antes do trecho. Se nenhuma velocidade for viável, retorna
-        a velocidade mínima (forçando a recarga depois).
+        Todas as velocidades válidas são pontuadas de uma só vez pelo kernel
+        vetorizado (custo = alpha * tempo + beta * consumo, considerando vento)
+        e escolhe-se a de menor custo que não exige recarga antes do trecho.
+        Se nenhuma velocidade for viável, retorna a velocidade mínima
+        (forçando a recarga depois).
         """
-        from ..models.trecho import Trecho
+        velocidade, _ = self._escolher_velocidade_trecho(
+            self.geometria.indice(origem), self.geometria.indice(destino), bateria_atual, dia, hora
+        )
+        return velocidade
 
-        # Gera lista de velocidades válidas (múltiplos de 4 entre min/max)
-        velocidades_validas = sorted(self.drone.get_velocidades_validas(), reverse=True)
+    def _escolher_velocidade_trecho(self, i, j, bateria_atual, dia, hora):
+        """Retorna (velocidade, tempo_voo_segundos) escolhidos para o trecho i→j"""
+        tempos, consumos_percentuais = self._tempos_trecho(i, j, dia, hora)
+        custos, viaveis = custos_velocidades(
+            tempos, consumos_percentuais, bateria_atual,
+            Config.HEURISTICA_ALPHA, Config.HEURISTICA_BETA
+        )
 
-        # Obter vento no momento (mesma chamada que será usada ao criar o trecho)
-        vento = self.gerenciador_vento.get_vento(dia, hora)
+        indice = escolher_indice_velocidade(custos, viaveis)
+        if indice is None:
+            # Nenhuma viável: velocidade mínima (primeira de drone.velocidades)
+            indice = 0
+        return self.drone.velocidades.item(indice), tempos.item(indice)
 
-        melhor_velocidade = None
-        menor_custo = float('inf')
-        # Pequena tolerância para desempate: se dois custos forem muito próximos,
-        # preferimos a velocidade maior (mais rápida) para cumprir a rota antes.
-        EPS_DESEMPATE = 0.01  # unidades de custo (aprox 0.01 minuto)
+    def _tempos_trecho(self, i, j, dia, hora):
+        """(tempos_segundos, consumos_percentuais) do trecho i→j em todas as velocidades"""
+        if self.tabela_tempos is not None:
+            # Tempos da tabela pré-calculada; consumo como em calcular_trechos_velocidades
+            tempos = self.tabela_tempos.tempos_trecho(i, j, dia, hora)
+            return tempos, (tempos / self.drone.autonomias) * 100.0
+        _, tempos, consumos_percentuais = self._resultados_trecho(i, j, dia, hora)
+        return tempos, consumos_percentuais
 
-        # Heurística: custo = alpha * tempo + beta * consumo
-        alpha = Config.HEURISTICA_ALPHA
-        beta = Config.HEURISTICA_BETA
+    def _resultados_trecho(self, i, j, dia, hora):
+        """Resultados do trecho i→j em todas as velocidades válidas.
 
-        for v in velocidades_validas:
-            try:
-                trecho = Trecho(origem, destino, v, dia, hora, vento['velocidade'], vento['direcao'])
-            except Exception:
-                # Se cálculo do trecho falhar (ex: divisão por zero), pular essa velocidade
-                continue
+        Retorna (velocidades_efetivas, tempos_segundos, consumos_percentuais).
+        O resultado depende só do par e da faixa de vento (dia + faixa
+        horária), então é consultado/guardado no cache LRU compartilhado
+        quando ele existe.
+        """
+        chave = None
+        if self.cache_trechos is not None:
+            chave = (i, j, dia, self.gerenciador_vento.indice_faixa(hora))
+            resultado = self.cache_trechos.obter(chave)
+            if resultado is not None:
+                return resultado
 
-            # Se precisa recarregar antes do trecho, não é viável nessa velocidade
-            if trecho.precisa_recarregar(bateria_atual):
-                continue
+        # Componentes do vento no momento (tabela densa pré-compilada) e
+        # projeção na direção do voo (mesma conta feita em Trecho)
+        vento_x, vento_y = self.gerenciador_vento.get_componentes(dia, hora)
+        v_vento_proj = (vento_x * self.geometria.unitario_x.item(i, j) +
+                        vento_y * self.geometria.unitario_y.item(i, j))
 
-            # Normalizar termos:
-            # - tempo em minutos (mais intuitivo que segundos)
-            # - consumo em porcentagem da autonomia disponível na velocidade v
-            tempo_min = trecho.tempo_voo_segundos / 60.0
-            try:
-                autonomia_v = self.drone.calcular_autonomia(v)
-                consumo_percent = (trecho.consumo_bateria / autonomia_v) * 100.0
-            except Exception:
-                consumo_percent = float('inf')
-
-            # Custo linear com termos normalizados
-            custo = alpha * tempo_min + beta * consumo_percent
-
-            # Se o custo for claramente melhor, escolhe; em caso de empate
-            # dentro de EPS_DESEMPATE, escolhe a velocidade maior (já que
-            # iteramos em ordem decrescente, isso favorece velocidades maiores).
-            if custo < menor_custo - EPS_DESEMPATE:
-                menor_custo = custo
-                melhor_velocidade = v
-            elif abs(custo - menor_custo) <= EPS_DESEMPATE:
-                # desempate: preferir velocidade maior
-                if melhor_velocidade is None or v > melhor_velocidade:
-                    melhor_velocidade = v
-
-        # Se nenhuma velocidade foi viável, retorna velocidade mínima (forçar recarga)
-        if melhor_velocidade is None:
-            return self.drone.config.VELOCIDADE_MINIMA
-
-        return melhor_velocidade
+        resultado = calcular_trechos_velocidades(
+            self.geometria.distancias.item(i, j), v_vento_proj,
+            self.drone.velocidades, self.drone.autonomias
+        )
+
+        if chave is not None:
+            tamanho = sum(a.nbytes for a in resultado) + self._BYTES_FIXOS_ENTRADA_CACHE
+            self.cache_trechos.guardar(chave, resultado, tamanho)
+
+        return resultado
     
     def _processar_recarga(self, coordenada, minutos_abs):
         """Processa recarga da bateria usando o relógio absoluto (minutos_abs).
@@ -317,6 +524,34 @@ class Individuo:
         
         return self.fitness
     
+    # Resultados da avaliação transferidos entre processos (ver exportar_metricas)
+    _CAMPOS_METRICAS = (
+        'fitness', 'viabilidade', 'penalidades', 'distancia_total', 'tempo_total',
+        'custo_total', 'numero_pousos', 'pousos_taxa_tarde', 'dias_utilizados',
+        'lista_recargas', 'eventos', 'pousos_atrasados'
+    )
+
+    def exportar_metricas(self):
+        """Retorna as métricas da avaliação (sem trechos) como dict serializável"""
+        return {campo: getattr(self, campo) for campo in self._CAMPOS_METRICAS}
+
+    def aplicar_metricas(self, metricas):
+        """Aplica métricas calculadas em outro processo a este indivíduo.
+
+        Os trechos não são transferidos; se forem necessários (exportação ou
+        Simulador), basta chamar simular_rota() novamente.
+        """
+        for campo in self._CAMPOS_METRICAS:
+            setattr(self, campo, metricas[campo])
+        self._registro_trechos = TrechosCompactos()
+        self._trechos_materializados = None
+        self._checkpoints = []
+        self._origem_delta = None
+
+    def __deepcopy__(self, memo):
+        """deepcopy equivale a clonar(): objetos compartilhados nunca são duplicados"""
+        return self.clonar()
+    
     def __repr__(self):
         return (f"Individuo({len(self.coordenadas)} pontos, "
                 f"fit={self.fitness:.2f}, "
@@ -0,0 +1,70 @@
+import hashlib
+from .eventos import Evento
+from ..utils.cache import CacheLRU
+from ..config.settings import Config
+
+
+# Parâmetros de Config que alteram o resultado da simulação/fitness
+CAMPOS_CONFIG_AVALIACAO = (
+    'HEURISTICA_ALPHA', 'HEURISTICA_BETA', 'DIAS_MAXIMOS', 'HARD_DIAS_MAX',
+    'PENALIDADE_POR_DIA_EXCEDIDO', 'HORA_INICIO', 'HORA_FIM', 'HORA_TAXA_EXTRA',
+    'TEMPO_RECARGA', 'TAXA_BASEADA_EM', 'CUSTO_RECARGA', 'CUSTO_TAXA_TARDE',
+    'CUSTO_POR_MINUTO'
+)
+
+
+def assinatura_config():
+    """Valores atuais dos parâmetros de Config que influenciam a avaliação"""
+    return tuple(getattr(Config, campo, None) for campo in CAMPOS_CONFIG_AVALIACAO)
+
+
+class MemoriaFitness(CacheLRU):
+    """
+    Memória das avaliações de rotas já simuladas em uma execução.
+
+    A chave é o hash da sequência de pontos da rota (genoma) junto com os
+    valores de Config que influenciam a simulação; assim, rotas repetidas
+    entre gerações (elitismo, filhos sem crossover) reaproveitam as métricas
+    sem rodar simular_rota() de novo. O tamanho é limitado pelo LRU.
+    """
+
+    # Estimativa de bytes de uma entrada: dict de métricas + itens das listas
+    _BYTES_BASE = 1024
+    _BYTES_POR_ITEM_LISTA = 160
+
+    def __init__(self, max_bytes):
+        super().__init__(max_bytes)
+
+    def assinatura_config(self):
+        """Valores atuais dos parâmetros de Config relevantes"""
+        return assinatura_config()
+
+    def chave(self, genoma, assinatura=None):
+        """Chave da rota: hash do genoma + assinatura de Config"""
+        if assinatura is None:
+            assinatura = self.assinatura_config()
+        resumo = hashlib.blake2b(genoma.tobytes(), digest_size=16).digest()
+        return (resumo, assinatura)
+
+    def guardar_metricas(self, chave, metricas):
+        """Guarda as métricas de Individuo.exportar_metricas()"""
+        itens = (len(metricas['lista_recargas']) + len(metricas['eventos']) +
+                 len(metricas['pousos_atrasados']))
+        self.guardar(chave, metricas, self._BYTES_BASE + self._BYTES_POR_ITEM_LISTA * itens)
+
+    def exportar_entradas(self):
+        """Entradas da configuração atual, da menos para a mais recente, em
+        formato serializável em JSON: [hash do genoma (hex), métricas]"""
+        assinatura = self.assinatura_config()
+        return [[resumo.hex(), metricas] for (resumo, assinatura_entrada), metricas in self.itens()
+                if assinatura_entrada == assinatura]
+
+    def importar_entradas(self, entradas):
+        """Inverso de exportar_entradas (mesma ordem de uso e mesmo tamanho)"""
+        assinatura = self.assinatura_config()
+        for resumo, metricas in entradas:
+            metricas = dict(metricas,
+                            lista_recargas=[tuple(r) for r in metricas['lista_recargas']],
+                            eventos=[Evento(*e) for e in metricas['eventos']],
+                            pousos_atrasados=[tuple(p) for p in metricas['pousos_atrasados']])
+            self.guardar_metricas((bytes.fromhex(resumo), assinatura), metricas)
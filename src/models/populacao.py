@@ -1,48 +1,169 @@
 import random
 from .individuo import Individuo
+from .geometria import MatrizGeometria
+from .avaliacao_paralela import AvaliadorParalelo
+from .memoria_fitness import MemoriaFitness
+from .simulacao_lote import SimuladorLote
+from ..utils.cache import CacheLRU
+from ..algorithms.semeadura import gerar_sementes
+from ..config.settings import Config
 
 class Populacao:
     """Representa uma população de indivíduos (rotas)"""
     
-    def __init__(self, coordenadas, drone, gerenciador_vento, tamanho=50):
+    MOTORES = ('individuo', 'lote')
+    
+    def __init__(self, coordenadas, drone, gerenciador_vento, tamanho=50, geometria=None,
+                 workers=1, fracao_semeada=None, motor='individuo', tabela_tempos=None):
         self.coordenadas = coordenadas
         self.drone = drone
         self.gerenciador_vento = gerenciador_vento
+        # Matriz de distâncias/direções calculada uma única vez por execução
+        self.geometria = geometria if geometria is not None else MatrizGeometria(coordenadas)
+        # Resultados de trechos por (par, dia, faixa de vento) compartilhados
+        # por todos os indivíduos da execução
+        self.cache_trechos = CacheLRU(Config.CACHE_TRECHOS_MAX_BYTES)
+        # Tabela pré-calculada de tempos de voo (opcional, ver TabelaTemposVoo);
+        # quando existe, substitui o cálculo dos trechos nos motores locais
+        self.tabela_tempos = tabela_tempos
+        # Métricas de rotas já avaliadas (evita re-simular cópias entre gerações)
+        self.memoria_fitness = MemoriaFitness(Config.MEMO_FITNESS_MAX_BYTES)
+        # Contadores da última chamada a avaliar_populacao
+        self.ultima_avaliacao = {'memo_acertos': 0, 'simulacoes': 0, 'trechos_retomados': 0}
         self.tamanho = tamanho
+        # Fração da população inicial construída por heurísticas
+        self.fracao_semeada = Config.FRACAO_SEMEADURA if fracao_semeada is None else fracao_semeada
+        # Avaliação em pool de processos (opcional, workers > 1)
+        self.avaliador_paralelo = (AvaliadorParalelo(self.geometria, workers, drone,
+                                                     gerenciador_vento)
+                                   if workers > 1 else None)
+        # Motor de simulação: 'individuo' (Individuo.simular_rota, um por vez)
+        # ou 'lote' (SimuladorLote, toda a população em conjunto)
+        if motor not in self.MOTORES:
+            raise ValueError(f"Motor de simulação {motor} inválido")
+        self.motor = motor
+        self.simulador_lote = (SimuladorLote(drone, gerenciador_vento, self.geometria,
+                                             tabela_tempos)
+                               if motor == 'lote' else None)
         self.individuos = self._gerar_populacao_inicial()
         self.melhor_individuo = None
         self.pior_individuo = None
     
     def _gerar_populacao_inicial(self):
-        """Gera população inicial com rotas aleatórias"""
+        """Gera população inicial: parte semeada por heurísticas, resto aleatório"""
         individuos = []
         
-        for _ in range(self.tamanho):
-            # Garantir que começa e termina no Unibrasil
-            coordenadas_unibrasil = [c for c in self.coordenadas if c.eh_unibrasil()]
-            outras_coordenadas = [c for c in self.coordenadas if not c.eh_unibrasil()]
-            
-            # Embaralhar outras coordenadas
-            random.shuffle(outras_coordenadas)
-            
-            # Montar rota: Unibrasil + outras + Unibrasil
-            rota_coordenadas = coordenadas_unibrasil + outras_coordenadas + coordenadas_unibrasil
+        # Garantir que começa e termina no Unibrasil
+        indice_unibrasil = self.geometria.indice_unibrasil
+        inicio_fim = [] if indice_unibrasil is None else [indice_unibrasil]
+        outros_indices = [i for i in range(len(self.geometria)) if i != indice_unibrasil]
+        
+        # Rotas construtivas (distintas entre si) a partir da tabela de distâncias
+        quantidade_semeada = int(round(self.tamanho * self.fracao_semeada))
+        if indice_unibrasil is not None and quantidade_semeada > 0:
+            for rota in gerar_sementes(self.geometria.distancias, indice_unibrasil,
+                                       outros_indices, quantidade_semeada,
+                                       Config.CANDIDATOS_GULOSO_ALEATORIO):
+                individuos.append(self.individuo_de_genoma(rota, validar=False))
+        
+        while len(individuos) < self.tamanho:
+            # Embaralhar outros pontos
+            embaralhados = outros_indices.copy()
+            random.shuffle(embaralhados)
             
-            individuo = Individuo(rota_coordenadas, self.drone, self.gerenciador_vento)
+            # Montar rota: Unibrasil + outros + Unibrasil
+            individuo = self.individuo_de_genoma(inicio_fim + embaralhados + inicio_fim,
+                                                 validar=indice_unibrasil is None)
             individuos.append(individuo)
         
         return individuos
     
+    def novo_individuo(self, coordenadas):
+        """Cria indivíduo compartilhando drone, vento, geometria e cache da população"""
+        return Individuo(coordenadas, self.drone, self.gerenciador_vento,
+                         self.geometria, self.cache_trechos, self.tabela_tempos)
+    
+    def individuo_de_genoma(self, genoma, validar=True):
+        """Cria indivíduo a partir da rota como índices na geometria da população
+        (validar=False para genomas válidos por construção)"""
+        return Individuo.de_genoma(genoma, self.drone, self.gerenciador_vento,
+                                   self.geometria, self.cache_trechos, validar,
+                                   self.tabela_tempos)
+    
     def avaliar_populacao(self):
-        """Avalia todos os indivíduos da população"""
+        """Avalia todos os indivíduos da população.
+
+        Rotas já conhecidas (mesmo genoma e mesma configuração) recebem as
+        métricas da MemoriaFitness; apenas as demais são simuladas, uma vez
+        por rota distinta.
+        """
+        assinatura = self.memoria_fitness.assinatura_config()
+        pendentes = {}  # chave -> indivíduos com essa rota ainda não avaliada
+        planejados = []  # indivíduos com plano de voo (simulados neste processo)
+        memo_acertos = 0
+        
         for individuo in self.individuos:
+            # Cópia (clonar) de rota já avaliada com a mesma configuração:
+            # resultados, trechos e checkpoints já estão no próprio indivíduo
+            if individuo.assinatura_avaliacao == assinatura:
+                memo_acertos += 1
+                continue
+            
+            # A memória e os motores em lote/paralelo só conhecem a escolha
+            # gulosa de velocidades: rotas com plano de voo são simuladas aqui
+            if individuo.plano_voo is not None:
+                planejados.append(individuo)
+                continue
+            
+            chave = self.memoria_fitness.chave(individuo.genoma, assinatura)
+            metricas = self.memoria_fitness.obter(chave)
+            if metricas is not None:
+                individuo.aplicar_metricas(metricas)
+                individuo.assinatura_avaliacao = assinatura
+                memo_acertos += 1
+            else:
+                pendentes.setdefault(chave, []).append(individuo)
+        
+        # Simular um representante de cada rota distinta
+        representantes = [grupo[0] for grupo in pendentes.values()]
+        if self.avaliador_paralelo is not None:
+            self.avaliador_paralelo.avaliar(representantes)
+        elif self.simulador_lote is not None:
+            self.simulador_lote.avaliar(representantes)
+        else:
+            for individuo in representantes:
+                individuo.simular_rota()
+                individuo.calcular_fitness()
+        
+        for individuo in planejados:
             individuo.simular_rota()
             individuo.calcular_fitness()
         
-        self._atualizar_melhores()
+        for chave, grupo in pendentes.items():
+            metricas = grupo[0].exportar_metricas()
+            self.memoria_fitness.guardar_metricas(chave, metricas)
+            for individuo in grupo:
+                if individuo is not grupo[0]:
+                    individuo.aplicar_metricas(metricas)
+                individuo.assinatura_avaliacao = assinatura
+        
+        self.ultima_avaliacao = {
+            'memo_acertos': memo_acertos,
+            'simulacoes': len(representantes) + len(planejados),
+            # Trechos não re-simulados graças à retomada por checkpoint
+            'trechos_retomados': sum(ind.trechos_retomados for ind in representantes)
+        }
+        
+        self.atualizar_melhores()
+    
+    def encerrar(self):
+        """Libera recursos da avaliação paralela (se houver)"""
+        if self.avaliador_paralelo is not None:
+            self.avaliador_paralelo.encerrar()
     
-    def _atualizar_melhores(self):
-        """Atualiza melhor e pior indivíduo"""
+    def atualizar_melhores(self):
+        """Atualiza melhor e pior indivíduo (ex.: após substituir indivíduos já
+        avaliados, como na busca local)"""
         if self.individuos:
             individuos_validos = [ind for ind in self.individuos if ind.viabilidade]
             
@@ -68,7 +189,12 @@ class Populacao:
             'pior_fitness': max(fitness_values),
             'fitness_medio': sum(fitness_values) / len(fitness_values),
             'individuos_viaveis': individuos_viaveis,
-            'taxa_viabilidade': (individuos_viaveis / len(self.individuos)) * 100
+            'taxa_viabilidade': (individuos_viaveis / len(self.individuos)) * 100,
+            # Reaproveitamento da memória de fitness na última avaliação
+            'memo_acertos': self.ultima_avaliacao['memo_acertos'],
+            'simulacoes': self.ultima_avaliacao['simulacoes'],
+            'trechos_retomados': self.ultima_avaliacao['trechos_retomados'],
+            'memo_taxa_acerto': (self.ultima_avaliacao['memo_acertos'] / len(self.individuos)) * 100
         }
     
     def __len__(self):
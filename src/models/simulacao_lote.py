@@ -0,0 +1,248 @@
+import numpy as np
+from ..algorithms.velocidade import EPS_DESEMPATE
+from .memoria_fitness import assinatura_config
+from .eventos import Evento, POUSO_ATRASADO, POUSO_TAXA_TARDE, DIAS_EXCEDIDOS
+from ..config.settings import Config
+
+_MINUTOS_DIA = 24 * 60
+
+
+class SimuladorLote:
+    """
+    Simula a população inteira em paralelo, trecho a trecho.
+
+    As rotas ficam numa matriz de índices (uma linha por indivíduo) e o
+    estado da simulação (relógio, dia, bateria, métricas) em vetores NumPy.
+    Cada passo do laço processa o trecho i de todas as rotas de uma vez:
+    consulta do vento na tabela densa do GerenciadorVento, escolha
+    vetorizada de velocidade, máscaras de recarga e de virada de dia.
+    Eventos raros (recargas, alertas) são registrados por indivíduo. As
+    métricas são as mesmas de Individuo.simular_rota, com a mesma
+    aritmética elemento a elemento.
+    """
+
+    def __init__(self, drone, gerenciador_vento, geometria, tabela_tempos=None):
+        self.drone = drone
+        self.gerenciador_vento = gerenciador_vento
+        self.geometria = geometria
+        # Tabela pré-calculada de tempos de voo (opcional, ver TabelaTemposVoo)
+        self.tabela_tempos = tabela_tempos
+
+    def avaliar(self, individuos):
+        """Simula e calcula o fitness dos indivíduos, aplicando as métricas em cada um"""
+        assinatura = assinatura_config()
+        viaveis = []
+        for individuo in individuos:
+            if individuo._viabilidade_rota:
+                viaveis.append(individuo)
+            else:
+                # Rota estruturalmente inválida: simular_rota retorna de imediato
+                individuo.simular_rota()
+                individuo.calcular_fitness()
+
+        # Rotas de mesmo tamanho são simuladas juntas
+        por_tamanho = {}
+        for individuo in viaveis:
+            por_tamanho.setdefault(len(individuo.genoma), []).append(individuo)
+
+        for grupo in por_tamanho.values():
+            genomas = np.stack([ind.genoma for ind in grupo])
+            penalidades = [ind._penalidades_rota for ind in grupo]
+            for individuo, metricas in zip(grupo, self.simular(genomas, penalidades)):
+                if not metricas['viabilidade']:
+                    # calcular_fitness não altera o fitness de rotas inviáveis
+                    metricas['fitness'] = individuo.fitness
+                individuo.aplicar_metricas(metricas)
+                individuo.assinatura_avaliacao = assinatura
+                individuo.trechos_retomados = 0
+
+    def simular(self, genomas, penalidades_iniciais):
+        """
+        Simula as rotas (matriz [indivíduos, pontos] de índices) em conjunto.
+
+        penalidades_iniciais: penalidades da validação de cada rota.
+        Retorna uma lista de dicts no formato de Individuo.exportar_metricas.
+        """
+        num, pontos = genomas.shape
+        geometria = self.geometria
+        velocidades = self.drone.velocidades
+        autonomias = self.drone.autonomias
+        num_velocidades = len(velocidades)
+        coordenadas = geometria.coordenadas
+
+        hora_inicio = Config.HORA_INICIO
+        hora_fim = Config.HORA_FIM
+        dias_maximos = Config.DIAS_MAXIMOS
+        alpha = Config.HEURISTICA_ALPHA
+        beta = Config.HEURISTICA_BETA
+        hard_dias = getattr(Config, 'HARD_DIAS_MAX', False)
+        bateria_cheia = self.drone.calcular_autonomia(36)
+
+        # Estado de cada indivíduo
+        dia = np.ones(num, dtype=np.int64)
+        minutos_abs = np.zeros(num, dtype=np.int64)
+        hora = np.full(num, hora_inicio % _MINUTOS_DIA, dtype=np.int64)
+        bateria = np.full(num, bateria_cheia)
+        distancia_total = np.zeros(num)
+        tempo_total = np.zeros(num)
+        numero_pousos = np.zeros(num, dtype=np.int64)
+        pousos_taxa_tarde = np.zeros(num, dtype=np.int64)
+        penalidades = np.array(penalidades_iniciais, dtype=np.int64)
+        viabilidade = np.ones(num, dtype=bool)
+        # Indivíduos que ainda simulam (modo HARD_DIAS_MAX interrompe a rota)
+        ativos = np.ones(num, dtype=bool)
+        dias_alertados = np.zeros(num, dtype=bool)
+
+        eventos = [[] for _ in range(num)]
+        pousos_atrasados = [[] for _ in range(num)]
+        lista_recargas = [[] for _ in range(num)]
+
+        for i in range(pontos - 1):
+            linhas = np.flatnonzero(ativos)
+            if len(linhas) == 0:
+                break
+            origem = genomas[linhas, i]
+            destino = genomas[linhas, i + 1]
+
+            # Dormir se passou de HORA_FIM
+            h = hora[linhas]
+            d = dia[linhas]
+            m = minutos_abs[linhas]
+            dormir = (h >= hora_fim) & (d < dias_maximos)
+            if dormir.any():
+                m = np.where(dormir, m + (_MINUTOS_DIA - h) + hora_inicio, m)
+                d = np.where(dormir, d + 1, d)
+                h = (hora_inicio + m) % _MINUTOS_DIA
+
+            distancia = geometria.distancias[origem, destino]
+            if self.tabela_tempos is not None:
+                tempos = self.tabela_tempos.tempos_array(origem, destino, d, h)
+            else:
+                # Vento do dia/minuto atual (tabela densa) projetado na direção do voo
+                vento_x, vento_y = self.gerenciador_vento.get_vento_array(d, h)
+                v_vento_proj = (vento_x * geometria.unitario_x[origem, destino] +
+                                vento_y * geometria.unitario_y[origem, destino])
+
+                # Resultados em todas as velocidades (kernel de velocidade.py por linha)
+                velocidades_efetivas = velocidades[np.newaxis, :] + v_vento_proj[:, np.newaxis]
+                velocidades_efetivas = np.where(velocidades_efetivas <= 0, 0.1,
+                                                velocidades_efetivas)
+                tempos = ((distancia[:, np.newaxis] / velocidades_efetivas * 3600)
+                          .astype(np.int64) + 1)
+            consumos_percentuais = (tempos / autonomias) * 100.0
+            b = bateria[linhas]
+            custos = alpha * (tempos / 60.0) + beta * consumos_percentuais
+            viaveis = tempos <= b[:, np.newaxis]
+
+            # Escolha da velocidade: varredura decrescente com desempate (ver
+            # escolher_velocidade); sem viável fica a mínima (coluna 0)
+            menor_custo = np.full(len(linhas), np.inf)
+            escolha = np.zeros(len(linhas), dtype=np.int64)
+            for k in range(num_velocidades - 1, -1, -1):
+                aceita = viaveis[:, k] & (custos[:, k] < menor_custo - EPS_DESEMPATE)
+                menor_custo = np.where(aceita, custos[:, k], menor_custo)
+                escolha = np.where(aceita, k, escolha)
+            consumo = tempos[np.arange(len(linhas)), escolha]
+
+            # Recargas (antes do trecho)
+            recarregar = consumo > b
+            if recarregar.any():
+                for r in np.flatnonzero(recarregar).tolist():
+                    linha = linhas[r]
+                    absoluto = hora_inicio + int(m[r])
+                    rec_dia = 1 + absoluto // _MINUTOS_DIA
+                    rec_hora = absoluto % _MINUTOS_DIA
+                    if Config.TAXA_BASEADA_EM == 'end':
+                        hora_avaliacao = (rec_hora + Config.TEMPO_RECARGA) % _MINUTOS_DIA
+                    else:
+                        hora_avaliacao = rec_hora
+                    taxa = hora_avaliacao >= Config.HORA_TAXA_EXTRA
+                    cep = coordenadas[origem[r]].cep
+
+                    lista_recargas[linha].append((rec_dia, rec_hora, cep, taxa))
+                    if rec_hora >= hora_fim:
+                        eventos[linha].append(Evento(POUSO_ATRASADO, rec_dia, rec_hora, cep))
+                        pousos_atrasados[linha].append((rec_dia, rec_hora, cep, 'fora_horario'))
+                    if taxa:
+                        eventos[linha].append(Evento(POUSO_TAXA_TARDE, rec_dia, rec_hora, cep))
+                        pousos_taxa_tarde[linha] += 1
+                    numero_pousos[linha] += 1
+
+                b = np.where(recarregar, bateria_cheia, b)
+                m = np.where(recarregar, m + Config.TEMPO_RECARGA, m)
+                h = np.where(recarregar, (hora_inicio + m) % _MINUTOS_DIA, h)
+                # Recarga empurrou além do horário de operação: dormir
+                dormir = recarregar & (h >= hora_fim) & (d < dias_maximos)
+                if dormir.any():
+                    m = np.where(dormir, m + (_MINUTOS_DIA - h) + hora_inicio, m)
+                    d = np.where(dormir, d + 1, d)
+                    h = (hora_inicio + m) % _MINUTOS_DIA
+
+            # Executar trecho (voo + 1 minuto de parada para fotos)
+            b = b - consumo
+            m = m + consumo // 60 + 1
+            h = (hora_inicio + m) % _MINUTOS_DIA
+
+            bateria[linhas] = b
+            minutos_abs[linhas] = m
+            hora[linhas] = h
+            dia[linhas] = d
+
+            # Dias excedidos
+            dias_ate_agora = 1 + (hora_inicio + m) // _MINUTOS_DIA
+            excedidos = dias_ate_agora > dias_maximos
+            if excedidos.any():
+                for r in np.flatnonzero(excedidos & ~dias_alertados[linhas]).tolist():
+                    eventos[linhas[r]].append(
+                        Evento(DIAS_EXCEDIDOS, dias_ate_agora.item(r), limite=dias_maximos))
+                dias_alertados[linhas[excedidos]] = True
+
+                if hard_dias:
+                    # Rota interrompida neste trecho (sem custo/dias calculados)
+                    parados = linhas[excedidos]
+                    viabilidade[parados] = False
+                    penalidades[parados] += 100000
+                    ativos[parados] = False
+                    continuar = ~excedidos
+                    linhas, h, distancia, consumo = (linhas[continuar], h[continuar],
+                                                     distancia[continuar], consumo[continuar])
+                else:
+                    excesso = np.where(excedidos, dias_ate_agora - dias_maximos, 0)
+                    penalidades[linhas] += Config.PENALIDADE_POR_DIA_EXCEDIDO * excesso
+
+            # Penalidade por chegada após HORA_FIM (ver Individuo._aplicar_penalidades)
+            penalidades[linhas] += np.where(h > hora_fim, 1000, 0)
+
+            distancia_total[linhas] += distancia
+            tempo_total[linhas] += consumo / 60
+
+        custo_total = (tempo_total * Config.CUSTO_POR_MINUTO +
+                       numero_pousos * Config.CUSTO_RECARGA +
+                       pousos_taxa_tarde * Config.CUSTO_TAXA_TARDE)
+        dias_utilizados = (hora_inicio + minutos_abs) // _MINUTOS_DIA + 1
+
+        resultados = []
+        for k in range(num):
+            if ativos[k]:
+                custo = custo_total.item(k)
+                dias = dias_utilizados.item(k)
+            else:
+                custo, dias = 0, 0
+            resultados.append({
+                'fitness': custo + penalidades.item(k) if viabilidade[k] else float('inf'),
+                'viabilidade': bool(viabilidade[k]),
+                'penalidades': penalidades.item(k),
+                'distancia_total': distancia_total.item(k),
+                'tempo_total': tempo_total.item(k),
+                'custo_total': custo,
+                'numero_pousos': numero_pousos.item(k),
+                'pousos_taxa_tarde': pousos_taxa_tarde.item(k),
+                'dias_utilizados': dias,
+                'lista_recargas': lista_recargas[k],
+                'eventos': eventos[k],
+                'pousos_atrasados': pousos_atrasados[k]
+            })
+        return resultados
+
+    def __repr__(self):
+        return f"SimuladorLote({len(self.geometria)} pontos)"
@@ -0,0 +1,128 @@
+import time
+import numpy as np
+from ..utils.cache import CacheLRU
+from ..config.settings import Config
+
+
+class TabelaTemposVoo:
+    """
+    Tabela pré-calculada de tempos de voo (segundos, int32) por
+    [origem, destino, banda de vento, velocidade].
+
+    Uma banda é um vetor de vento distinto da previsão compilada pelo
+    GerenciadorVento (pares (dia, minuto) com o mesmo vento compartilham a
+    banda), então a tabela cobre todos os trechos possíveis da execução.
+    Se a tabela densa couber em max_bytes ela é montada de uma vez; senão só
+    os pares efetivamente voados são calculados, sob demanda ([banda,
+    velocidade] por par), e guardados num CacheLRU limitado a max_bytes. A
+    aritmética é a de calcular_trechos_velocidades, elemento a elemento.
+    """
+
+    # Bytes estimados de uma entrada do cache de pares além do array (chave,
+    # tupla interna e cabeçalho do array)
+    _BYTES_FIXOS_ENTRADA_PAR = 200
+
+    def __init__(self, geometria, drone, gerenciador_vento, max_bytes=None):
+        self.geometria = geometria
+        self.drone = drone
+        self.gerenciador_vento = gerenciador_vento
+        self.max_bytes = Config.TABELA_TEMPOS_MAX_BYTES if max_bytes is None else max_bytes
+
+        inicio = time.perf_counter()
+
+        # Bandas: vetores de vento distintos e a banda de cada (linha do dia, minuto)
+        componentes = np.stack([gerenciador_vento.vento_x.ravel(),
+                                gerenciador_vento.vento_y.ravel()], axis=1)
+        bandas, banda_por_posicao = np.unique(componentes, axis=0, return_inverse=True)
+        self.bandas_x = bandas[:, 0].copy()
+        self.bandas_y = bandas[:, 1].copy()
+        self.banda_por_minuto = banda_por_posicao.reshape(gerenciador_vento.vento_x.shape)
+
+        num_pontos = len(geometria)
+        num_velocidades = len(drone.velocidades)
+        self._bytes_par = len(self.bandas_x) * num_velocidades * np.dtype(np.int32).itemsize
+        self.densa = num_pontos * num_pontos * self._bytes_par <= self.max_bytes
+        if self.densa:
+            self.tempos = np.empty((num_pontos, num_pontos, len(self.bandas_x), num_velocidades),
+                                   dtype=np.int32)
+            for origem in range(num_pontos):
+                self.tempos[origem] = self._calcular(origem, slice(None))
+            self._pares = None
+        else:
+            self.tempos = None
+            self._pares = CacheLRU(self.max_bytes)
+
+        self.tempo_construcao = time.perf_counter() - inicio
+
+    def _calcular(self, origem, destinos):
+        """Tempos [destino, banda, velocidade] da origem para os destinos
+        (índice ou slice)"""
+        geometria = self.geometria
+        unitario_x = np.atleast_1d(geometria.unitario_x[origem, destinos])[:, np.newaxis]
+        unitario_y = np.atleast_1d(geometria.unitario_y[origem, destinos])[:, np.newaxis]
+        distancias = np.atleast_1d(geometria.distancias[origem, destinos])
+        # Vento de cada banda projetado na direção de cada voo (mesma conta de Trecho)
+        v_vento_proj = (self.bandas_x[np.newaxis, :] * unitario_x +
+                        self.bandas_y[np.newaxis, :] * unitario_y)
+        velocidades_efetivas = (self.drone.velocidades[np.newaxis, np.newaxis, :] +
+                                v_vento_proj[:, :, np.newaxis])
+        velocidades_efetivas = np.where(velocidades_efetivas <= 0, 0.1, velocidades_efetivas)
+        tempos = (distancias[:, np.newaxis, np.newaxis] / velocidades_efetivas * 3600)
+        return (tempos.astype(np.int64) + 1).astype(np.int32)
+
+    def _tempos_par(self, i, j):
+        """Tempos [banda, velocidade] do par i→j (modo sob demanda)"""
+        tempos = self._pares.obter((i, j))
+        if tempos is None:
+            tempos = self._calcular(i, j)[0]
+            self._pares.guardar((i, j), tempos, self._bytes_par + self._BYTES_FIXOS_ENTRADA_PAR)
+        return tempos
+
+    def banda(self, dia, hora_minutos):
+        """Banda de vento de dia e hora (minutos desde 00:00)"""
+        vento = self.gerenciador_vento
+        minuto = min(max(hora_minutos, 0), self.banda_por_minuto.shape[1] - 1)
+        return self.banda_por_minuto.item(vento._linha_dia(dia), minuto)
+
+    def tempos_trecho(self, i, j, dia, hora_minutos):
+        """Tempos (int32) do trecho i→j em todas as velocidades"""
+        banda = self.banda(dia, hora_minutos)
+        if self.densa:
+            return self.tempos[i, j, banda]
+        return self._tempos_par(i, j)[banda]
+
+    def tempos_array(self, origens, destinos, dias, minutos):
+        """Versão vetorizada de tempos_trecho: matriz [trechos, velocidades]"""
+        dias = np.asarray(dias)
+        linhas = np.where((dias >= 1) & (dias <= self.gerenciador_vento.dia_maximo), dias, 0)
+        bandas = self.banda_por_minuto[linhas,
+                                       np.clip(minutos, 0, self.banda_por_minuto.shape[1] - 1)]
+        if self.densa:
+            return self.tempos[origens, destinos, bandas]
+        return np.array([self._tempos_par(i, j)[banda] for i, j, banda in
+                         zip(np.asarray(origens).tolist(), np.asarray(destinos).tolist(),
+                             bandas.tolist())],
+                        dtype=np.int32).reshape(len(bandas), len(self.drone.velocidades))
+
+    @property
+    def bytes_usados(self):
+        """Memória ocupada pelos tempos (tabela densa ou pares em cache)"""
+        if self.densa:
+            return self.tempos.nbytes
+        return self._pares.bytes_usados
+
+    def get_estatisticas(self):
+        """Retorna modo, dimensões, memória e tempo de construção da tabela"""
+        return {
+            'modo': 'densa' if self.densa else 'sob_demanda',
+            'pontos': len(self.geometria),
+            'bandas': len(self.bandas_x),
+            'velocidades': len(self.drone.velocidades),
+            'bytes_usados': self.bytes_usados,
+            'tempo_construcao': self.tempo_construcao
+        }
+
+    def __repr__(self):
+        modo = 'densa' if self.densa else 'sob demanda'
+        return (f"TabelaTemposVoo({len(self.geometria)} pontos, {len(self.bandas_x)} bandas, "
+                f"{modo}, {self.bytes_usados} bytes)")
@@ -1,7 +1,12 @@
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 from ..config.settings import Config
+from ..utils.calculos import (
+    distancia_haversine, calcular_direcao, calcular_velocidade_efetiva,
+    cardinal_para_angulo, componentes_vento, aplicar_projecao_vento
+)
 
-@dataclass
+@dataclass(slots=True)
 class Trecho:
     """Representa um trecho entre duas coordenadas"""
     origem: object
@@ -11,14 +16,57 @@ class Trecho:
     hora_partida: int  # minutos desde 00:00
     vento_velocidade: float
     vento_direcao: str
+    # Matriz de geometria pré-calculada (opcional). Quando presente, distância,
+    # direção e vetor unitário do voo são consultados por índice.
+    geometria: object = field(default=None, repr=False, compare=False)
+    # Se a simulação recarregou na origem antes deste trecho
+    recarga: bool = False
+    # Calculados em __post_init__ (declarados para caber nos __slots__)
+    distancia: float = field(init=False)
+    direcao_voo: float = field(init=False)
+    velocidade_efetiva: float = field(init=False)
+    tempo_voo_segundos: int = field(init=False)
+    consumo_bateria: int = field(init=False)
+    custo: float = field(init=False)
     
     def __post_init__(self):
         """Calcula automaticamente as métricas do trecho"""
-        from ..utils.calculos import (
-            distancia_haversine, calcular_direcao, 
-            calcular_velocidade_efetiva, cardinal_para_angulo
-        )
+        # O gerenciador de vento guarda a direção de ONDE o vento vem (cardinal).
+        # Converter para ângulo e transformar em direção PARA ONDE o vento aponta
+        # somando 180° (convenção meteorológica).
+        angulo_vento = (cardinal_para_angulo(self.vento_direcao) + 180.0) % 360.0
+        
+        if self.geometria is not None:
+            self._calcular_por_geometria(angulo_vento)
+        else:
+            self._calcular_por_trigonometria(angulo_vento)
+        
+        # Tempo de voo em segundos (arredondado para cima)
+        tempo_horas = self.distancia / self.velocidade_efetiva
+        self.tempo_voo_segundos = int(tempo_horas * 3600) + 1  # +1 para arredondar para cima
+        
+        # Consumo de bateria (igual ao tempo de voo em segundos)
+        self.consumo_bateria = self.tempo_voo_segundos
+        
+        # Custo do trecho
+        self.custo = 0  # Será calculado durante a simulação
+    
+    def _calcular_por_geometria(self, angulo_vento):
+        """Consulta distância/direção na MatrizGeometria (sem trigonometria do par)"""
+        i = self.geometria.indice(self.origem)
+        j = self.geometria.indice(self.destino)
         
+        self.distancia = self.geometria.distancias.item(i, j)
+        self.direcao_voo = self.geometria.direcoes.item(i, j)
+        
+        # Projeção do vento no vetor unitário pré-calculado do voo
+        vento_x, vento_y = componentes_vento(self.vento_velocidade, angulo_vento)
+        v_vento_proj = (vento_x * self.geometria.unitario_x.item(i, j) +
+                        vento_y * self.geometria.unitario_y.item(i, j))
+        self.velocidade_efetiva = aplicar_projecao_vento(self.velocidade, v_vento_proj)
+    
+    def _calcular_por_trigonometria(self, angulo_vento):
+        """Calcula distância/direção diretamente a partir das coordenadas"""
         # Distância em km
         self.distancia = distancia_haversine(
             self.origem.latitude, self.origem.longitude,
@@ -32,24 +80,10 @@ class Trecho:
         )
         
         # Velocidade efetiva com vento
-        # O gerenciador de vento guarda a direção de ONDE o vento vem (cardinal).
-        # Converter para ângulo e transformar em direção PARA ONDE o vento aponta
-        # somando 180° (convenção meteorológica).
-        angulo_vento = (cardinal_para_angulo(self.vento_direcao) + 180.0) % 360.0
         self.velocidade_efetiva = calcular_velocidade_efetiva(
             self.velocidade, self.direcao_voo, 
             self.vento_velocidade, angulo_vento
         )
-        
-        # Tempo de voo em segundos (arredondado para cima)
-        tempo_horas = self.distancia / self.velocidade_efetiva
-        self.tempo_voo_segundos = int(tempo_horas * 3600) + 1  # +1 para arredondar para cima
-        
-        # Consumo de bateria (igual ao tempo de voo em segundos)
-        self.consumo_bateria = self.tempo_voo_segundos
-        
-        # Custo do trecho
-        self.custo = 0  # Será calculado durante a simulação
     
     def get_hora_chegada(self):
         """Retorna hora de chegada em minutos"""
@@ -61,4 +95,59 @@ class Trecho:
     
     def __repr__(self):
         return (f"Trecho({self.origem.cep}→{self.destino.cep}: "
-                f"{self.distancia:.1f}km, {self.tempo_voo_segundos}s)")
\ No newline at end of file
+                f"{self.distancia:.1f}km, {self.tempo_voo_segundos}s)")
+
+
+class TrechosCompactos:
+    """
+    Registro compacto dos trechos de uma rota simulada.
+
+    Guarda por trecho apenas o que a simulação decidiu (velocidade, dia,
+    hora de partida e se recarregou antes do trecho) em colunas array.array;
+    origem e destino são as posições k e k+1 do genoma. Objetos Trecho
+    completos (com distância e tempo de voo recalculados a partir desses
+    dados) são montados só sob demanda (ver Individuo.trechos), para
+    exportação e Simulador.
+    O registro não é alterado depois da simulação, então cópias do
+    indivíduo podem compartilhá-lo.
+    """
+
+    __slots__ = ('velocidades', 'dias', 'horas_partida', 'recargas')
+
+    def __init__(self):
+        self.velocidades = array('H')
+        self.dias = array('H')
+        self.horas_partida = array('H')
+        self.recargas = array('B')
+
+    def adicionar(self, velocidade, dia, hora_partida, recarga=False):
+        self.velocidades.append(velocidade)
+        self.dias.append(dia)
+        self.horas_partida.append(hora_partida)
+        self.recargas.append(recarga)
+
+    def prefixo(self, fim):
+        """Novo registro com os trechos [0, fim) (retomada por checkpoint)"""
+        novo = TrechosCompactos()
+        novo.velocidades = self.velocidades[:fim]
+        novo.dias = self.dias[:fim]
+        novo.horas_partida = self.horas_partida[:fim]
+        novo.recargas = self.recargas[:fim]
+        return novo
+
+    def materializar(self, coordenadas, gerenciador_vento, geometria):
+        """Monta os objetos Trecho (mesmos argumentos usados na simulação)"""
+        trechos = []
+        for k, (velocidade, dia, hora, recarga) in enumerate(zip(
+                self.velocidades, self.dias, self.horas_partida, self.recargas)):
+            vento = gerenciador_vento.get_vento(dia, hora)
+            trechos.append(Trecho(coordenadas[k], coordenadas[k + 1], velocidade, dia, hora,
+                                  vento['velocidade'], vento['direcao'], geometria,
+                                  bool(recarga)))
+        return trechos
+
+    def __len__(self):
+        return len(self.velocidades)
+
+    def __repr__(self):
+        return f"TrechosCompactos({len(self)} trechos)"
@@ -1,6 +1,72 @@
+import numpy as np
+from ..utils.calculos import cardinal_para_angulo, componentes_vento
+
+MINUTOS_DIA = 24 * 60
+
+
 class GerenciadorVento:
-    def __init__(self):
-        self.previsao = self._carregar_previsao()
+    # Faixas da previsão, na ordem usada pelos índices de faixa
+    FAIXAS = ('06h', '09h', '12h', '15h', '18h', '21h')
+
+    def __init__(self, previsao=None):
+        self.previsao = previsao if previsao is not None else self._carregar_previsao()
+        self._compilar_tabelas()
+    
+    @classmethod
+    def constante(cls, velocidade, direcao, dias=7):
+        """Gerenciador com o mesmo vento em todos os dias e faixas (testes/cenários)"""
+        return cls({dia: {faixa: {'velocidade': velocidade, 'direcao': direcao}
+                          for faixa in cls.FAIXAS}
+                    for dia in range(1, dias + 1)})
+    
+    def _compilar_tabelas(self):
+        """Compila a previsão em tabelas densas por (dia, minuto do dia).
+
+        vento_x[dia, minuto] / vento_y[dia, minuto] guardam as componentes
+        (leste/norte, km/h) do vetor PARA ONDE o vento sopra, calculadas uma
+        única vez com as mesmas funções usadas por Trecho. A linha 0 é o vento
+        neutro de dias fora da previsão.
+        """
+        # Faixa de cada minuto do dia (mesma regra de _hora_para_faixa)
+        self.faixa_por_minuto = np.array(
+            [self.FAIXAS.index(self._hora_para_faixa(minuto)) for minuto in range(MINUTOS_DIA)],
+            dtype=np.int64
+        )
+        self.dia_maximo = max((dia for dia in self.previsao if isinstance(dia, int) and dia > 0),
+                              default=0)
+        
+        componentes_x = np.zeros((self.dia_maximo + 1, len(self.FAIXAS)))
+        componentes_y = np.zeros_like(componentes_x)
+        for dia in range(self.dia_maximo + 1):
+            for faixa in range(len(self.FAIXAS)):
+                vento = self.get_vento(dia, (6 + 3 * faixa) * 60)
+                angulo_vento = (cardinal_para_angulo(vento['direcao']) + 180.0) % 360.0
+                componentes_x[dia, faixa], componentes_y[dia, faixa] = componentes_vento(
+                    vento['velocidade'], angulo_vento)
+        
+        self.vento_x = componentes_x[:, self.faixa_por_minuto]
+        self.vento_y = componentes_y[:, self.faixa_por_minuto]
+    
+    def _linha_dia(self, dia):
+        """Linha das tabelas para o dia (0 = vento neutro fora da previsão)"""
+        return dia if 1 <= dia <= self.dia_maximo else 0
+    
+    def get_componentes(self, dia, hora_minutos):
+        """Componentes (x, y) em km/h do vento para dia e hora (minutos desde 00:00)"""
+        minuto = min(max(hora_minutos, 0), MINUTOS_DIA - 1)
+        linha = self._linha_dia(dia)
+        return self.vento_x.item(linha, minuto), self.vento_y.item(linha, minuto)
+    
+    def get_vento_array(self, dias, minutos):
+        """Versão vetorizada de get_componentes: arrays (vento_x, vento_y)"""
+        dias = np.asarray(dias)
+        linhas = np.where((dias >= 1) & (dias <= self.dia_maximo), dias, 0)
+        minutos = np.clip(minutos, 0, MINUTOS_DIA - 1)
+        return self.vento_x[linhas, minutos], self.vento_y[linhas, minutos]
+    
+    def indice_faixa(self, hora_minutos):
+        """Índice (0-5) da faixa de previsão da hora, como em _hora_para_faixa"""
+        return self.faixa_por_minuto.item(min(max(hora_minutos, 0), MINUTOS_DIA - 1))
     
     def _carregar_previsao(self):
         """Carrega previsão de vento dos 7 dias conforme tabela do PDF"""
@@ -1,11 +1,26 @@
 import csv
 import os
+from bisect import bisect_left
 from datetime import datetime
-from ..config.settings import Config
+from ..config.settings import Config, FASES_GERACAO
 
 class CSVExporter:
     """Exporta resultados no formato CSV - SOBRESCREVE arquivos existentes"""
     
+    # Tolerância (minutos) entre a recarga registrada e a partida do trecho
+    TOLERANCIA_POUSO_MINUTOS = 3
+    
+    # Métricas de desempenho por geração (ver AlgoritmoGenetico.executar_geracao),
+    # exportadas como colunas extras quando presentes no histórico; tempo_somado_*
+    # só existe no modelo de ilhas (soma dos tempos das ilhas em paralelo)
+    COLUNAS_DESEMPENHO = tuple(f'tempo_{fase}' for fase in FASES_GERACAO) + (
+        'tempo_geracao', 'avaliacoes_por_segundo', 'memoria_pico_kb', 'memoria_top'
+    ) + tuple(f'tempo_somado_{fase}' for fase in FASES_GERACAO) + ('tempo_somado_geracao',)
+    # Nome das fases nas linhas do resumo
+    NOMES_FASES = {'avaliacao': 'avaliação', 'busca_local': 'busca local',
+                   'plano_voo': 'plano de voo', 'selecao': 'seleção', 'crossover': 'crossover',
+                   'mutacao': 'mutação'}
+    
     def __init__(self, diretorio_saida="data/output"):
         self.diretorio_saida = diretorio_saida
         self._criar_diretorio()
@@ -41,42 +56,61 @@ class CSVExporter:
             writer.writerow(cabecalho)
             
             # Dados dos trechos - SOBRESCREVE todo o conteúdo
-            # Build a quick lookup of recargas by (dia, cep, hora) to mark pousos
-            recargas = set()
-            for r in getattr(individuo, 'lista_recargas', []):
-                # r: (dia, hora_minutos, cep, taxa_bool)
-                recargas.add((r[0], r[2], r[1]))
-
-            for trecho in individuo.trechos:
-                # Try to match a recarga at this origin by day/hora with small tolerance
-                matched = False
-                for r_dia, r_cep, r_hora in recargas:
-                    if r_cep == trecho.origem.cep and r_dia == trecho.dia and abs(r_hora - trecho.hora_partida) <= 3:
-                        matched = True
-                        break
-                pouso = "SIM" if matched else "NÃO"
-
-                linha = [
-                    trecho.origem.cep,
-                    trecho.origem.latitude,
-                    trecho.origem.longitude,
-                    trecho.dia,
-                    self._formatar_hora_csv(trecho.hora_partida),
-                    trecho.velocidade,
-                    trecho.destino.cep,
-                    trecho.destino.latitude,
-                    trecho.destino.longitude,
-                    pouso,
-                    self._formatar_hora_csv(trecho.get_hora_chegada())
-                ]
-                writer.writerow(linha)
+            writer.writerows(self._linhas_rota(individuo))
         
         print(f"✅ Arquivo atualizado: {caminho_completo}")
         print(f"   📊 {len(individuo.trechos)} trechos exportados")
         return caminho_completo
     
-    def exportar_resumo(self, individuo, historico_metricas):
-        """Exporta resumo - SOBRESCREVE resumo_execucao.csv se existir"""
+    def _linhas_rota(self, individuo):
+        """Gera as linhas de rota_otimizada.csv, um trecho por vez"""
+        # Recargas (dia, hora_minutos, cep, taxa_bool) indexadas por (dia, cep)
+        recargas = self._indexar_por_dia_cep(getattr(individuo, 'lista_recargas', []))
+        
+        for trecho in individuo.trechos:
+            # Houve recarga nesta origem, neste dia, perto da hora de partida?
+            pouso = self._tem_registro_proximo(recargas, trecho.dia, trecho.origem.cep,
+                                               trecho.hora_partida,
+                                               self.TOLERANCIA_POUSO_MINUTOS)
+            yield [
+                trecho.origem.cep,
+                trecho.origem.latitude,
+                trecho.origem.longitude,
+                trecho.dia,
+                self._formatar_hora_csv(trecho.hora_partida),
+                trecho.velocidade,
+                trecho.destino.cep,
+                trecho.destino.latitude,
+                trecho.destino.longitude,
+                "SIM" if pouso else "NÃO",
+                self._formatar_hora_csv(trecho.get_hora_chegada())
+            ]
+    
+    @staticmethod
+    def _indexar_por_dia_cep(registros):
+        """Índice {(dia, cep): horas ordenadas} de tuplas (dia, hora, cep, ...)"""
+        indice = {}
+        for registro in registros:
+            indice.setdefault((registro[0], registro[2]), []).append(registro[1])
+        for horas in indice.values():
+            horas.sort()
+        return indice
+    
+    @staticmethod
+    def _tem_registro_proximo(indice, dia, cep, hora, tolerancia):
+        """Busca binária: há registro em (dia, cep) a até `tolerancia` minutos de hora?"""
+        horas = indice.get((dia, cep))
+        if not horas:
+            return False
+        posicao = bisect_left(horas, hora - tolerancia)
+        return posicao < len(horas) and horas[posicao] <= hora + tolerancia
+    
+    def exportar_resumo(self, individuo, historico_metricas, extras=None):
+        """Exporta resumo - SOBRESCREVE resumo_execucao.csv se existir
+
+        extras: dict opcional {parâmetro: valor} com linhas adicionais
+        (ex.: estatísticas de cache da execução).
+        """
         caminho_completo = os.path.join(self.diretorio_saida, "resumo_execucao.csv")
         
         # Verificar se arquivo já existe
@@ -111,10 +145,35 @@ class CSVExporter:
                 melhoria = ((melhor_inicial - melhor_final) / melhor_inicial * 100) if melhor_inicial > 0 else 0
                 writer.writerow(['Melhoria (%)', f"{melhoria:.1f}"])
                 writer.writerow(['Gerações executadas', len(historico_metricas)])
+                writer.writerows(self._linhas_desempenho(historico_metricas))
+            
+            # Linhas adicionais fornecidas pelo chamador
+            for parametro, valor in (extras or {}).items():
+                writer.writerow([parametro, valor])
         
         print(f"✅ Arquivo atualizado: {caminho_completo}")
         return caminho_completo
 
+    def _linhas_desempenho(self, historico_metricas):
+        """Linhas do resumo com o tempo gasto por fase ao longo da execução"""
+        if not all('tempo_geracao' in metrica for metrica in historico_metricas):
+            return
+        yield ['Tempo total das gerações (s)',
+               f"{sum(m['tempo_geracao'] for m in historico_metricas):.3f}"]
+        for fase in FASES_GERACAO:
+            total = sum(m[f'tempo_{fase}'] for m in historico_metricas)
+            yield [f'Tempo {self.NOMES_FASES[fase]} (s)', f"{total:.3f}"]
+        
+        tempo_avaliacao = sum(m['tempo_avaliacao'] for m in historico_metricas)
+        simulacoes = sum(m['simulacoes'] for m in historico_metricas)
+        taxa = simulacoes / tempo_avaliacao if tempo_avaliacao > 0 else 0.0
+        yield ['Avaliações por segundo', f"{taxa:.1f}"]
+        
+        if all('memoria_pico_kb' in metrica for metrica in historico_metricas):
+            pico = max(historico_metricas, key=lambda m: m['memoria_pico_kb'])
+            yield ['Memória pico (KB)', f"{pico['memoria_pico_kb']:.1f}"]
+            yield ['Maiores alocações (geração de pico)', pico['memoria_top']]
+
     def exportar_recargas_detalhadas(self, individuo):
         """Exporta um CSV com todas as recargas detalhadas: dia, hora, cep, taxa, pouso_atrasado"""
         caminho = os.path.join(self.diretorio_saida, 'recargas_detalhadas.csv')
@@ -123,13 +182,19 @@ class CSVExporter:
         with open(caminho, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             writer.writerow(['dia', 'hora', 'cep', 'taxa_bool', 'pouso_atrasado'])
-            atrasados = { (d,h,cep) : True for (d,h,cep,_) in getattr(individuo, 'pousos_atrasados', []) }
-            for (d, h, cep, taxa) in recs:
-                key = (d, h, cep)
-                writer.writerow([d, self._formatar_hora_csv(h), cep, 'SIM' if taxa else 'NÃO', 'SIM' if atrasados.get(key, False) else 'NÃO'])
+            writer.writerows(self._linhas_recargas(recs, getattr(individuo, 'pousos_atrasados', [])))
 
         print(f"✅ Arquivo atualizado: {caminho}")
         return caminho
+
+    def _linhas_recargas(self, recargas, pousos_atrasados):
+        """Gera as linhas de recargas_detalhadas.csv, uma recarga por vez"""
+        # Pousos atrasados (dia, hora, cep, motivo) indexados por (dia, cep)
+        atrasados = self._indexar_por_dia_cep(pousos_atrasados)
+        for (d, h, cep, taxa) in recargas:
+            atrasado = self._tem_registro_proximo(atrasados, d, cep, h, 0)
+            yield [d, self._formatar_hora_csv(h), cep, 'SIM' if taxa else 'NÃO',
+                   'SIM' if atrasado else 'NÃO']
     
     def exportar_metricas_evolucao(self, historico_metricas):
         """Exporta métricas de evolução - SOBRESCREVE metricas_evolucao.csv se existir"""
@@ -145,9 +210,13 @@ class CSVExporter:
         with open(caminho_completo, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             
+            # Colunas de desempenho presentes no histórico (tempos, memória)
+            extras = [coluna for coluna in self.COLUNAS_DESEMPENHO
+                      if any(coluna in metrica for metrica in historico_metricas)]
+            
             # Cabeçalho
             writer.writerow(['geracao', 'melhor_fitness', 'pior_fitness', 'fitness_medio', 
-                           'melhor_distancia', 'melhor_tempo', 'taxa_viabilidade'])
+                           'melhor_distancia', 'melhor_tempo', 'taxa_viabilidade'] + extras)
             
             # Dados - SOBRESCREVE todo o histórico
             for i, metrica in enumerate(historico_metricas):
@@ -159,12 +228,37 @@ class CSVExporter:
                     metrica.get('melhor_distancia', 0),
                     metrica.get('melhor_tempo', 0),
                     metrica.get('taxa_viabilidade', 0)
-                ])
+                ] + [metrica.get(coluna, '') for coluna in extras])
         
         print(f"✅ Arquivo atualizado: {caminho_completo}")
         print(f"   📈 {len(historico_metricas)} gerações registradas")
         return caminho_completo
     
+    # Colunas de comparacao_experimentos.csv (ver ExecutorExperimentos)
+    COLUNAS_EXPERIMENTOS = ('alpha', 'beta', 'tamanho_populacao', 'semente', 'fitness', 'viavel',
+                            'dias', 'pousos', 'pousos_taxa_tarde', 'custo', 'tempo_total',
+                            'distancia', 'geracoes', 'motivo_parada', 'tempo_execucao')
+    
+    def exportar_comparacao_experimentos(self, resultados):
+        """Exporta uma linha por configuração de experimento - SOBRESCREVE
+        comparacao_experimentos.csv se existir"""
+        caminho_completo = os.path.join(self.diretorio_saida, "comparacao_experimentos.csv")
+        
+        if os.path.exists(caminho_completo):
+            print(f"📝 Sobrescrevendo arquivo existente: comparacao_experimentos.csv")
+        else:
+            print(f"✅ Criando novo arquivo: comparacao_experimentos.csv")
+        
+        with open(caminho_completo, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.COLUNAS_EXPERIMENTOS)
+            for resultado in resultados:
+                writer.writerow([resultado[coluna] for coluna in self.COLUNAS_EXPERIMENTOS])
+        
+        print(f"✅ Arquivo atualizado: {caminho_completo}")
+        print(f"   🧪 {len(resultados)} configurações comparadas")
+        return caminho_completo
+    
     def _formatar_hora_csv(self, minutos):
         """Formata minutos para string HH:MM:SS"""
         horas = minutos // 60
@@ -1,51 +1,95 @@
 import datetime
+import shutil
 from ..config.settings import Config
 
 class Simulador:
     """Simula a execução completa de uma trajetória"""
     
-    def __init__(self, drone, gerenciador_vento):
+    # Níveis de detalhe do log (cada nível inclui os anteriores)
+    NIVEL_RESUMO = 0    # cabeçalho e resumo final
+    NIVEL_DIAS = 1      # + viradas de dia e recargas
+    NIVEL_TRECHOS = 2   # + cada trecho e parada para fotos (log completo)
+    
+    # Buffer (bytes) do arquivo de log gravado durante a simulação
+    TAMANHO_BUFFER_ARQUIVO = 64 * 1024
+    
+    def __init__(self, drone, gerenciador_vento, nivel=NIVEL_TRECHOS, console=True,
+                 arquivo_log=None):
+        """
+        nivel: detalhe do log (NIVEL_RESUMO, NIVEL_DIAS ou NIVEL_TRECHOS);
+        mensagens acima do nível nem chegam a ser formatadas.
+        console: False desliga a impressão de cada linha no stdout.
+        arquivo_log: se informado, o log de cada simulação é gravado nele
+        durante a simulação (escrita bufferizada), sem esperar salvar_log, e
+        as linhas não ficam guardadas em memória (self.log fica vazio).
+        """
         self.drone = drone
         self.gerenciador_vento = gerenciador_vento
+        self.nivel = nivel
+        self.console = console
+        self.arquivo_log = arquivo_log
         self.log = []
+        self._arquivo = None
     
     def simular_trajetoria(self, individuo):
-        """Simula a trajetória completa do indivíduo"""
+        """Simula a trajetória completa do indivíduo e retorna as linhas do log
+        (lista vazia com arquivo_log: o log está no arquivo)"""
         self.log = []
+        if self.arquivo_log is not None:
+            self._arquivo = open(self.arquivo_log, 'w', encoding='utf-8',
+                                 buffering=self.TAMANHO_BUFFER_ARQUIVO)
+        try:
+            self._simular(individuo)
+        finally:
+            if self._arquivo is not None:
+                self._arquivo.close()
+                self._arquivo = None
+        return self.log
+    
+    def _simular(self, individuo):
+        """Gera as linhas do log da trajetória"""
         self._adicionar_log(f"=== SIMULAÇÃO DA ROTA ===")
         self._adicionar_log(f"Indivíduo: {len(individuo.coordenadas)} pontos")
         self._adicionar_log(f"Fitness: {individuo.fitness:.2f}")
         
         if not individuo.viabilidade:
             self._adicionar_log("❌ ROTA INVIÁVEL")
-            return self.log
+            return
+        
+        log_dias = self.nivel >= self.NIVEL_DIAS
+        log_trechos = self.nivel >= self.NIVEL_TRECHOS
         
         # Executar simulação detalhada
         dia_atual = 1
         hora_atual = Config.HORA_INICIO
         bateria_atual = self.drone.calcular_autonomia(36)
         
-        self._adicionar_log(f"📅 Dia {dia_atual} - Iniciando às {self._formatar_hora(hora_atual)}")
+        if log_dias:
+            self._adicionar_log(f"📅 Dia {dia_atual} - Iniciando às {self._formatar_hora(hora_atual)}")
         
         for i, trecho in enumerate(individuo.trechos):
             # Verificar mudança de dia
             if trecho.dia != dia_atual:
                 dia_atual = trecho.dia
-                self._adicionar_log(f"📅 Dia {dia_atual} - Continuando às {self._formatar_hora(hora_atual)}")
+                if log_dias:
+                    self._adicionar_log(
+                        f"📅 Dia {dia_atual} - Continuando às {self._formatar_hora(hora_atual)}")
             
-            # Verificar recarga (não mutamos o Indivíduo; usamos contador local para logs)
-            if trecho.precisa_recarregar(bateria_atual):
-                self._adicionar_log(f"⚡ RECARGA em {trecho.origem.cep} - R$80,00")
+            # Recarga decidida pela simulação (regra gulosa ou plano de voo)
+            if trecho.recarga:
+                if log_dias:
+                    self._adicionar_log(f"⚡ RECARGA em {trecho.origem.cep} - R$80,00")
                 bateria_atual = self.drone.calcular_autonomia(36)
             
             # Executar trecho
-            self._adicionar_log(
-                f"➡️  Trecho {i+1}: {trecho.origem.cep} → {trecho.destino.cep} | "
-                f"Vel: {trecho.velocidade}km/h | "
-                f"Dist: {trecho.distancia:.1f}km | "
-                f"Tempo: {trecho.tempo_voo_segundos}s | "
-                f"Bateria: {bateria_atual/60:.1f}min"
-            )
+            if log_trechos:
+                self._adicionar_log(
+                    f"➡️  Trecho {i+1}: {trecho.origem.cep} → {trecho.destino.cep} | "
+                    f"Vel: {trecho.velocidade}km/h | "
+                    f"Dist: {trecho.distancia:.1f}km | "
+                    f"Tempo: {trecho.tempo_voo_segundos}s | "
+                    f"Bateria: {bateria_atual/60:.1f}min"
+                )
             
             # Atualizar estado
             bateria_atual -= trecho.consumo_bateria
@@ -53,20 +97,23 @@ class Simulador:
             
             # Parada para fotos
             hora_atual += 1
-            self._adicionar_log(f"   📸 Fotografando {trecho.destino.cep} (+72s)")
+            if log_trechos:
+                self._adicionar_log(f"   📸 Fotografando {trecho.destino.cep} (+72s)")
         
         self._adicionar_log(f"✅ SIMULAÇÃO CONCLUÍDA")
         self._adicionar_log(f"   Dias utilizados: {individuo.dias_utilizados}")
         self._adicionar_log(f"   Pousos para recarga: {individuo.numero_pousos}")
         self._adicionar_log(f"   Custo total: R$ {individuo.custo_total:.2f}")
         self._adicionar_log(f"   Tempo total: {individuo.tempo_total:.1f} min")
-        
-        return self.log
     
     def _adicionar_log(self, mensagem):
-        """Adiciona mensagem ao log"""
-        self.log.append(mensagem)
-        print(mensagem)
+        """Adiciona mensagem ao arquivo (se ativo) ou ao log em memória, e ao console"""
+        if self._arquivo is not None:
+            self._arquivo.write(mensagem + '\n')
+        else:
+            self.log.append(mensagem)
+        if self.console:
+            print(mensagem)
     
     def _formatar_hora(self, minutos):
         """Formata minutos para string HH:MM"""
@@ -76,7 +123,12 @@ class Simulador:
     
     def salvar_log(self, arquivo="log_simulacao.txt"):
         """Salva log em arquivo"""
-        with open(arquivo, 'w', encoding='utf-8') as f:
-            for linha in self.log:
-                f.write(linha + '\n')
-        print(f"✅ Log salvo em: {arquivo}")
\ No newline at end of file
+        if self.arquivo_log is not None:
+            # O log já foi gravado durante a simulação: basta copiá-lo, se preciso
+            if arquivo != self.arquivo_log:
+                shutil.copyfile(self.arquivo_log, arquivo)
+        else:
+            with open(arquivo, 'w', encoding='utf-8',
+                      buffering=self.TAMANHO_BUFFER_ARQUIVO) as f:
+                f.writelines(linha + '\n' for linha in self.log)
+        print(f"✅ Log salvo em: {arquivo}")
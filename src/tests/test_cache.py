@@ -0,0 +1,47 @@
+import unittest
+import sys
+import os
+
+# Adicionar o diretório raiz do projeto ao Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.cache import CacheLRU
+
+
+class TestCacheLRU(unittest.TestCase):
+
+    def test_contadores_de_acerto_e_falta(self):
+        """Consultas devem contabilizar acertos e faltas"""
+        cache = CacheLRU(max_bytes=100)
+        self.assertIsNone(cache.obter('a'))
+        cache.guardar('a', 1, 10)
+        self.assertEqual(cache.obter('a'), 1)
+
+        stats = cache.get_estatisticas()
+        self.assertEqual(stats['acertos'], 1)
+        self.assertEqual(stats['faltas'], 1)
+        self.assertAlmostEqual(stats['taxa_acerto'], 50.0)
+
+    def test_descarta_menos_recentemente_usado(self):
+        """Ao exceder o limite, o item usado há mais tempo deve sair"""
+        cache = CacheLRU(max_bytes=30)
+        cache.guardar('a', 1, 10)
+        cache.guardar('b', 2, 10)
+        cache.guardar('c', 3, 10)
+        cache.obter('a')  # 'a' passa a ser o mais recente
+        cache.guardar('d', 4, 10)
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.bytes_usados, 30)
+        self.assertEqual(cache.get_estatisticas()['descartes'], 1)
+
+    def test_item_maior_que_limite_nao_e_guardado(self):
+        cache = CacheLRU(max_bytes=5)
+        cache.guardar('a', 1, 10)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.bytes_usados, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,525 @@
+import unittest
+import random
+import sys
+import os
+
+import numpy as np
+
+# Adicionar o diretório raiz do projeto ao Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.algorithms.crossover import crossover_ox, crossover_pmx, crossover_cx
+from src.algorithms.busca_local import BuscaLocal
+from src.algorithms.semeadura import (rota_vizinho_mais_proximo, rota_economias,
+                                      rota_gulosa_aleatoria, gerar_sementes)
+from src.algorithms.ilhas import ModeloIlhas
+from src.algorithms.experimentos import ExecutorExperimentos, gerar_grade
+from src.algorithms.plano_voo import OtimizadorPlanoVoo
+from src.algorithms.genetico import (AlgoritmoGenetico, FASES_GERACAO, PARADA_GERACOES,
+                                     PARADA_SEM_MELHORIA, PARADA_FITNESS_ALVO, PARADA_TEMPO,
+                                     PARADA_AVALIACOES)
+from src.simulation.csv_exporter import CSVExporter
+from src.models.populacao import Populacao
+from src.models.geometria import MatrizGeometria
+from src.models.drone import Drone
+from src.models.vento import GerenciadorVento
+from src.models.coordenada import Coordenada
+from src.config.settings import Config
+
+
+class TestCrossover(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(3)
+        interior1 = list(range(1, 40))
+        interior2 = list(range(1, 40))
+        rng.shuffle(interior1)
+        rng.shuffle(interior2)
+        # Unibrasil (índice 0) fixo nas pontas
+        self.pai1 = np.array([0] + interior1 + [0], dtype=np.int32)
+        self.pai2 = np.array([0] + interior2 + [0], dtype=np.int32)
+
+    def _assert_rota_valida(self, filho):
+        self.assertEqual(len(filho), len(self.pai1))
+        self.assertEqual(filho[0], 0)
+        self.assertEqual(filho[-1], 0)
+        self.assertEqual(sorted(filho[1:-1].tolist()), list(range(1, 40)))
+
+    def test_operadores_preservam_permutacao_e_pontas(self):
+        """Todo operador deve gerar permutação do interior com o Unibrasil fixo"""
+        for operador in (crossover_ox, crossover_pmx, crossover_cx):
+            rng = random.Random(11)
+            for _ in range(50):
+                self._assert_rota_valida(operador(self.pai1, self.pai2, rng))
+
+    def test_ox_e_pmx_herdam_segmento_do_pai1(self):
+        """OX e PMX copiam o segmento sorteado do primeiro pai"""
+        for operador in (crossover_ox, crossover_pmx):
+            a, b = sorted(random.Random(5).sample(range(1, len(self.pai1) - 1), 2))
+            filho = operador(self.pai1, self.pai2, random.Random(5))
+            self.assertEqual(filho[a:b].tolist(), self.pai1[a:b].tolist())
+
+    def test_cx_mantem_posicao_de_um_dos_pais(self):
+        """No CX cada gene fica na posição que ocupava em um dos pais"""
+        filho = crossover_cx(self.pai1, self.pai2)
+        for i, gene in enumerate(filho.tolist()):
+            self.assertIn(gene, (self.pai1[i], self.pai2[i]))
+
+
+
+class TestBuscaLocal(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(42)
+        coordenadas = [Coordenada(Config.CEP_INICIAL, -25.4233, -49.2160)]
+        for i in range(20):
+            coordenadas.append(Coordenada(f'{i:08d}',
+                                          -25.42 + rng.uniform(-0.1, 0.1),
+                                          -49.21 + rng.uniform(-0.1, 0.1)))
+        random.seed(7)
+        self.populacao = Populacao(coordenadas, Drone(), GerenciadorVento(), 4)
+        self.populacao.avaliar_populacao()
+        self.busca = BuscaLocal(self.populacao, 'todos', tempo_maximo_geracao=30.0)
+
+    def _distancia(self, rota):
+        dist = self.populacao.geometria.distancias
+        return sum(dist[a, b] for a, b in zip(rota[:-1], rota[1:]))
+
+    def test_candidatos_sao_rotas_validas_e_mais_curtas(self):
+        """2-opt e Or-opt só propõem permutações válidas que encurtam a rota"""
+        rota = self.populacao.individuos[0].genoma.tolist()
+        for gerar in (self.busca._candidatos_2opt, self.busca._candidatos_or_opt):
+            for candidato in gerar(rota):
+                self.assertEqual(candidato[0], rota[0])
+                self.assertEqual(candidato[-1], rota[-1])
+                self.assertEqual(sorted(candidato[1:-1]), sorted(rota[1:-1]))
+                self.assertLess(self._distancia(candidato), self._distancia(rota))
+
+    def test_aplicar_nao_piora_fitness(self):
+        """Movimentos aceitos são confirmados pela simulação completa"""
+        antes = sorted(ind.fitness for ind in self.populacao)
+        distancias = sorted(ind.distancia_total for ind in self.populacao)
+        self.busca.aplicar()
+
+        self.assertLessEqual(sorted(ind.fitness for ind in self.populacao), antes)
+        if self.busca.ultima_execucao['busca_local_melhorias']:
+            self.assertLess(sum(ind.distancia_total for ind in self.populacao), sum(distancias))
+
+    def test_limite_de_tempo(self):
+        """Com prazo zerado nenhuma simulação de confirmação é feita"""
+        self.busca.tempo_maximo_geracao = 0.0
+        self.busca.aplicar()
+        self.assertEqual(self.busca.ultima_execucao['busca_local_tentativas'], 0)
+
+
+
+class TestSemeadura(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(8)
+        pontos = rng.uniform(0, 100, size=(40, 2))
+        self.distancias = np.hypot(*(pontos[:, np.newaxis, :] - pontos[np.newaxis, :, :]).T)
+        self.pontos = list(range(1, 40))
+
+    def _comprimento(self, rota):
+        return sum(self.distancias[a, b] for a, b in zip(rota[:-1], rota[1:]))
+
+    def _assert_rota_valida(self, rota):
+        self.assertEqual(rota[0], 0)
+        self.assertEqual(rota[-1], 0)
+        self.assertEqual(sorted(rota[1:-1]), self.pontos)
+
+    def test_heuristicas_geram_rotas_validas_e_curtas(self):
+        """Rotas construtivas são permutações válidas bem melhores que o acaso"""
+        aleatorias = []
+        for semente in range(20):
+            interior = self.pontos.copy()
+            random.Random(semente).shuffle(interior)
+            aleatorias.append(self._comprimento([0] + interior + [0]))
+
+        for rota in (rota_vizinho_mais_proximo(self.distancias, 0, self.pontos),
+                     rota_economias(self.distancias, 0, self.pontos),
+                     rota_gulosa_aleatoria(self.distancias, 0, self.pontos, 3, random.Random(1))):
+            self._assert_rota_valida(rota)
+            self.assertLess(self._comprimento(rota), min(aleatorias))
+
+    def test_sementes_distintas(self):
+        """As sementes não devem se repetir (diversidade da população)"""
+        sementes = gerar_sementes(self.distancias, 0, self.pontos, 6, 3, random.Random(2))
+        self.assertEqual(len(sementes), 6)
+        self.assertEqual(len({tuple(rota) for rota in sementes}), 6)
+        for rota in sementes:
+            self._assert_rota_valida(rota)
+
+
+
+class TestModeloIlhas(unittest.TestCase):
+
+    def test_historico_unido_e_melhor_reconstruido(self):
+        """Ilhas em processos devolvem um histórico único e o melhor com trechos"""
+        rng = random.Random(42)
+        coordenadas = [Coordenada(Config.CEP_INICIAL, -25.4233, -49.2160)]
+        for i in range(12):
+            coordenadas.append(Coordenada(f'{i:08d}',
+                                          -25.42 + rng.uniform(-0.1, 0.1),
+                                          -49.21 + rng.uniform(-0.1, 0.1)))
+
+        modelo = ModeloIlhas(coordenadas, num_ilhas=2, tamanho_populacao=4,
+                             intervalo_migracao=2, num_migrantes=1, semente=3)
+        melhor, historico = modelo.executar(4)
+
+        self.assertEqual(len(historico), 4)
+        self.assertEqual(historico[0]['tamanho'], 8)
+        self.assertEqual(len(historico[-1]['melhor_fitness_ilhas']), 2)
+        self.assertTrue(melhor.trechos)
+        self.assertEqual(melhor.fitness, min(historico[-1]['melhor_fitness_ilhas']))
+
+    def test_opcoes_de_avaliacao_e_plano_de_voo_por_ilha(self):
+        """Motor, tabela de tempos e plano de voo chegam a cada ilha"""
+        rng = random.Random(42)
+        coordenadas = [Coordenada(Config.CEP_INICIAL, -25.4233, -49.2160)]
+        for i in range(10):
+            coordenadas.append(Coordenada(f'{i:08d}',
+                                          -25.42 + rng.uniform(-0.1, 0.1),
+                                          -49.21 + rng.uniform(-0.1, 0.1)))
+
+        modelo = ModeloIlhas(coordenadas, num_ilhas=2, tamanho_populacao=4,
+                             intervalo_migracao=2, num_migrantes=1, semente=3,
+                             parametros_ilhas=[{'motor': 'lote', 'precomputar_tempos': True},
+                                               {'elite_plano_voo': 1}])
+        _, historico = modelo.executar(3)
+        self.assertEqual(len(historico), 3)
+        self.assertTrue(all(m['tempo_plano_voo'] > 0 for m in historico))
+
+    def test_tempos_unidos_sao_de_relogio(self):
+        """Ilhas rodam em paralelo: tempo da geração/fase é o da ilha mais lenta;
+        a soma fica em tempo_somado_*"""
+        def stats_ilha(tempo):
+            stats = {'tamanho': 4, 'melhor_fitness': 1.0, 'pior_fitness': 2.0,
+                     'fitness_medio': 1.5, 'individuos_viaveis': 4, 'memo_acertos': 1,
+                     'simulacoes': 3, 'trechos_retomados': 0, 'tempo_geracao': tempo,
+                     'avaliacoes_por_segundo': 10.0}
+            stats.update({f'tempo_{fase}': tempo / 10 for fase in FASES_GERACAO})
+            return stats
+
+        modelo = ModeloIlhas([], num_ilhas=2)
+        unido, = modelo._unir_historicos([[stats_ilha(1.0)], [stats_ilha(3.0)]])
+        self.assertEqual(unido['tempo_geracao'], 3.0)
+        self.assertEqual(unido['tempo_somado_geracao'], 4.0)
+        self.assertAlmostEqual(unido['tempo_avaliacao'], 0.3)
+        self.assertAlmostEqual(unido['tempo_somado_avaliacao'], 0.4)
+        self.assertEqual(unido['avaliacoes_por_segundo'], 20.0)
+
+    def test_migracao_nao_avalia_a_nova_geracao(self):
+        """Emigrantes saem da última geração avaliada; a nova geração só é
+        avaliada (e contabilizada) na geração seguinte"""
+        import queue
+        from src.algorithms.ilhas import _migrar
+        rng = random.Random(42)
+        coordenadas = [Coordenada(Config.CEP_INICIAL, -25.4233, -49.2160)]
+        for i in range(12):
+            coordenadas.append(Coordenada(f'{i:08d}',
+                                          -25.42 + rng.uniform(-0.1, 0.1),
+                                          -49.21 + rng.uniform(-0.1, 0.1)))
+        random.seed(3)
+        populacao = Populacao(coordenadas, Drone(), GerenciadorVento(), 6)
+        algoritmo = AlgoritmoGenetico(populacao, taxa_mutacao=0.5)
+        stats = algoritmo.executar_geracao()
+
+        imigrante = populacao.individuos[0].genoma[::-1].copy()
+        entrada, saida = queue.Queue(), queue.Queue()
+        entrada.put([imigrante])
+        avaliados = [ind.assinatura_avaliacao for ind in populacao.individuos]
+        _migrar(algoritmo, 2, entrada, saida)
+
+        emigrantes = saida.get_nowait()
+        self.assertEqual(len(emigrantes), 2)
+        self.assertEqual(populacao.memoria_fitness.obter(
+            populacao.memoria_fitness.chave(emigrantes[0]))['fitness'], stats['melhor_fitness'])
+        np.testing.assert_array_equal(populacao.individuos[-1].genoma, imigrante)
+        # Nenhuma simulação fora de executar_geracao
+        self.assertEqual([ind.assinatura_avaliacao for ind in populacao.individuos],
+                         avaliados[:-1] + [None])
+
+
+class TestDesempenhoGeracao(unittest.TestCase):
+
+    def test_tempos_por_fase_perfil_e_exportacao(self):
+        """Cada geração registra tempos por fase; perfil e memória são opcionais
+        e tudo aparece como colunas extras em metricas_evolucao.csv"""
+        import csv
+        import io
+        import pstats
+        import tempfile
+        from contextlib import redirect_stdout
+        rng = random.Random(42)
+        coordenadas = [Coordenada(Config.CEP_INICIAL, -25.4233, -49.2160)]
+        for i in range(15):
+            coordenadas.append(Coordenada(f'{i:08d}',
+                                          -25.42 + rng.uniform(-0.1, 0.1),
+                                          -49.21 + rng.uniform(-0.1, 0.1)))
+        random.seed(2)
+        populacao = Populacao(coordenadas, Drone(), GerenciadorVento(), 6)
+
+        with tempfile.TemporaryDirectory() as pasta:
+            perfil = os.path.join(pasta, 'perfil.prof')
+            algoritmo = AlgoritmoGenetico(populacao, taxa_mutacao=0.5, arquivo_perfil=perfil,
+                                          rastrear_memoria=True)
+            try:
+                for _ in range(3):
+                    stats = algoritmo.executar_geracao()
+            finally:
+                algoritmo.encerrar_diagnostico()
+
+            historico = algoritmo.get_historico()
+            for metrica in historico:
+                fases = sum(metrica[f'tempo_{fase}'] for fase in FASES_GERACAO)
+                self.assertLessEqual(fases, metrica['tempo_geracao'])
+                self.assertGreater(metrica['tempo_avaliacao'], 0)
+                self.assertGreater(metrica['memoria_pico_kb'], 0)
+            self.assertIn('avaliacoes_por_segundo', stats)
+            self.assertIn(algoritmo.geracao_perfilada, (1, 2, 3))
+            self.assertTrue(pstats.Stats(perfil).total_calls > 0)
+
+            with redirect_stdout(io.StringIO()):
+                arquivo = CSVExporter(pasta).exportar_metricas_evolucao(historico)
+            with open(arquivo, newline='', encoding='utf-8') as f:
+                linhas = list(csv.DictReader(f))
+            self.assertEqual(len(linhas), 3)
+            self.assertEqual(float(linhas[0]['tempo_geracao']), historico[0]['tempo_geracao'])
+            self.assertIn('memoria_top', linhas[0])
+
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.coordenadas = [Coordenada(Config.CEP_INICIAL, -25.4233, -49.2160)]
+        for i in range(15):
+            self.coordenadas.append(Coordenada(f'{i:08d}',
+                                               -25.42 + rng.uniform(-0.1, 0.1),
+                                               -49.21 + rng.uniform(-0.1, 0.1)))
+
+    def _algoritmo(self, melhorias=False):
+        populacao = Populacao(self.coordenadas, Drone(), GerenciadorVento(), 6)
+        if not melhorias:
+            return AlgoritmoGenetico(populacao, taxa_mutacao=0.5)
+        return AlgoritmoGenetico(populacao, taxa_mutacao=0.5,
+                                 busca_local=BuscaLocal(populacao, tempo_maximo_geracao=60),
+                                 plano_voo=OtimizadorPlanoVoo(populacao, tempo_maximo_geracao=60))
+
+    @staticmethod
+    def _sem_tempos(historico):
+        """Histórico sem as medidas de tempo (únicas que variam entre execuções)"""
+        return [{chave: valor for chave, valor in metricas.items()
+                 if not ('tempo' in chave or chave == 'avaliacoes_por_segundo')}
+                for metricas in historico]
+
+    def test_retomada_identica_a_execucao_continua(self):
+        """3 gerações + checkpoint + restauração + 3 gerações == 6 gerações seguidas,
+        inclusive simulações, acertos da memória e trechos retomados do histórico"""
+        import tempfile
+        for melhorias in (False, True):
+            with self.subTest(melhorias=melhorias):
+                random.seed(5)
+                continuo = self._algoritmo(melhorias)
+                for _ in range(6):
+                    continuo.executar_geracao()
+
+                with tempfile.TemporaryDirectory() as pasta:
+                    arquivo = os.path.join(pasta, 'checkpoint.npz')
+                    random.seed(5)
+                    interrompido = self._algoritmo(melhorias)
+                    for _ in range(3):
+                        interrompido.executar_geracao()
+                    interrompido.salvar_checkpoint(arquivo)
+                    random.seed(999)  # estado do gerador vem do checkpoint
+
+                    retomado = self._algoritmo(melhorias)
+                    retomado.restaurar_checkpoint(arquivo)
+                    self.assertEqual(retomado.geracao, 3)
+                    self.assertEqual(retomado.get_melhor_individuo().fitness,
+                                     interrompido.get_melhor_individuo().fitness)
+                    for _ in range(3):
+                        retomado.executar_geracao()
+                    self.assertEqual(os.listdir(pasta), ['checkpoint.npz'])
+
+                self.assertEqual(retomado.geracao, 6)
+                self.assertEqual(self._sem_tempos(retomado.get_historico()),
+                                 self._sem_tempos(continuo.get_historico()))
+                self.assertGreater(sum(m['memo_acertos'] for m in continuo.get_historico()[3:]), 0)
+                for a, b in zip(retomado.populacao.individuos, continuo.populacao.individuos):
+                    np.testing.assert_array_equal(a.genoma, b.genoma)
+                self.assertEqual(retomado.get_melhor_individuo().fitness,
+                                 continuo.get_melhor_individuo().fitness)
+
+    def test_checkpoint_de_outra_instancia_rejeitado(self):
+        import tempfile
+        random.seed(5)
+        algoritmo = self._algoritmo()
+        algoritmo.executar_geracao()
+        with tempfile.TemporaryDirectory() as pasta:
+            arquivo = os.path.join(pasta, 'checkpoint.npz')
+            algoritmo.salvar_checkpoint(arquivo)
+            self.coordenadas = self.coordenadas[:-1]
+            with self.assertRaises(ValueError):
+                self._algoritmo().restaurar_checkpoint(arquivo)
+
+
+class TestCriteriosParada(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(3)
+        coordenadas = [Coordenada(Config.CEP_INICIAL, -25.4233, -49.2160)]
+        for i in range(12):
+            coordenadas.append(Coordenada(f'{i:08d}',
+                                          -25.42 + rng.uniform(-0.1, 0.1),
+                                          -49.21 + rng.uniform(-0.1, 0.1)))
+        self.coordenadas = coordenadas
+        random.seed(4)
+        self.algoritmo = AlgoritmoGenetico(
+            Populacao(coordenadas, Drone(), GerenciadorVento(), 6), taxa_mutacao=0.5)
+
+    def _algoritmo_com_busca_e_plano(self):
+        random.seed(4)
+        populacao = Populacao(self.coordenadas, Drone(), GerenciadorVento(), 6)
+        return AlgoritmoGenetico(populacao, taxa_mutacao=0.5,
+                                 busca_local=BuscaLocal(populacao, tempo_maximo_geracao=60),
+                                 plano_voo=OtimizadorPlanoVoo(populacao, tempo_maximo_geracao=60))
+
+    def test_numero_de_geracoes_e_callback(self):
+        vistos = []
+        melhor = self.algoritmo.otimizar(4, ao_final_geracao=vistos.append)
+        self.assertEqual(self.algoritmo.motivo_parada, PARADA_GERACOES)
+        self.assertEqual(len(vistos), 4)
+        self.assertIs(melhor, self.algoritmo.get_melhor_individuo())
+        # Continua a contagem: nada a fazer se o total já foi atingido
+        self.algoritmo.otimizar(4)
+        self.assertEqual(self.algoritmo.geracao, 4)
+
+    def test_criterios_antecipados(self):
+        self.algoritmo.otimizar(50, fitness_alvo=float('inf'))
+        self.assertEqual(self.algoritmo.motivo_parada, PARADA_FITNESS_ALVO)
+        self.assertEqual(self.algoritmo.geracao, 1)
+
+        # Com histórico, limites já esgotados param antes de nova geração
+        self.algoritmo.otimizar(50, tempo_maximo=0)
+        self.assertEqual(self.algoritmo.motivo_parada, PARADA_TEMPO)
+        self.assertEqual(self.algoritmo.geracao, 1)
+
+        self.algoritmo.otimizar(50, max_avaliacoes=1)
+        self.assertEqual(self.algoritmo.motivo_parada, PARADA_AVALIACOES)
+
+        self.algoritmo.otimizar(50, geracoes_sem_melhoria=3)
+        self.assertEqual(self.algoritmo.motivo_parada, PARADA_SEM_MELHORIA)
+        self.assertEqual(self.algoritmo.geracoes_sem_melhoria(), 3)
+        melhores = [m['melhor_fitness'] for m in self.algoritmo.get_historico()]
+        self.assertEqual(min(melhores[:-3]), min(melhores))
+
+    def test_avaliacoes_contam_busca_local_e_plano_de_voo(self):
+        """max_avaliacoes soma as simulações da busca local e do plano de voo
+        às da avaliação da população"""
+        algoritmo = self._algoritmo_com_busca_e_plano()
+        algoritmo.otimizar(4)
+        por_geracao = [m['simulacoes'] + m['busca_local_tentativas'] + m['plano_voo_simulacoes']
+                       for m in algoritmo.get_historico()]
+        self.assertEqual(algoritmo.total_avaliacoes(), sum(por_geracao))
+        limite = sum(por_geracao[:2])
+        # Contando só a avaliação da população o limite ainda não teria sido atingido
+        self.assertLess(sum(m['simulacoes'] for m in algoritmo.get_historico()[:2]), limite)
+
+        algoritmo = self._algoritmo_com_busca_e_plano()
+        algoritmo.otimizar(50, max_avaliacoes=limite)
+        self.assertEqual(algoritmo.motivo_parada, PARADA_AVALIACOES)
+        self.assertEqual(algoritmo.geracao, 2)
+
+
+class TestExperimentos(unittest.TestCase):
+
+    def test_grade_paralela_igual_a_serial_e_exportacao(self):
+        """Cada configuração tem semente própria: o resultado não depende do
+        número de processos; a execução serial não altera Config"""
+        import csv
+        import io
+        import tempfile
+        from contextlib import redirect_stdout
+        rng = random.Random(9)
+        coordenadas = [Coordenada(Config.CEP_INICIAL, -25.4233, -49.2160)]
+        for i in range(10):
+            coordenadas.append(Coordenada(f'{i:08d}',
+                                          -25.42 + rng.uniform(-0.1, 0.1),
+                                          -49.21 + rng.uniform(-0.1, 0.1)))
+        geometria = MatrizGeometria(coordenadas)
+        configuracoes = gerar_grade([1.0, 3.0], [0.0, 100.0], [6], [1, 2])
+        self.assertEqual(len(configuracoes), 8)
+
+        alpha_original = Config.HEURISTICA_ALPHA
+        serial = ExecutorExperimentos(coordenadas, geometria, 3).executar(configuracoes)
+        self.assertEqual(Config.HEURISTICA_ALPHA, alpha_original)
+        paralelo = ExecutorExperimentos(coordenadas, geometria, 3, workers=2).executar(configuracoes)
+
+        for a, b in zip(serial, paralelo):
+            self.assertEqual({k: v for k, v in a.items() if k != 'tempo_execucao'},
+                             {k: v for k, v in b.items() if k != 'tempo_execucao'})
+        self.assertEqual([r['semente'] for r in serial], [c['semente'] for c in configuracoes])
+
+        with tempfile.TemporaryDirectory() as pasta:
+            with redirect_stdout(io.StringIO()):
+                arquivo = CSVExporter(pasta).exportar_comparacao_experimentos(paralelo)
+            with open(arquivo, newline='', encoding='utf-8') as f:
+                linhas = list(csv.DictReader(f))
+        self.assertEqual(len(linhas), 8)
+        self.assertEqual(float(linhas[0]['fitness']), paralelo[0]['fitness'])
+
+
+class TestPlanoVoo(unittest.TestCase):
+
+    def setUp(self):
+        # Pontos espalhados o bastante para exigir recargas ao longo da rota
+        rng = random.Random(11)
+        self.coordenadas = [Coordenada(Config.CEP_INICIAL, -25.4233, -49.2160)]
+        for i in range(25):
+            self.coordenadas.append(Coordenada(f'{i:08d}',
+                                               -25.42 + rng.uniform(-0.3, 0.3),
+                                               -49.21 + rng.uniform(-0.3, 0.3)))
+        random.seed(6)
+        self.populacao = Populacao(self.coordenadas, Drone(), GerenciadorVento(), 8)
+        self.populacao.avaliar_populacao()
+
+    def test_plano_e_seguido_pela_simulacao_e_nao_piora(self):
+        otimizador = OtimizadorPlanoVoo(self.populacao)
+        for individuo in self.populacao.individuos:
+            velocidades, recargas = otimizador.resolver(individuo.genoma)
+            self.assertEqual(len(velocidades), len(individuo.genoma) - 1)
+
+            planejado = self.populacao.individuo_de_genoma(individuo.genoma, validar=False)
+            planejado.plano_voo = (velocidades, recargas)
+            planejado.simular_rota()
+            planejado.calcular_fitness()
+            # Nenhuma recarga forçada: o plano respeita a bateria
+            self.assertEqual(planejado.numero_pousos, int(recargas.sum()))
+            self.assertEqual([t.velocidade for t in planejado.trechos],
+                             Drone().velocidades[velocidades].tolist())
+
+            melhor = otimizador.melhorar(individuo)
+            self.assertLessEqual((melhor.fitness, melhor.dias_utilizados, melhor.tempo_total),
+                                 (individuo.fitness, individuo.dias_utilizados,
+                                  individuo.tempo_total))
+
+    def test_algoritmo_com_plano_na_elite(self):
+        otimizador = OtimizadorPlanoVoo(self.populacao, num_elite=2)
+        algoritmo = AlgoritmoGenetico(self.populacao, plano_voo=otimizador)
+        sem_plano = min(ind.tempo_total for ind in self.populacao.individuos if ind.viabilidade)
+        for _ in range(3):
+            algoritmo.executar_geracao()
+
+        historico = algoritmo.get_historico()
+        self.assertGreater(historico[0]['plano_voo_tentativas'], 0)
+        self.assertIn('tempo_plano_voo', historico[0])
+        melhor = algoritmo.get_melhor_individuo()
+        self.assertIsNotNone(melhor.plano_voo)
+        self.assertLess(melhor.tempo_total, sem_plano)
+
+
+if __name__ == '__main__':
+    unittest.main()
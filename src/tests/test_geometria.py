@@ -0,0 +1,122 @@
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Adicionar o diretório raiz do projeto ao Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.models.geometria import MatrizGeometria
+from src.models.coordenada import Coordenada, RegistroCoordenadas
+from src.models.trecho import Trecho
+from src.models.drone import Drone
+from src.models.vento import GerenciadorVento
+from src.models.tempos_voo import TabelaTemposVoo
+from src.algorithms.velocidade import calcular_trechos_velocidades
+from src.utils.calculos import distancia_haversine, calcular_direcao
+from src.config.settings import Config
+
+
+class TestGeometria(unittest.TestCase):
+
+    def setUp(self):
+        self.coordenadas = [
+            Coordenada(Config.CEP_INICIAL, -25.4233146347775, -49.2160678044742),
+            Coordenada('81350686', -25.4936598469491, -49.3400481020638),
+            Coordenada('82530380', -25.4300625729625, -49.2336060009616),
+            Coordenada(Config.CEP_INICIAL, -25.4233146347775, -49.2160678044742),
+        ]
+        self.geometria = MatrizGeometria(self.coordenadas)
+
+    def test_unibrasil_ocupa_um_unico_indice(self):
+        """CEPs repetidos na rota compartilham a mesma linha da matriz"""
+        self.assertEqual(len(self.geometria), 3)
+        self.assertEqual(self.geometria.indice(self.coordenadas[0]),
+                         self.geometria.indice(self.coordenadas[-1]))
+
+    def test_registro_interna_por_cep(self):
+        """Ids estáveis na ordem de registro e uma instância canônica por CEP"""
+        registro = self.geometria.registro
+        self.assertEqual([c.id for c in registro.coordenadas], [0, 1, 2])
+        self.assertIs(registro.registrar(Coordenada('81350686', 0.0, 0.0)), registro[1])
+        self.assertEqual(registro.indice_unibrasil, 0)
+        self.assertEqual(self.geometria.dtype_indices, np.uint16)
+
+        # Outro registro com outra ordem não altera os ids deste
+        outro = RegistroCoordenadas(list(reversed(self.coordenadas[1:])))
+        self.assertEqual(outro.id_de(self.coordenadas[1]), 2)
+        self.assertEqual(self.coordenadas[1].id, 1)
+        self.assertEqual(self.geometria.indice(self.coordenadas[1]), 1)
+
+    def test_distancias_e_direcoes_batem_com_funcoes_escalares(self):
+        """Matriz deve reproduzir distancia_haversine e calcular_direcao"""
+        for origem in self.geometria.coordenadas:
+            for destino in self.geometria.coordenadas:
+                i = self.geometria.indice(origem)
+                j = self.geometria.indice(destino)
+                if i == j:
+                    self.assertAlmostEqual(self.geometria.distancias[i, j], 0.0, places=9)
+                    continue
+                self.assertAlmostEqual(
+                    self.geometria.distancias[i, j],
+                    distancia_haversine(origem.latitude, origem.longitude,
+                                        destino.latitude, destino.longitude),
+                    places=9)
+                self.assertAlmostEqual(
+                    self.geometria.direcoes[i, j],
+                    calcular_direcao(origem.latitude, origem.longitude,
+                                     destino.latitude, destino.longitude),
+                    places=9)
+
+    def test_trecho_com_geometria_equivale_ao_calculo_direto(self):
+        """Trecho consultado na matriz deve ter as mesmas métricas"""
+        origem, destino = self.coordenadas[0], self.coordenadas[1]
+        direto = Trecho(origem, destino, 60, 1, Config.HORA_INICIO, 17, 'ENE')
+        indexado = Trecho(origem, destino, 60, 1, Config.HORA_INICIO, 17, 'ENE', self.geometria)
+
+        self.assertAlmostEqual(indexado.distancia, direto.distancia, places=9)
+        self.assertAlmostEqual(indexado.velocidade_efetiva, direto.velocidade_efetiva, places=9)
+        self.assertEqual(indexado.tempo_voo_segundos, direto.tempo_voo_segundos)
+
+
+class TestTabelaTemposVoo(unittest.TestCase):
+
+    def setUp(self):
+        self.geometria = MatrizGeometria([
+            Coordenada(Config.CEP_INICIAL, -25.4233146347775, -49.2160678044742),
+            Coordenada('81350686', -25.4936598469491, -49.3400481020638),
+            Coordenada('82530380', -25.4300625729625, -49.2336060009616),
+        ])
+        self.drone = Drone()
+        self.vento = GerenciadorVento()
+
+    def test_tabela_reproduz_calculo_do_trecho(self):
+        """Densa ou sob demanda, a tabela deve dar os mesmos tempos do kernel"""
+        densa = TabelaTemposVoo(self.geometria, self.drone, self.vento)
+        sob_demanda = TabelaTemposVoo(self.geometria, self.drone, self.vento, max_bytes=4096)
+        self.assertTrue(densa.densa)
+        self.assertFalse(sob_demanda.densa)
+
+        for dia, hora in [(1, 6 * 60), (2, 13 * 60 + 30), (3, 21 * 60), (99, 8 * 60)]:
+            vento_x, vento_y = self.vento.get_componentes(dia, hora)
+            for i in range(3):
+                for j in range(3):
+                    proj = (vento_x * self.geometria.unitario_x.item(i, j) +
+                            vento_y * self.geometria.unitario_y.item(i, j))
+                    _, esperado, _ = calcular_trechos_velocidades(
+                        self.geometria.distancias.item(i, j), proj,
+                        self.drone.velocidades, self.drone.autonomias)
+                    np.testing.assert_array_equal(densa.tempos_trecho(i, j, dia, hora), esperado)
+                    np.testing.assert_array_equal(sob_demanda.tempos_trecho(i, j, dia, hora),
+                                                  esperado)
+
+        self.assertEqual(densa.tempos.dtype, np.int32)
+        self.assertLessEqual(sob_demanda.bytes_usados, 4096)
+        np.testing.assert_array_equal(
+            sob_demanda.tempos_array([0, 1], [2, 0], [1, 2], [600, 700]),
+            densa.tempos_array([0, 1], [2, 0], [1, 2], [600, 700]))
+
+
+if __name__ == '__main__':
+    unittest.main()
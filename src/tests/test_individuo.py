@@ -9,6 +9,8 @@ from src.models.individuo import Individuo
 from src.models.drone import Drone
 from src.models.vento import GerenciadorVento
 from src.models.coordenada import Coordenada
+from src.models.trecho import Trecho
+from src.models.eventos import SinkLista, NOITE, DIAS_EXCEDIDOS, CODIGOS_ALERTA
 from src.config.settings import Config
 
 
@@ -29,7 +31,7 @@ class TestIndividuo(unittest.TestCase):
         ind = Individuo(self.coordenadas, self.drone, self.gerenciador)
 
         # Forçar vento nulo
-        ind.gerenciador_vento.get_vento = lambda dia, hora: {'velocidade': 0, 'direcao': 'N'}
+        ind.gerenciador_vento = GerenciadorVento.constante(0, 'N')
 
         bateria = self.drone.calcular_autonomia(36)
         velocidade = ind._escolher_velocidade_otima(self.unibrasil, self.ponto, bateria, 1, Config.HORA_INICIO)
@@ -43,7 +45,7 @@ class TestIndividuo(unittest.TestCase):
         ind = Individuo(self.coordenadas, self.drone, self.gerenciador)
 
         # Forçar vento nulo
-        ind.gerenciador_vento.get_vento = lambda dia, hora: {'velocidade': 0, 'direcao': 'N'}
+        ind.gerenciador_vento = GerenciadorVento.constante(0, 'N')
 
         # Bateria muito baixa para qualquer trecho realista
         bateria_baixa = 1  # segundo
@@ -56,13 +58,183 @@ class TestIndividuo(unittest.TestCase):
         ind = Individuo(self.coordenadas, self.drone, self.gerenciador)
 
         # Simular vento a favor
-        ind.gerenciador_vento.get_vento = lambda dia, hora: {'velocidade': 20, 'direcao': 'E'}
+        ind.gerenciador_vento = GerenciadorVento.constante(20, 'E')
 
         bateria = self.drone.calcular_autonomia(36)
         velocidade = ind._escolher_velocidade_otima(self.unibrasil, self.ponto, bateria, 1, Config.HORA_INICIO)
 
         self.assertIn(velocidade, self.drone.get_velocidades_validas())
 
+    def test_clonar_copia_genoma_e_compartilha_objetos(self):
+        """Clonar copia só o genoma/resultados; drone, vento e geometria são referenciados"""
+        ind = Individuo(self.coordenadas, self.drone, self.gerenciador)
+        ind.simular_rota()
+        ind.calcular_fitness()
+
+        copia = ind.clonar()
+        self.assertIs(copia.drone, ind.drone)
+        self.assertIs(copia.gerenciador_vento, ind.gerenciador_vento)
+        self.assertIs(copia.geometria, ind.geometria)
+        self.assertEqual(copia.fitness, ind.fitness)
+        self.assertEqual(copia.coordenadas, ind.coordenadas)
+
+        copia.genoma[1] = copia.genoma[0]
+        self.assertNotEqual(copia.genoma[1], ind.genoma[1])
+
+    def test_validacao_conta_repetidos_e_pontas(self):
+        """Cada repetição no interior custa 5000 e cada ponta fora do Unibrasil 10000"""
+        outro = Coordenada('00000002', 0.5, 0.5)
+        rota = [self.unibrasil, self.ponto, outro, self.ponto, self.ponto, self.unibrasil]
+        ind = Individuo(rota, self.drone, self.gerenciador)
+        self.assertFalse(ind.viabilidade)
+        self.assertEqual(ind.penalidades, 2 * 5000)
+
+        ind = Individuo([self.ponto, outro, self.unibrasil], self.drone, self.gerenciador)
+        self.assertEqual(ind.penalidades, 10000)
+
+        # Sem validação (genomas válidos por construção) nada é cobrado
+        ind = Individuo.de_genoma([1, 0, 1], self.drone, self.gerenciador,
+                                  ind.geometria, validar=False)
+        self.assertTrue(ind.viabilidade)
+        self.assertEqual(ind.penalidades, 0)
+
+    def test_simulacao_incremental_igual_a_completa(self):
+        """Filho de mutação retomado do checkpoint do pai deve ter as mesmas métricas"""
+        import random
+        rng = random.Random(8)
+        pontos = [Coordenada(f'{i:08d}', rng.uniform(-0.3, 0.3), rng.uniform(-0.3, 0.3))
+                  for i in range(1, 60)]
+        pai = Individuo([self.unibrasil] + pontos + [self.unibrasil], self.drone, self.gerenciador)
+        pai.simular_rota()
+
+        genoma = pai.genoma.copy()
+        genoma[35], genoma[50] = genoma[50], genoma[35]
+        incremental = Individuo.de_genoma(genoma, self.drone, self.gerenciador, pai.geometria)
+        incremental.definir_origem_delta(pai, 35)
+        incremental.simular_rota()
+        completo = Individuo.de_genoma(genoma, self.drone, self.gerenciador, pai.geometria)
+        completo.simular_rota()
+
+        self.assertGreater(incremental.trechos_retomados, 0)
+        self.assertEqual(incremental.exportar_metricas(), completo.exportar_metricas())
+        self.assertEqual([t.velocidade for t in incremental.trechos],
+                         [t.velocidade for t in completo.trechos])
+
+    def test_plano_voo_com_escolhas_gulosas_reproduz_simulacao(self):
+        """Plano com as velocidades da escolha gulosa (recargas forçadas pela
+        bateria) dá as mesmas métricas; filhos de um pai com plano não retomam
+        do checkpoint dele"""
+        import random
+        import numpy as np
+        rng = random.Random(4)
+        pontos = [Coordenada(f'{i:08d}', rng.uniform(-0.3, 0.3), rng.uniform(-0.3, 0.3))
+                  for i in range(1, 40)]
+        guloso = Individuo([self.unibrasil] + pontos + [self.unibrasil], self.drone, self.gerenciador)
+        guloso.simular_rota()
+        self.assertGreater(guloso.numero_pousos, 0)
+
+        indices = [self.drone.get_velocidades_validas().index(t.velocidade) for t in guloso.trechos]
+        planejado = Individuo.de_genoma(guloso.genoma, self.drone, self.gerenciador, guloso.geometria)
+        planejado.plano_voo = (np.array(indices, dtype=np.int8),
+                               np.zeros(len(indices), dtype=bool))
+        planejado.simular_rota()
+        self.assertEqual(planejado.exportar_metricas(), guloso.exportar_metricas())
+
+        filho = Individuo.de_genoma(guloso.genoma, self.drone, self.gerenciador, guloso.geometria)
+        filho.definir_origem_delta(planejado, 30)
+        filho.simular_rota()
+        self.assertEqual(filho.trechos_retomados, 0)
+
+    def test_trechos_materializados_sob_demanda(self):
+        """A simulação guarda só o registro compacto; os Trecho montados depois
+        reproduzem tempos e distâncias usados nas métricas"""
+        import random
+        rng = random.Random(4)
+        pontos = [Coordenada(f'{i:08d}', rng.uniform(-0.3, 0.3), rng.uniform(-0.3, 0.3))
+                  for i in range(1, 40)]
+        ind = Individuo([self.unibrasil] + pontos + [self.unibrasil], self.drone, self.gerenciador)
+        ind.simular_rota()
+
+        self.assertIsNone(ind._trechos_materializados)
+        self.assertEqual(ind.num_trechos, 40)
+        trechos = ind.trechos
+        self.assertIs(ind.trechos, trechos)
+        self.assertEqual([t.origem for t in trechos], ind.coordenadas[:-1])
+        self.assertEqual([t.destino for t in trechos], ind.coordenadas[1:])
+        self.assertEqual(sum(t.distancia for t in trechos), ind.distancia_total)
+        tempo_total = 0
+        for t in trechos:
+            tempo_total += t.tempo_voo_segundos / 60
+        self.assertEqual(tempo_total, ind.tempo_total)
+
+    def test_eventos_tipados_e_alertas_formatados_sob_demanda(self):
+        """A simulação emite eventos ao sink e guarda só os de alerta; o texto
+        dos alertas é montado apenas quando consultado"""
+        import io
+        import random
+        from contextlib import redirect_stdout
+        rng = random.Random(5)
+        pontos = [Coordenada(f'{i:08d}', rng.uniform(-0.4, 0.4), rng.uniform(-0.4, 0.4))
+                  for i in range(1, 120)]
+        rota = [self.unibrasil] + pontos + [self.unibrasil]
+        dias_maximos = Config.DIAS_MAXIMOS
+        try:
+            Config.DIAS_MAXIMOS = 1
+            sink = SinkLista()
+            ind = Individuo(rota, self.drone, self.gerenciador, sink_eventos=sink)
+            saida = io.StringIO()
+            with redirect_stdout(saida):
+                ind.simular_rota()
+        finally:
+            Config.DIAS_MAXIMOS = dias_maximos
+
+        self.assertEqual(saida.getvalue(), '')
+        self.assertEqual([e for e in sink.eventos if e.codigo in CODIGOS_ALERTA], ind.eventos)
+        self.assertNotIn(NOITE, [e.codigo for e in ind.eventos])
+        # dias_excedidos registrado uma única vez, mesmo com vários trechos além do limite
+        self.assertEqual([e.codigo for e in ind.eventos].count(DIAS_EXCEDIDOS), 1)
+        self.assertIn('dias_excedidos: Dias utilizados excederam o máximo: 2 dias (limite 1)',
+                      ind.alertas)
+
+    def _escolher_por_laco(self, ind, origem, destino, bateria, vento, alpha, beta):
+        """Implementação de referência (laço por velocidade com Trecho)"""
+        melhor, menor = None, float('inf')
+        for v in sorted(self.drone.get_velocidades_validas(), reverse=True):
+            trecho = Trecho(origem, destino, v, 1, Config.HORA_INICIO,
+                            vento['velocidade'], vento['direcao'], ind.geometria)
+            if trecho.precisa_recarregar(bateria):
+                continue
+            consumo = trecho.consumo_bateria / self.drone.calcular_autonomia(v) * 100.0
+            custo = alpha * trecho.tempo_voo_segundos / 60.0 + beta * consumo
+            if custo < menor - 0.01:
+                menor, melhor = custo, v
+        return melhor if melhor is not None else Config.VELOCIDADE_MINIMA
+
+    def test_kernel_vetorizado_equivale_ao_laco(self):
+        """O kernel deve escolher exatamente a mesma velocidade que o laço escalar"""
+        import random
+        rng = random.Random(1234)
+        alpha_original, beta_original = Config.HEURISTICA_ALPHA, Config.HEURISTICA_BETA
+        try:
+            for _ in range(300):
+                destino = Coordenada('00000009', rng.uniform(-0.2, 0.2), rng.uniform(-0.2, 0.2))
+                ind = Individuo([self.unibrasil, destino, self.unibrasil], self.drone, self.gerenciador)
+                vento = {'velocidade': rng.choice([0, 3, 11, 20]),
+                         'direcao': rng.choice(['N', 'E', 'ENE', 'WSW', 'SSW'])}
+                ind.gerenciador_vento = GerenciadorVento.constante(vento['velocidade'],
+                                                                   vento['direcao'])
+                Config.HEURISTICA_ALPHA = rng.choice([0.0, 1.0, 3.0])
+                Config.HEURISTICA_BETA = rng.choice([0.0, 1.0, 100.0])
+                bateria = rng.uniform(0, self.drone.calcular_autonomia(36))
+
+                esperado = self._escolher_por_laco(ind, self.unibrasil, destino, bateria, vento,
+                                                   Config.HEURISTICA_ALPHA, Config.HEURISTICA_BETA)
+                obtido = ind._escolher_velocidade_otima(self.unibrasil, destino, bateria, 1,
+                                                        Config.HORA_INICIO)
+                self.assertEqual(obtido, esperado)
+        finally:
+            Config.HEURISTICA_ALPHA, Config.HEURISTICA_BETA = alpha_original, beta_original
+
 
 if __name__ == '__main__':
     unittest.main()
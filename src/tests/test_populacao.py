@@ -0,0 +1,104 @@
+import unittest
+import random
+import sys
+import os
+
+# Adicionar o diretório raiz do projeto ao Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.models.populacao import Populacao
+from src.models.drone import Drone
+from src.models.vento import GerenciadorVento
+from src.models.coordenada import Coordenada
+from src.config.settings import Config
+
+
+class TestPopulacao(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(42)
+        self.coordenadas = [Coordenada(Config.CEP_INICIAL, -25.4233, -49.2160)]
+        for i in range(25):
+            self.coordenadas.append(Coordenada(f'{i:08d}',
+                                               -25.42 + rng.uniform(-0.15, 0.15),
+                                               -49.21 + rng.uniform(-0.15, 0.15)))
+
+    def _avaliar(self, workers, motor='individuo', vento=None):
+        random.seed(10)
+        populacao = Populacao(self.coordenadas, Drone(), vento or GerenciadorVento(), 6,
+                              workers=workers, motor=motor)
+        try:
+            populacao.avaliar_populacao()
+        finally:
+            populacao.encerrar()
+        return [ind.exportar_metricas() for ind in populacao]
+
+    def test_avaliacao_paralela_igual_a_serial(self):
+        """O pool de processos deve produzir exatamente as métricas da avaliação serial"""
+        self.assertEqual(self._avaliar(workers=2), self._avaliar(workers=1))
+
+    def test_avaliacao_paralela_usa_vento_da_populacao(self):
+        """Os processos simulam com o vento da população, não com a previsão padrão"""
+        vento = GerenciadorVento.constante(40, 'N')
+        paralela = self._avaliar(workers=2, vento=vento)
+        self.assertEqual(paralela, self._avaliar(workers=1, vento=vento))
+        self.assertNotEqual(paralela, self._avaliar(workers=1))
+
+    def test_avaliacao_paralela_acompanha_mudanca_de_config(self):
+        """Se Config muda entre avaliações, os processos usam os novos valores"""
+        def avaliar_duas_vezes(workers):
+            random.seed(10)
+            populacao = Populacao(self.coordenadas, Drone(), GerenciadorVento(), 6,
+                                  workers=workers)
+            alpha = Config.HEURISTICA_ALPHA
+            try:
+                populacao.avaliar_populacao()
+                Config.HEURISTICA_ALPHA = 0.0
+                populacao.individuos = [populacao.individuo_de_genoma(ind.genoma)
+                                        for ind in populacao.individuos]
+                populacao.avaliar_populacao()
+            finally:
+                Config.HEURISTICA_ALPHA = alpha
+                populacao.encerrar()
+            return [ind.exportar_metricas() for ind in populacao]
+
+        self.assertEqual(avaliar_duas_vezes(workers=2), avaliar_duas_vezes(workers=1))
+
+    def test_motor_lote_igual_ao_individual(self):
+        """O motor em lote deve reproduzir as métricas de Individuo.simular_rota"""
+        self.assertEqual(self._avaliar(workers=1, motor='lote'), self._avaliar(workers=1))
+
+    def test_motor_lote_igual_com_dias_rigidos(self):
+        """Rotas interrompidas por HARD_DIAS_MAX também devem coincidir"""
+        originais = (Config.HARD_DIAS_MAX, Config.DIAS_MAXIMOS, Config.HORA_INICIO)
+        # Começando às 23:50 a rota vira o dia e passa do limite de 1 dia
+        Config.HARD_DIAS_MAX, Config.DIAS_MAXIMOS, Config.HORA_INICIO = True, 1, 23 * 60 + 50
+        try:
+            lote = self._avaliar(workers=1, motor='lote')
+            individual = self._avaliar(workers=1)
+        finally:
+            Config.HARD_DIAS_MAX, Config.DIAS_MAXIMOS, Config.HORA_INICIO = originais
+        self.assertFalse(any(m['viabilidade'] for m in individual))
+        self.assertEqual(lote, individual)
+
+    def test_memoria_fitness_reaproveita_rotas_repetidas(self):
+        """Cópias da mesma rota não devem ser simuladas de novo"""
+        random.seed(10)
+        populacao = Populacao(self.coordenadas, Drone(), GerenciadorVento(), 4)
+        populacao.avaliar_populacao()
+        esperado = populacao.individuos[0].exportar_metricas()
+
+        # Próxima geração: duas cópias de uma rota já avaliada + uma nova
+        populacao.individuos = [populacao.individuos[0].clonar(),
+                                populacao.individuos[0].clonar(),
+                                populacao.individuo_de_genoma(populacao.individuos[1].genoma[::-1])]
+        populacao.avaliar_populacao()
+
+        stats = populacao.get_estatisticas()
+        self.assertEqual(stats['memo_acertos'], 2)
+        self.assertEqual(stats['simulacoes'], 1)
+        self.assertEqual(populacao.individuos[1].exportar_metricas(), esperado)
+
+
+if __name__ == '__main__':
+    unittest.main()
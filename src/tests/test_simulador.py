@@ -0,0 +1,119 @@
+import unittest
+import sys
+import os
+import io
+import tempfile
+import random
+from contextlib import redirect_stdout
+import numpy as np
+
+# Adicionar o diretório raiz do projeto ao Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.models.individuo import Individuo
+from src.models.drone import Drone
+from src.models.vento import GerenciadorVento
+from src.models.coordenada import Coordenada
+from src.simulation.simulador import Simulador
+from src.simulation.csv_exporter import CSVExporter
+from src.config.settings import Config
+
+
+class TestSimulador(unittest.TestCase):
+    def setUp(self):
+        self.drone = Drone()
+        self.vento = GerenciadorVento()
+        unibrasil = Coordenada(Config.CEP_INICIAL, 0.0, 0.0)
+        pontos = [Coordenada(f'{i:08d}', 0.05 * i, 0.1 * (i % 3)) for i in range(1, 8)]
+        self.individuo = Individuo([unibrasil] + pontos + [unibrasil], self.drone, self.vento)
+        self.individuo.simular_rota()
+        self.individuo.calcular_fitness()
+
+    def test_arquivo_gravado_durante_simulacao_igual_a_salvar_log(self):
+        """O log gravado em streaming deve ser idêntico ao de salvar_log, sem
+        guardar as linhas em memória"""
+        with tempfile.TemporaryDirectory() as pasta:
+            streaming = os.path.join(pasta, 'streaming.txt')
+            copia = os.path.join(pasta, 'copia.txt')
+            ao_final = os.path.join(pasta, 'final.txt')
+            with redirect_stdout(io.StringIO()):
+                em_arquivo = Simulador(self.drone, self.vento, arquivo_log=streaming,
+                                       console=False)
+                self.assertEqual(em_arquivo.simular_trajetoria(self.individuo), [])
+                em_arquivo.salvar_log(streaming)
+                em_arquivo.salvar_log(copia)
+                simulador = Simulador(self.drone, self.vento)
+                simulador.simular_trajetoria(self.individuo)
+                simulador.salvar_log(ao_final)
+
+            with open(ao_final, 'rb') as f:
+                esperado = f.read()
+            for arquivo in (streaming, copia):
+                with open(arquivo, 'rb') as f:
+                    self.assertEqual(f.read(), esperado)
+
+    def test_niveis_e_console_desligado(self):
+        """Níveis menores omitem trechos/dias; console=False não imprime nada"""
+        saida = io.StringIO()
+        with redirect_stdout(saida):
+            completo = Simulador(self.drone, self.vento, console=False).simular_trajetoria(
+                self.individuo)
+            dias = Simulador(self.drone, self.vento, Simulador.NIVEL_DIAS,
+                             console=False).simular_trajetoria(self.individuo)
+            resumo = Simulador(self.drone, self.vento, Simulador.NIVEL_RESUMO,
+                               console=False).simular_trajetoria(self.individuo)
+
+        self.assertEqual(saida.getvalue(), '')
+        self.assertEqual(dias, [linha for linha in completo
+                                if 'Trecho' not in linha and 'Fotografando' not in linha])
+        self.assertEqual(resumo, [linha for linha in dias
+                                  if not linha.startswith(('📅', '⚡'))])
+        self.assertEqual(len(resumo), 8)
+
+    def test_recargas_do_plano_de_voo_aparecem_no_log(self):
+        """Recargas antecipadas de um plano de voo (sem falta de bateria) são
+        reproduzidas no log, que tem uma linha de RECARGA por pouso"""
+        unibrasil = Coordenada(Config.CEP_INICIAL, 0.0, 0.0)
+        rng = random.Random(4)
+        pontos = [Coordenada(f'{i:08d}', rng.uniform(-0.3, 0.3), rng.uniform(-0.3, 0.3))
+                  for i in range(1, 40)]
+        guloso = Individuo([unibrasil] + pontos + [unibrasil], self.drone, self.vento)
+        guloso.simular_rota()
+
+        indices = [self.drone.get_velocidades_validas().index(t.velocidade)
+                   for t in guloso.trechos]
+        recargas = np.zeros(len(indices), dtype=bool)
+        recargas[5::6] = True
+        planejado = Individuo.de_genoma(guloso.genoma, self.drone, self.vento, guloso.geometria)
+        planejado.plano_voo = (np.array(indices, dtype=np.int8), recargas)
+        planejado.simular_rota()
+        planejado.calcular_fitness()
+        self.assertGreater(planejado.numero_pousos, guloso.numero_pousos)
+
+        log = Simulador(self.drone, self.vento, console=False).simular_trajetoria(planejado)
+        self.assertEqual(sum('RECARGA' in linha for linha in log), planejado.numero_pousos)
+        # Depois de cada recarga o trecho parte com a bateria cheia
+        cheia = f"Bateria: {self.drone.calcular_autonomia(36) / 60:.1f}min"
+        for anterior, linha in zip(log, log[1:]):
+            if 'RECARGA' in anterior:
+                self.assertIn(cheia, linha)
+
+
+class TestCSVExporter(unittest.TestCase):
+
+    def test_busca_de_recarga_por_dia_e_cep(self):
+        """Busca binária no índice equivale à varredura com tolerância de ±3 min"""
+        recargas = [(1, 600, 'A', False), (1, 700, 'A', True), (2, 600, 'A', False),
+                    (1, 650, 'B', False)]
+        indice = CSVExporter._indexar_por_dia_cep(recargas)
+        for dia in (1, 2):
+            for cep in ('A', 'B', 'C'):
+                for hora in range(590, 712):
+                    esperado = any(r_cep == cep and r_dia == dia and abs(r_hora - hora) <= 3
+                                   for r_dia, r_hora, r_cep, _ in recargas)
+                    self.assertEqual(
+                        CSVExporter._tem_registro_proximo(indice, dia, cep, hora, 3), esperado)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,10 @@ import os
 # Adicionar o diretório raiz do projeto ao Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
+import numpy as np
+
 from src.models.vento import GerenciadorVento
+from src.utils.calculos import cardinal_para_angulo, componentes_vento
 
 class TestVento(unittest.TestCase):
     
@@ -41,6 +44,30 @@ class TestVento(unittest.TestCase):
         self.assertEqual(self.vento._hora_para_faixa(16 * 60), '15h')  # 16:00 -> 15h
         self.assertEqual(self.vento._hora_para_faixa(19 * 60), '18h')  # 19:00 -> 18h
         self.assertEqual(self.vento._hora_para_faixa(22 * 60), '21h')  # 22:00 -> 21h
+    def test_tabela_densa_igual_ao_dicionario(self):
+        """Componentes da tabela devem ser as mesmas calculadas a partir de get_vento"""
+        dias = []
+        minutos = []
+        for dia in range(0, 10):
+            for minuto in range(0, 24 * 60, 7):
+                vento = self.vento.get_vento(dia, minuto)
+                angulo = (cardinal_para_angulo(vento['direcao']) + 180.0) % 360.0
+                esperado = componentes_vento(vento['velocidade'], angulo)
+                self.assertEqual(self.vento.get_componentes(dia, minuto), esperado)
+                self.assertEqual(self.vento.FAIXAS[self.vento.indice_faixa(minuto)],
+                                 self.vento._hora_para_faixa(minuto))
+                dias.append(dia)
+                minutos.append(minuto)
+
+        vento_x, vento_y = self.vento.get_vento_array(np.array(dias), np.array(minutos))
+        for k, (dia, minuto) in enumerate(zip(dias, minutos)):
+            self.assertEqual((vento_x[k], vento_y[k]), self.vento.get_componentes(dia, minuto))
+
+    def test_constante(self):
+        """Gerenciador constante devolve o mesmo vento em qualquer dia/faixa"""
+        vento = GerenciadorVento.constante(12, 'NE')
+        self.assertEqual(vento.get_vento(3, 20 * 60), {'velocidade': 12, 'direcao': 'NE'})
+        self.assertEqual(vento.get_componentes(1, 0), vento.get_componentes(7, 23 * 60))
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,81 @@
+from collections import OrderedDict
+
+
+class CacheLRU:
+    """
+    Cache limitado por memória com descarte do item usado há mais tempo (LRU).
+
+    Cada item é guardado junto com seu tamanho estimado em bytes; quando o
+    total ultrapassa max_bytes, os itens menos recentemente usados são
+    descartados. Contadores de acertos/faltas permitem medir o efeito do
+    cache no resumo da execução.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._itens = OrderedDict()  # chave -> (valor, tamanho_bytes)
+        self.bytes_usados = 0
+        self.acertos = 0
+        self.faltas = 0
+        self.descartes = 0
+
+    def obter(self, chave):
+        """Retorna o valor da chave (ou None) e atualiza os contadores"""
+        item = self._itens.get(chave)
+        if item is None:
+            self.faltas += 1
+            return None
+
+        self._itens.move_to_end(chave)
+        self.acertos += 1
+        return item[0]
+
+    def guardar(self, chave, valor, tamanho_bytes):
+        """Guarda valor, descartando itens antigos se o limite for excedido"""
+        anterior = self._itens.pop(chave, None)
+        if anterior is not None:
+            self.bytes_usados -= anterior[1]
+
+        # Item maior que o próprio limite nunca é guardado
+        if tamanho_bytes > self.max_bytes:
+            return
+
+        self._itens[chave] = (valor, tamanho_bytes)
+        self.bytes_usados += tamanho_bytes
+
+        while self.bytes_usados > self.max_bytes:
+            _, (_, tamanho) = self._itens.popitem(last=False)
+            self.bytes_usados -= tamanho
+            self.descartes += 1
+
+    def itens(self):
+        """Pares (chave, valor), do usado há mais tempo ao mais recente (sem
+        alterar a ordem nem os contadores)"""
+        return [(chave, valor) for chave, (valor, _) in self._itens.items()]
+
+    def limpar(self):
+        """Remove todos os itens (contadores são mantidos)"""
+        self._itens.clear()
+        self.bytes_usados = 0
+
+    def get_estatisticas(self):
+        """Retorna contadores de uso do cache"""
+        consultas = self.acertos + self.faltas
+        return {
+            'acertos': self.acertos,
+            'faltas': self.faltas,
+            'taxa_acerto': (self.acertos / consultas * 100) if consultas else 0.0,
+            'entradas': len(self._itens),
+            'bytes_usados': self.bytes_usados,
+            'descartes': self.descartes
+        }
+
+    def __len__(self):
+        return len(self._itens)
+
+    def __contains__(self, chave):
+        return chave in self._itens
+
+    def __repr__(self):
+        return (f"CacheLRU({len(self._itens)} itens, "
+                f"{self.bytes_usados}/{self.max_bytes} bytes)")
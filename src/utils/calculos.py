@@ -71,18 +71,31 @@ def calcular_velocidade_efetiva(velocidade_drone, direcao_voo, vento_velocidade,
     # Aqui assumimos que 'vento_direcao' já representa a direção PARA ONDE o vento aponta
     # (tipo vetor). Se o seu gerenciador de vento fornece a direção de ONDE o vento vem,
     # converta adicionando 180° antes de chamar esta função.
-    angulo_vento_rad = math.radians(vento_direcao)
 
     # Componentes do vento (vetor apontando para a direção fornecida)
-    v_vento_x = vento_velocidade * math.sin(angulo_vento_rad)
-    v_vento_y = vento_velocidade * math.cos(angulo_vento_rad)
+    v_vento_x, v_vento_y = componentes_vento(vento_velocidade, vento_direcao)
 
     # Projeção do vento ao longo da direção do voo (produto escalar)
     # unitário da direção do voo é (sin(angulo_voo), cos(angulo_voo))
     v_vento_proj = v_vento_x * math.sin(angulo_voo_rad) + v_vento_y * math.cos(angulo_voo_rad)
 
-    # Velocidade efetiva ao longo do trajeto = velocidade do drone (no ar) +
-    # componente do vento na direção do voo.
+    return aplicar_projecao_vento(velocidade_drone, v_vento_proj)
+
+def componentes_vento(vento_velocidade, vento_direcao):
+    """
+    Retorna as componentes (x = Leste, y = Norte) do vetor do vento em km/h.
+    vento_direcao é o ângulo em graus PARA ONDE o vento aponta.
+    """
+    angulo_vento_rad = math.radians(vento_direcao)
+    return (vento_velocidade * math.sin(angulo_vento_rad),
+            vento_velocidade * math.cos(angulo_vento_rad))
+
+def aplicar_projecao_vento(velocidade_drone, v_vento_proj):
+    """
+    Soma à velocidade do drone (no ar) a componente do vento na direção do voo.
+    Usada quando a projeção já foi obtida a partir de um vetor unitário
+    pré-calculado (ver MatrizGeometria).
+    """
     v_efetiva = velocidade_drone + v_vento_proj
 
     # Proteção: não permitir velocidade efetiva não-positiva (evita divisão por zero)
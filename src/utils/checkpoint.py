@@ -0,0 +1,66 @@
+"""Gravação/leitura de checkpoints binários (.npz) com escrita atômica"""
+import io
+import json
+import os
+import tempfile
+
+import numpy as np
+
+# Versão do formato; checkpoints de outra versão não são carregados
+VERSAO_CHECKPOINT = 2
+
+
+def estado_rng_para_array(estado):
+    """Converte random.getstate() em array int64 (versão, 625 palavras, gauss)"""
+    versao, palavras, gauss_seguinte = estado
+    return (np.array([versao] + list(palavras), dtype=np.int64),
+            np.array([np.nan if gauss_seguinte is None else gauss_seguinte]))
+
+
+def array_para_estado_rng(palavras, gauss):
+    """Inverso de estado_rng_para_array (estado aceito por random.setstate)"""
+    valores = palavras.tolist()
+    gauss_seguinte = gauss.item(0)
+    return (valores[0], tuple(valores[1:]), None if np.isnan(gauss_seguinte) else gauss_seguinte)
+
+
+def gravar_checkpoint(caminho, arrays, metadados):
+    """
+    Grava arrays NumPy e metadados (dict serializável em JSON) em um .npz.
+
+    A escrita vai para um arquivo temporário na mesma pasta e só então
+    substitui o checkpoint anterior (os.replace), então uma interrupção no
+    meio da gravação nunca deixa um checkpoint corrompido.
+    """
+    pasta = os.path.dirname(caminho) or '.'
+    os.makedirs(pasta, exist_ok=True)
+
+    conteudo = dict(arrays)
+    metadados = dict(metadados, versao=VERSAO_CHECKPOINT)
+    conteudo['metadados'] = np.frombuffer(json.dumps(metadados).encode('utf-8'), dtype=np.uint8)
+
+    descritor, temporario = tempfile.mkstemp(dir=pasta, prefix='.checkpoint_', suffix='.tmp')
+    try:
+        with os.fdopen(descritor, 'wb') as f:
+            np.savez(f, **conteudo)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, caminho)
+    except BaseException:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
+
+
+def ler_checkpoint(caminho):
+    """Lê um checkpoint gravado por gravar_checkpoint: retorna (arrays, metadados)"""
+    with open(caminho, 'rb') as f:
+        dados = np.load(io.BytesIO(f.read()))
+        arrays = {nome: dados[nome] for nome in dados.files if nome != 'metadados'}
+        metadados = json.loads(dados['metadados'].tobytes().decode('utf-8'))
+
+    if metadados.get('versao') != VERSAO_CHECKPOINT:
+        raise ValueError(f"Checkpoint {caminho} em formato incompatível "
+                         f"(versão {metadados.get('versao')})")
+    return arrays, metadados
+